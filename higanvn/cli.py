@@ -102,6 +102,8 @@ def main(argv: List[str] | None = None) -> int:
                 renderer.set_get_save_dir(lambda: engine.get_save_dir())
                 # back/rewind one visible line
                 renderer.set_back_hook(lambda: engine.back_one_line())
+                # drain finished background saves while waiting for input
+                renderer.set_save_status_hook(lambda: engine.poll_save_status())
             except Exception:
                 pass
         else:
@@ -137,7 +139,11 @@ def main(argv: List[str] | None = None) -> int:
         except Exception:
             pass
         # For MVP in headless mode, just iterate and print
-        engine.run_headless()
+        try:
+            engine.run_headless()
+        finally:
+            # make sure queued save writes reach disk before exiting
+            engine.close()
         return 0
 
     if args.cmd == "pack":
@@ -1,9 +1,138 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
 from typing import Callable, Optional
+import gzip
 import json
+import os
+import threading
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+_GZIP_MAGIC = b"\x1f\x8b"
+# saves are written compact; set HIGANVN_PRETTY_SAVES=1 to indent them for hand inspection
+PRETTY_SAVES = os.environ.get("HIGANVN_PRETTY_SAVES", "").strip() not in ("", "0")
+
+
+def _dumps(payload: dict, pretty: bool) -> bytes:
+    if HAS_ORJSON:
+        # non-str keys are stringified like json.dumps does
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        try:
+            return orjson.dumps(payload, option=option)
+        except TypeError:
+            # values orjson rejects (e.g. ints beyond 64 bits) go through stdlib json
+            pass
+    if pretty:
+        return json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict:
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # stdlib json also accepts NaN/Infinity written by older saves
+            pass
+    # json.loads takes the UTF-8 bytes as they are
+    return json.loads(data)
+
+
+def encode_payload(payload: dict, compress: bool = False, pretty: Optional[bool] = None) -> bytes:
+    """Serialize a save payload to UTF-8 JSON bytes, optionally gzip-compressed.
+
+    Uses orjson when installed, stdlib json otherwise; the output is JSON either way.
+    pretty=None follows PRETTY_SAVES.
+    """
+    data = _dumps(payload, PRETTY_SAVES if pretty is None else bool(pretty))
+    if compress:
+        # level 1: nearly all of the size win for JSON at a fraction of the CPU
+        return gzip.compress(data, compresslevel=1)
+    return data
+
+
+def decode_payload(data: bytes) -> dict:
+    """Inverse of encode_payload; plain (legacy) and gzip payloads are both accepted."""
+    if data[:2] == _GZIP_MAGIC:
+        data = gzip.decompress(data)
+    return _loads(data)
+
+
+def atomic_write_bytes(path: Path, data: bytes, sync: bool = True) -> None:
+    """Write data to path via a sibling temp file + os.replace.
+
+    The temp file's data is always fsynced before the rename, so after a crash path
+    holds either the old or the new contents, never an empty or torn file (some
+    filesystems do not flush data ahead of a replacing rename on their own).
+    sync=True also fsyncs the directory so the rename itself is durable; with
+    sync=False the caller batches that later (see fsync_dirs), and a crash before then
+    may still show the previous save.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            view = memoryview(data)
+            while view:
+                n = os.write(fd, view)
+                view = view[n:]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    if sync:
+        fsync_dirs((path,))
+
+
+def fsync_dirs(paths) -> None:
+    """fsync, where supported, the directories holding paths so renames into them persist."""
+    if os.name != "posix":
+        # directory handles cannot be fsynced on Windows
+        return
+    for d in {Path(p).parent for p in paths}:
+        try:
+            fd = os.open(d, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def format_save_ts(ts) -> Optional[str]:
+    """Render a payload "ts" for display: epoch seconds (current saves) or an ISO string (older saves)."""
+    if isinstance(ts, (int, float)) and not isinstance(ts, bool):
+        try:
+            return datetime.fromtimestamp(ts).isoformat(timespec="seconds")
+        except (OverflowError, OSError, ValueError):
+            return str(ts)
+    return ts
+
+
+def read_payload(path: Path) -> Optional[dict]:
+    """Read a save file written by any FileSaveStore configuration; None if missing."""
+    # one open instead of exists() + read: a missing file is just a failed open
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return decode_payload(data)
 
 
 class ISaveStore(ABC):
@@ -35,6 +164,10 @@ class ISaveStore(ABC):
     def delete_slot(self, slot: int) -> bool:  # pragma: no cover - interface
         return False
 
+    def sync(self) -> None:  # pragma: no cover - interface
+        """Make writes that were deferred for durability persistent (no-op by default)."""
+        return None
+
 
 class FileSaveStore(ISaveStore):
     """Filesystem-based save store compatible with current save file layout.
@@ -42,10 +175,24 @@ class FileSaveStore(ISaveStore):
     Files:
     - quick.json
     - slot_XX.json
+
+    With compress=True the JSON body is gzip-compressed; reads sniff the gzip
+    header so plain and compressed files can coexist in one save directory.
+
+    With lazy_quick_sync=True the directory fsync that makes a quick save's
+    rename durable is deferred to sync(), so frequent quick saves share it; the
+    file data itself is still flushed before every rename. Slot saves are
+    always fully synced on write.
     """
 
-    def __init__(self, get_base_dir: Callable[[], Path]) -> None:
+    def __init__(self, get_base_dir: Callable[[], Path], compress: bool = False,
+                 lazy_quick_sync: bool = False) -> None:
         self._get_base = get_base_dir
+        self._compress = bool(compress)
+        self._lazy_quick_sync = bool(lazy_quick_sync)
+        # files renamed into place whose directory has not been fsynced since the last sync()
+        self._dirty: set[Path] = set()
+        self._dirty_lock = threading.Lock()
 
     def _ensure_dir(self) -> Path:
         base = self._get_base()
@@ -66,24 +213,25 @@ class FileSaveStore(ISaveStore):
     def write_quick(self, payload: dict) -> bool:
         try:
             p = self._quick_path()
-            p.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            lazy = self._lazy_quick_sync
+            atomic_write_bytes(p, encode_payload(payload, self._compress), sync=not lazy)
+            if lazy:
+                with self._dirty_lock:
+                    self._dirty.add(p)
             return True
         except Exception:
             return False
 
     def read_quick(self) -> Optional[dict]:
         try:
-            p = self._quick_path()
-            if not p.exists():
-                return None
-            return json.loads(p.read_text(encoding="utf-8"))
+            return read_payload(self._quick_path())
         except Exception:
             return None
 
     def write_slot(self, slot: int, payload: dict) -> bool:
         try:
             p = self._slot_path(int(slot))
-            p.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+            atomic_write_bytes(p, encode_payload(payload, self._compress))
             try:
                 # invalidate meta cache for this slot if present
                 from ..save_io import invalidate_slot_cache
@@ -96,13 +244,16 @@ class FileSaveStore(ISaveStore):
 
     def read_slot(self, slot: int) -> Optional[dict]:
         try:
-            p = self._slot_path(int(slot))
-            if not p.exists():
-                return None
-            return json.loads(p.read_text(encoding="utf-8"))
+            return read_payload(self._slot_path(int(slot)))
         except Exception:
             return None
 
+    def sync(self) -> None:
+        with self._dirty_lock:
+            dirty, self._dirty = self._dirty, set()
+        if dirty:
+            fsync_dirs(dirty)
+
     # --- extended helpers ---
     def list_slots(self) -> list[int]:
         base = self._ensure_dir()
@@ -1,4 +1,5 @@
-from typing import Dict, Optional, Tuple, Callable, List
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Callable, List
 
 import pygame
 from pygame import Surface
@@ -251,11 +252,12 @@ class CharacterLayer:
                 except Exception:
                     pass
 
-    def last_rects(self) -> Dict[str, pygame.Rect]:
-        return dict(self._last_rects)
+    def last_rects(self) -> Mapping[str, pygame.Rect]:
+        # read-only view refreshed by render(); dict() it to keep a snapshot
+        return MappingProxyType(self._last_rects)
 
-    def last_centers(self) -> Dict[str, Tuple[int, int]]:
-        return dict(self._last_centers)
+    def last_centers(self) -> Mapping[str, Tuple[int, int]]:
+        return MappingProxyType(self._last_centers)
 
     def snapshot_characters(self) -> List[dict]:
         data: List[dict] = []
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional, Dict, Any, Tuple
+from typing import Iterable, List, Optional, Dict, Any, Tuple, Deque
 
 from .renderer import IRenderer, DummyRenderer
-from .adapters.storage import ISaveStore, FileSaveStore
+from .adapters.storage import ISaveStore, FileSaveStore, atomic_write_bytes, encode_payload, read_payload
 from .events import (
     EventSystem, LegacyEventBridge,
     EngineLoadEvent, EngineStepEvent, TextShowEvent, CommandEvent,
@@ -15,7 +15,6 @@ from ..script.model import Op, Program
 from pathlib import Path
 import json
 from ..script.errors import ScriptError
-from datetime import datetime
 import os
 from ..ui.textbox import Textbox
 from .expr import safe_eval
@@ -23,9 +22,143 @@ import time
 from .sandbox import safe_exec
 import re
 import hashlib
+import mmap
+import sys
+from array import array
+from collections import deque
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 
 
- 
+# {var} placeholders in narration/dialogue text
+_INTERP_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+@lru_cache(maxsize=1024)
+def _compile_template(txt: str):
+    """Compile text with {var} placeholders into render(vars) -> str; None if it has none.
+
+    Unknown names render as the original placeholder, same as Engine._interp.
+    """
+    pieces = _INTERP_RE.split(txt)
+    if len(pieces) == 1:
+        return None
+    head = pieces[0]
+    # (name, placeholder, literal that follows)
+    tail = tuple((pieces[i], "{" + pieces[i] + "}", pieces[i + 1]) for i in range(1, len(pieces), 2))
+
+    def render(vars_: Dict[str, Any]) -> str:
+        out = [head]
+        for name, ph, lit in tail:
+            out.append(str(vars_.get(name, ph)))
+            out.append(lit)
+        return "".join(out)
+    return render
+
+
+# characters not friendly for filesystem names
+_SANITIZE_TRANS = str.maketrans({ch: "_" for ch in '<>:"/\\|?*'})
+
+
+def _parse_title_args(args: str) -> Tuple[Optional[str], Optional[str]]:
+    """Split TITLE arguments into (title, bg_path); the title may be quoted with "", “” or 「」."""
+    raw = args.strip()
+    title = None
+    bgp = None
+    try:
+        if raw.startswith('"') and '"' in raw[1:]:
+            i = raw.find('"', 1)
+            j = raw.rfind('"')
+            if j > 0 and j > i:
+                title = raw[1:j]
+                rest = raw[j+1:].strip()
+            else:
+                title = raw.strip('"')
+                rest = ''
+        elif (raw.startswith('“') and '”' in raw) or (raw.startswith('「') and '」' in raw):
+            if raw.startswith('“'):
+                close = raw.rfind('”')
+                title = raw[1:close] if close > 0 else raw.strip('“”')
+                rest = raw[close+1:].strip() if close > 0 else ''
+            else:
+                close = raw.rfind('」')
+                title = raw[1:close] if close > 0 else raw.strip('「」')
+                rest = raw[close+1:].strip() if close > 0 else ''
+        else:
+            rest = raw
+        parts2 = rest.split()
+        if parts2:
+            bgp = parts2[0]
+    except Exception:
+        pass
+    return title, bgp
+
+
+def _file_sha256(path: Path) -> str:
+    """SHA-256 hex digest of a file, hashed from a read-only mmap without a bytes copy.
+
+    The whole mapping goes to the OpenSSL-backed hashlib object in one call; chunked
+    update() loops (as hashlib.file_digest does) pay the per-call entry cost per block.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b"").hexdigest()
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+
+def _read_script_source(path: Path) -> str:
+    """Decode a script straight from a read-only mapping of the file (no intermediate bytes copy)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # parse_script splits with splitlines(), so \r\n needs no newline translation here
+            return str(mm, "utf-8")
+
+
+def _optional_method(obj: Any, name: str):
+    """Bound method obj.<name> if present and callable, else None."""
+    fn = getattr(obj, name, None)
+    return fn if callable(fn) else None
+
+
+# interactive lines that back_one_line can restore without replaying
+_LINE_CHECKPOINTS = 32
+
+
+# seconds between group fsyncs of lazily-synced quick saves
+_STORE_SYNC_INTERVAL = 1.0
+
+
+# command flag bits: conditional-chain and switch commands keep their state alive
+_F_COND = 1 << 0
+_F_SWITCH = 1 << 1
+_CMD_FLAGS = {
+    "IF": _F_COND, "ELSEIF": _F_COND, "ELSE": _F_COND,
+    "SWITCH": _F_SWITCH, "CASE": _F_SWITCH, "DEFAULT": _F_SWITCH, "ENDSWITCH": _F_SWITCH,
+}
+
+# commands whose args split once into (lhs, rhs) around a separator
+_SPLIT_SEPS = {"SET": "=", "IF": "->", "ELSEIF": "->", "CASE": "->"}
+
+
+def _int_trace(values: Iterable[Any] = ()) -> array:
+    """Packed int32 trace (choice indices / op indices); invalid entries become 0."""
+    out = array('i')
+    for v in values:
+        try:
+            out.append(int(v))
+        except Exception:
+            out.append(0)
+    return out
+
+
+@lru_cache(maxsize=16)
+def _sanitize_folder_name(name: str) -> str:
+    out = name.translate(_SANITIZE_TRANS).strip().strip('.')
+    return out or 'Game'
 
 
 class Engine:
@@ -59,22 +192,42 @@ class Engine:
         self.interactive = interactive
         self.strict = strict
         self.script_path = None
+        # metadata / save dir resolved once per script_path
+        self._meta_cache: Optional[dict] = None
+        self._meta_cache_key = None
+        self._save_dir_cache: Optional[Path] = None
+        self._save_dir_cache_key = None
+        # ((path, mtime_ns, size), sha256) of the last hashed script
+        self._script_hash_cache: Optional[Tuple[Tuple[str, int, int], str]] = None
+        self._program_source: Optional[Tuple[str, Optional[str]]] = None
         # New typed event system
         self._event_system = EventSystem(debug=False)
         # Legacy event bus (backward compatibility wrapper)
         self.events = LegacyEventBridge(self._event_system)
-        # record of choices taken so far (indices in each choice block)
-        self.choice_trace = []
-        # choices to replay on load (set temporarily during reconstruction)
+        # record of choices taken so far (indices in each choice block), packed int32
+        self.choice_trace = array('i')
+        # choices to replay on load (set temporarily during reconstruction), read
+        # in place from _replay_index on instead of being copied and consumed
         self._replay_choices = None
-        # record of op indices that produced visible text (for back/rewind)
-        self.line_ip_trace = []
+        self._replay_index = 0
+        # record of op indices that produced visible text (for back/rewind), packed int32
+        self.line_ip_trace = array('i')
+        # state captured just before each recent interactive line, so back_one_line can
+        # restore from a renderer snapshot instead of replaying from the start
+        self._line_checkpoints: Deque[tuple] = deque(maxlen=_LINE_CHECKPOINTS)
         # return addresses for CALL/RETURN
         self.call_stack = []
         # shared textbox model
         self.textbox = Textbox()
         # inject textbox and hooks into renderer if supported
         self._install_renderer_hooks()
+        # optional snapshot/replay methods, bound once for the save/load paths (None if absent)
+        self._bind_renderer_methods()
+        # publish VM state to the renderer each step only when something reads it
+        self._debug_enabled = self._renderer_wants_debug()
+        # bumped on SET/SCRIPT so the debug vars snapshot is rebuilt only on change
+        self._vars_version = 0
+        self._vars_snapshot_key = None
         # propagate strictness to renderer so it can disable asset fallbacks
         try:
             if hasattr(self.renderer, "set_strict_mode") and callable(getattr(self.renderer, "set_strict_mode")):
@@ -92,9 +245,137 @@ class Engine:
         self._switch_matched = False
         # pluggable save store (defaults to file-based under Documents/HiganVN/<game>)
         try:
-            self._save_store = save_store or FileSaveStore(lambda: self.get_save_dir())
+            self._save_store = save_store or FileSaveStore(lambda: self.get_save_dir(), compress=True,
+                                                           lazy_quick_sync=True)
         except Exception:
             self._save_store = None
+        # store writes run on a single background worker (FIFO, so saves land in order);
+        # payloads still pending are served from memory so reads never see stale data
+        self._save_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="higanvn-save")
+        self._pending_saves: Dict[Optional[int], Tuple[Future, dict]] = {}
+        self._pending_lock = threading.Lock()
+        # deferred store fsyncs are group-committed at most once per interval
+        self._sync_timer: Optional[threading.Timer] = None
+        # (slot, success) of finished background writes; drained on the engine thread so
+        # SaveCompleteEvent listeners never run on the writer thread
+        self._save_status: Deque[Tuple[int, bool]] = deque()
+
+    # --- background save writes ---
+    def _submit_save(self, slot: Optional[int], payload: dict) -> bool:
+        """Queue a store write; slot None is the quicksave. Returns False if it could not be queued.
+
+        True only means the write was queued: its outcome arrives as a SaveCompleteEvent from
+        poll_save_status(), which renderers call via set_save_status_hook while idle.
+        """
+        store = self._save_store
+        if slot is None:
+            fut = self._save_executor.submit(store.write_quick, payload)
+        else:
+            fut = self._save_executor.submit(store.write_slot, int(slot), payload)
+        with self._pending_lock:
+            self._pending_saves[slot] = (fut, payload)
+
+        def _done(f: Future, key: Optional[int] = slot) -> None:
+            with self._pending_lock:
+                cur = self._pending_saves.get(key)
+                if cur is not None and cur[0] is f:
+                    del self._pending_saves[key]
+            try:
+                ok = bool(f.result())
+            except Exception:
+                ok = False
+            self._save_status.append((0 if key is None else int(key), ok))
+        fut.add_done_callback(_done)
+        if slot is None:
+            self._schedule_store_sync()
+        return True
+
+    def _schedule_store_sync(self) -> None:
+        with self._pending_lock:
+            if self._sync_timer is not None:
+                return
+            t = threading.Timer(_STORE_SYNC_INTERVAL, self._queue_store_sync)
+            t.daemon = True
+            self._sync_timer = t
+        t.start()
+
+    def _queue_store_sync(self) -> None:
+        with self._pending_lock:
+            self._sync_timer = None
+        try:
+            # on the writer thread, so it runs after the writes it covers
+            self._save_executor.submit(self._sync_store)
+        except RuntimeError:
+            # writer already shut down; close() synced
+            pass
+
+    def _sync_store(self) -> None:
+        sync = getattr(self._save_store, "sync", None)
+        if callable(sync):
+            try:
+                sync()
+            except Exception:
+                pass
+
+    def poll_save_status(self) -> None:
+        """Emit SaveCompleteEvent for background writes that finished since the last poll."""
+        status = self._save_status
+        while status:
+            slot, ok = status.popleft()
+            try:
+                self._event_system.emit(SaveCompleteEvent(slot=slot, success=ok))
+            except Exception:
+                pass
+
+    def _pending_payload(self, slot: Optional[int]) -> Optional[dict]:
+        with self._pending_lock:
+            cur = self._pending_saves.get(slot)
+        return cur[1] if cur is not None else None
+
+    def _wait_saves(self) -> bool:
+        with self._pending_lock:
+            futures = [f for f, _ in self._pending_saves.values()]
+        ok = True
+        for f in futures:
+            try:
+                ok = bool(f.result()) and ok
+            except Exception:
+                ok = False
+        return ok
+
+    def flush_saves(self) -> bool:
+        """Block until queued save writes finish and are synced to disk. Returns False if any write failed."""
+        ok = self._wait_saves()
+        self._sync_store()
+        self.poll_save_status()
+        return ok
+
+    def _list_slots(self) -> List[int]:
+        self._wait_saves()
+        return list(self._save_store.list_slots())
+
+    def _delete_slot(self, slot: int) -> bool:
+        self._wait_saves()
+        return bool(self._save_store.delete_slot(int(slot)))
+
+    def close(self) -> None:
+        """Finish pending save writes and stop the background writer."""
+        with self._pending_lock:
+            t, self._sync_timer = self._sync_timer, None
+        if t is not None:
+            t.cancel()
+        self.flush_saves()
+        self._save_executor.shutdown(wait=True)
+        # the worker has exited, so every completion callback has reported
+        self.poll_save_status()
+
+    def mark_vars_changed(self) -> None:
+        """Tell the engine that ``vars`` was modified outside SET/SCRIPT/restore.
+
+        Hooks, plugins and tests that write into ``engine.vars`` directly should call this
+        so the debug HUD's variable snapshot is rebuilt on the next step.
+        """
+        self._vars_version += 1
 
     @property
     def event_system(self) -> EventSystem:
@@ -103,31 +384,82 @@ class Engine:
 
     def load(self, program: Program) -> None:
         self.program = program
+        # (script path, content hash) this program was parsed from, so save loads can reuse it
+        self._program_source = (str(self.script_path), self._script_sha256()) if self.script_path else None
+        self._prepare_program(program)
+        self._reset_run_state()
+        # provide program to renderer for flow map
+        try:
+            if hasattr(self.renderer, "set_program"):
+                self.renderer.set_program(program)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        # notify listeners (typed event)
+        try:
+            self._event_system.emit(EngineLoadEvent(op_count=len(program.ops) if program else 0))
+        except Exception:
+            pass
+
+    def _reset_run_state(self) -> None:
         self.ip = 0
         # reset choice history when loading a program
-        self.choice_trace = []
+        self.choice_trace = array('i')
         # reset line trace on program load
-        self.line_ip_trace = []
+        self.line_ip_trace = array('i')
         # reset call stack
         self.call_stack = []
         # reset variables for new program
         self.vars = {}
+        # checkpoints belong to the run that recorded them
+        self._line_checkpoints.clear()
         # clear textbox content
         try:
             self.textbox.clear()
         except Exception:
             pass
-        # provide program to renderer for flow map
-        try:
-            if hasattr(self.renderer, "set_program"):
-                self.renderer.set_program(program)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # notify listeners (typed event)
-        try:
-            self._event_system.emit(EngineLoadEvent(op_count=len(program.ops) if program else 0))
-        except Exception:
-            pass
+
+    def _prepare_program(self, program: Program) -> None:
+        """Precompute per-op data the interpreter would otherwise derive on every execution."""
+        if not program:
+            return
+        ops = program.ops
+        n = len(ops)
+        i = 0
+        while i < n:
+            if ops[i].kind != "choice":
+                i += 1
+                continue
+            # contiguous choice block [i, j): store it column-wise on each member op,
+            # as the suffix that a visit starting there would gather
+            j = i
+            while j < n and ops[j].kind == "choice":
+                j += 1
+            texts = tuple(ops[m].payload.get("text", "") for m in range(i, j))
+            targets = tuple(ops[m].payload.get("target", "") for m in range(i, j))
+            for m in range(i, j):
+                p = ops[m].payload
+                p["_choices_text"] = texts[m - i:]
+                p["_choices_target"] = targets[m - i:]
+                p["_block_end"] = j
+            i = j
+        for op in ops:
+            p = op.payload
+            if op.kind == "narration" or op.kind == "dialogue":
+                txt = p.get("text")
+                if isinstance(txt, str) and "{" in txt:
+                    p["_render"] = _compile_template(txt)
+            elif op.kind == "command" and "_name_up" not in p:
+                # interned so dispatch comparisons hit the identity fast path
+                p["_name_up"] = name_up = sys.intern(str(p.get("name") or "").upper())
+                p["_flags"] = _CMD_FLAGS.get(name_up, 0)
+                args = p.get("args") or ""
+                p["_parts"] = tuple(args.split())
+                if name_up == "TITLE":
+                    p["_title"] = _parse_title_args(args)
+                sep = _SPLIT_SEPS.get(name_up)
+                if sep is not None and sep in args:
+                    lhs, rhs = args.split(sep, 1)
+                    p["_split"] = (lhs.strip(), rhs.strip())
 
     def set_script_path(self, path: Path) -> None:
         # store absolute path to avoid issues after chdir (e.g., pygame changes CWD to assets)
@@ -135,6 +467,11 @@ class Engine:
             self.script_path = Path(path).resolve()
         except Exception:
             self.script_path = Path(path)
+        # metadata and save dir follow the script
+        self._meta_cache = None
+        self._save_dir_cache = None
+        # hash the script now rather than on the first save
+        self._script_sha256()
         # inform renderer for debug provider
         try:
             if hasattr(self.renderer, "_engine_script_path"):
@@ -142,74 +479,91 @@ class Engine:
         except Exception:
             pass
 
-    def _install_renderer_hooks(self) -> None:
-        try:
-            if hasattr(self.renderer, "set_textbox") and callable(getattr(self.renderer, "set_textbox")):
-                # engine owns the model lifecycle; renderer should not replace it
-                self.renderer.set_textbox(self.textbox, owned=False)  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_quicksave_hook"):
-                self.renderer.set_quicksave_hook(lambda: self.quicksave())  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_quickload_hook"):
-                self.renderer.set_quickload_hook(lambda: self.quickload())  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_back_hook"):
-                self.renderer.set_back_hook(lambda: self.back_one_line())  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_save_slot_hook"):
-                self.renderer.set_save_slot_hook(lambda slot: self.save_to_slot(int(slot)))  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_load_slot_hook"):
-                self.renderer.set_load_slot_hook(lambda slot: self.load_from_slot(int(slot)))  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        try:
-            if hasattr(self.renderer, "set_get_save_dir"):
-                self.renderer.set_get_save_dir(lambda: self.get_save_dir())  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # optional: list/delete hooks for slots UI
-        try:
-            if hasattr(self.renderer, "set_list_slots_hook") and self._save_store and hasattr(self._save_store, "list_slots"):
-                self.renderer.set_list_slots_hook(lambda: list(self._save_store.list_slots()))  # type: ignore[attr-defined]
-        except Exception:
-            pass
+    # renderer setter name -> builder for its positional args; optional setters are skipped
+    _HOOK_SPECS = (
+        # engine owns the model lifecycle; renderer should not replace it
+        ("set_textbox", lambda self: (self.textbox, False)),
+        ("set_quicksave_hook", lambda self: (lambda: self.quicksave(),)),
+        ("set_quickload_hook", lambda self: (lambda: self.quickload(),)),
+        ("set_back_hook", lambda self: (lambda: self.back_one_line(),)),
+        ("set_save_slot_hook", lambda self: (lambda slot: self.save_to_slot(int(slot)),)),
+        ("set_load_slot_hook", lambda self: (lambda slot: self.load_from_slot(int(slot)),)),
+        ("set_get_save_dir", lambda self: (lambda: self.get_save_dir(),)),
+        ("set_save_status_hook", lambda self: (lambda: self.poll_save_status(),)),
+        ("set_event_system", lambda self: (self._event_system,)),
+    )
+    # list/delete hooks for slots UI, installed only when the save store supports them
+    _STORE_HOOK_SPECS = (
+        ("set_list_slots_hook", "list_slots", lambda self: (lambda: self._list_slots(),)),
+        ("set_delete_slot_hook", "delete_slot", lambda self: (lambda slot: self._delete_slot(int(slot)),)),
+    )
+
+    def _bind_renderer_methods(self) -> None:
+        r = self.renderer
+        self._r_get_snapshot = _optional_method(r, "get_snapshot")
+        self._r_apply_snapshot = _optional_method(r, "apply_snapshot")
+        self._r_reset_state = _optional_method(r, "reset_state")
+        self._r_begin_fast_replay = _optional_method(r, "begin_fast_replay")
+        self._r_end_fast_replay = _optional_method(r, "end_fast_replay")
+
+    def _renderer_wants_debug(self) -> bool:
         try:
-            if hasattr(self.renderer, "set_delete_slot_hook") and self._save_store and hasattr(self._save_store, "delete_slot"):
-                self.renderer.set_delete_slot_hook(lambda slot: bool(self._save_store.delete_slot(int(slot))))  # type: ignore[attr-defined]
+            fn = getattr(self.renderer, "wants_engine_debug", None)
+            if callable(fn):
+                wants = bool(fn())
+            else:
+                wants = hasattr(self.renderer, "_engine_ip")
+            if wants:
+                # probe once that the renderer accepts the attributes, so step() can write
+                # them without a try block
+                setattr(self.renderer, "_engine_ip", int(self.ip))
+                setattr(self.renderer, "_engine_call_stack_depth", 0)
+                setattr(self.renderer, "_engine_vars_snapshot", {})
+            return wants
         except Exception:
-            pass
+            return False
+
+    def _install_renderer_hooks(self) -> None:
+        for name, build in self._HOOK_SPECS:
+            fn = getattr(self.renderer, name, None)
+            if callable(fn):
+                try:
+                    fn(*build(self))
+                except Exception:
+                    pass
+        store = getattr(self, "_save_store", None)
+        for name, store_attr, build in self._STORE_HOOK_SPECS:
+            fn = getattr(self.renderer, name, None)
+            if callable(fn) and store and hasattr(store, store_attr):
+                try:
+                    fn(*build(self))
+                except Exception:
+                    pass
 
     # --- save directory helpers ---
     def _load_metadata(self) -> dict:
         # Optional metadata file next to the script: <script>.meta.json
+        key = self.script_path
+        if self._meta_cache is not None and self._meta_cache_key == key:
+            return self._meta_cache
+        meta = self._read_metadata()
+        self._meta_cache = meta
+        self._meta_cache_key = key
+        return meta
+
+    def _read_metadata(self) -> dict:
         try:
             if not self.script_path:
                 return {}
             meta_file = Path(str(self.script_path)).with_suffix('.meta.json')
-            if meta_file.exists():
-                return json.loads(meta_file.read_text(encoding='utf-8'))
+            # open directly; a missing file is the common case and costs no extra stat
+            return json.loads(meta_file.read_bytes())
         except Exception:
             return {}
-        return {}
 
     def _sanitize_name(self, name: str) -> str:
         # Remove characters not friendly for filesystem
-        bad = '<>:"/\\|?*'
-        out = ''.join('_' if ch in bad else ch for ch in str(name))
-        out = out.strip().strip('.')
-        return out or 'Game'
+        return _sanitize_folder_name(str(name))
 
     def _resolve_save_dir(self) -> Path:
         # Prefer Documents/HiganVN/<game-id>
@@ -227,11 +581,16 @@ class Engine:
         return base / 'HiganVN' / folder
 
     def get_save_dir(self) -> Path:
+        key = self.script_path
+        if self._save_dir_cache is not None and self._save_dir_cache_key == key:
+            return self._save_dir_cache
         p = self._resolve_save_dir()
         try:
             p.mkdir(parents=True, exist_ok=True)
         except Exception:
             pass
+        self._save_dir_cache = p
+        self._save_dir_cache_key = key
         return p
 
     def step(self) -> bool:
@@ -239,36 +598,67 @@ class Engine:
             return False
         if self.ip >= len(self.program.ops):
             return False
-        op = self.program.ops[self.ip]
+        self._run_op(self.program.ops[self.ip])
+        return True
+
+    def _run_op(self, op: Op) -> None:
+        if self._save_status:
+            self.poll_save_status()
         # update renderer debug hooks
-        try:
-            setattr(self.renderer, "_engine_ip", int(self.ip))
-            setattr(self.renderer, "_engine_call_stack_depth", int(len(self.call_stack)))
-            # snapshot public vars shallowly (avoid large objects)
-            if isinstance(self.vars, dict):
-                snap = {k: v for k, v in self.vars.items() if isinstance(k, str) and (isinstance(v, (int, float, str, bool)) or v is None)}
-                setattr(self.renderer, "_engine_vars_snapshot", snap)
-        except Exception:
-            pass
-        # pre-op event (typed)
-        try:
-            self._event_system.emit(EngineStepEvent(ip=int(self.ip), op_kind=str(op.kind), phase="before"))
-        except Exception:
-            pass
+        if self._debug_enabled:
+            self._publish_debug_state()
+        # pre-op event (typed); skipped entirely when nobody listens
+        es = self._event_system
+        if es.has_listeners(EngineStepEvent):
+            try:
+                es.emit(EngineStepEvent(ip=int(self.ip), op_kind=str(op.kind), phase="before"))
+            except Exception:
+                pass
         self._execute(op)
         self.ip += 1
         # post-op event (typed)
-        try:
-            self._event_system.emit(EngineStepEvent(ip=int(self.ip), op_kind="", phase="after"))
-        except Exception:
-            pass
-        return True
+        if es.has_listeners(EngineStepEvent):
+            try:
+                es.emit(EngineStepEvent(ip=int(self.ip), op_kind="", phase="after"))
+            except Exception:
+                pass
+
+    def _publish_debug_state(self) -> None:
+        """Push ip, call depth and a vars snapshot to a renderer that opted in.
+
+        The vars snapshot is rebuilt only when ``vars`` is replaced or its version
+        changes. SET, SCRIPT and state restore bump the version themselves; in-place
+        writes made elsewhere are only picked up after mark_vars_changed().
+        """
+        # attribute writes were probed in _renderer_wants_debug
+        r = self.renderer
+        r._engine_ip = self.ip
+        r._engine_call_stack_depth = len(self.call_stack)
+        # snapshot public vars shallowly (avoid large objects); reuse it until vars change
+        vars_ = self.vars
+        prev = self._vars_snapshot_key
+        if prev is None or prev[0] is not vars_ or prev[1] != self._vars_version:
+            if isinstance(vars_, dict):
+                r._engine_vars_snapshot = {k: v for k, v in vars_.items() if isinstance(k, str) and (isinstance(v, (int, float, str, bool)) or v is None)}
+            self._vars_snapshot_key = (vars_, self._vars_version)
 
     def run_headless(self) -> None:
         while True:
+            # same as looping step(), with the op list bound locally; rebound if an op
+            # loads another program (e.g. quickload) mid-run
+            program = self.program
+            if not program:
+                return
+            ops = program.ops
+            n = len(ops)
+            run_op = self._run_op
             try:
-                if not self.step():
-                    break
+                while self.ip < n:
+                    run_op(ops[self.ip])
+                    if self.program is not program:
+                        break
+                else:
+                    return
             except ScriptError as e:
                 # In interactive mode, show on renderer; otherwise raise
                 if self.interactive:
@@ -283,74 +673,71 @@ class Engine:
     def _execute(self, op: Op) -> None:
         k = op.kind
         p = op.payload
-        # Reset IF chain when encountering non-conditional commands
-        if k != "command" or str(p.get("name", "")).upper() not in {"IF", "ELSEIF", "ELSE", "SWITCH", "CASE", "DEFAULT", "ENDSWITCH"}:
+        name_up = None
+        flags = 0
+        if k == "command":
+            name_up = p.get("_name_up") or str(p.get("name", "")).upper()
+            flags = p.get("_flags")
+            if flags is None:
+                flags = _CMD_FLAGS.get(name_up, 0)
+        # Reset IF chain (and auto-end switch) on any op outside IF/SWITCH
+        if not flags:
             self._cond_chain_active = False
             self._cond_chain_taken = False
-            # Optionally auto-end switch on unrelated op
-            if k != "command" or str(p.get("name", "")).upper() not in {"SWITCH", "CASE", "DEFAULT", "ENDSWITCH"}:
-                self._switch_active = False
-                self._switch_value = None
-                self._switch_matched = False
+            self._switch_active = False
+            self._switch_value = None
+            self._switch_matched = False
 
-        def _interp(txt: str | None) -> str:
-            if not isinstance(txt, str):
-                return ""
-            # Replace {var} with value from self.vars; keep unknown placeholders unchanged
-            def repl(m: re.Match[str]) -> str:
-                name = m.group(1)
-                return str(self.vars.get(name, m.group(0)))
-            return re.sub(r"\{([A-Za-z_][A-Za-z0-9_]*)\}", repl, txt)
-        if k == "narration":
+        if k == "narration" or k == "dialogue":
+            if self.interactive and self._r_apply_snapshot is not None and self._r_get_snapshot:
+                self._checkpoint_line()
             # record the op index for this visible line
             try:
                 self.line_ip_trace.append(int(self.ip))
             except Exception:
                 pass
-            text_content = _interp(p.get("text"))
-            # Emit typed event (can be cancelled)
-            text_event = TextShowEvent(speaker=None, text=str(text_content))
-            try:
-                self._event_system.emit(text_event)
-            except Exception:
-                pass
-            if not text_event.cancelled:
-                self.renderer.show_text(None, text_content, None)
-                if self.interactive:
-                    self.renderer.wait_for_advance()
-        elif k == "dialogue":
-            who = p.get("actor", "?")
-            alias = p.get("alias")
-            display = f"{who}|{alias}" if alias else who
-            meta = {"emotion": p.get("emotion"), "effect": p.get("effect")}
-            try:
-                self.line_ip_trace.append(int(self.ip))
-            except Exception:
-                pass
-            text_content = _interp(p.get("text"))
+            if k == "dialogue":
+                who = p.get("actor", "?")
+                alias = p.get("alias")
+                display = f"{who}|{alias}" if alias else who
+                meta = {"emotion": p.get("emotion"), "effect": p.get("effect")}
+            else:
+                display = None
+                meta = None
+            render = p.get("_render")
+            text_content = render(self.vars) if render is not None else self._interp(p.get("text"))
             # Emit typed event (can be cancelled)
-            text_event = TextShowEvent(speaker=str(display), text=str(text_content), meta=dict(meta))
-            try:
-                self._event_system.emit(text_event)
-            except Exception:
-                pass
-            if not text_event.cancelled:
-                self.renderer.show_text(display, text_content, meta)
-                if self.interactive:
-                    self.renderer.wait_for_advance()
+            if self._event_system.has_listeners(TextShowEvent):
+                if display is None:
+                    text_event = TextShowEvent(speaker=None, text=str(text_content))
+                else:
+                    text_event = TextShowEvent(speaker=str(display), text=str(text_content), meta=dict(meta))
+                try:
+                    self._event_system.emit(text_event)
+                except Exception:
+                    pass
+                if text_event.cancelled:
+                    return
+            self.renderer.show_text(display, text_content, meta)
+            if self.interactive:
+                self.renderer.wait_for_advance()
         elif k == "command":
             # Emit typed command event (can be cancelled)
-            cmd_event = CommandEvent(
-                name=str(p.get("name") or ""),
-                args=str(p.get("args") or ""),
-                line=p.get("line")
-            )
-            try:
-                self._event_system.emit(cmd_event)
-            except Exception:
-                pass
-            if not cmd_event.cancelled:
-                self._execute_command(p.get("name") or "", p.get("args") or "", p.get("line"))
+            if self._event_system.has_listeners(CommandEvent):
+                cmd_event = CommandEvent(
+                    name=str(p.get("name") or ""),
+                    args=str(p.get("args") or ""),
+                    line=p.get("line")
+                )
+                try:
+                    self._event_system.emit(cmd_event)
+                except Exception:
+                    pass
+                cancelled = cmd_event.cancelled
+            else:
+                cancelled = False
+            if not cancelled:
+                self._execute_command(p.get("name") or "", p.get("args") or "", p.get("line"), name_up, p)
         elif k == "label":
             # no-op in headless
             name = p.get("name")
@@ -360,47 +747,48 @@ class Engine:
             except Exception:
                 pass
             # Emit typed event
-            if name:
+            if name and self._event_system.has_listeners(LabelEnterEvent):
                 try:
                     self._event_system.emit(LabelEnterEvent(name=str(name)))
                 except Exception:
                     pass
         elif k == "choice":
-            # gather contiguous choices
-            start = self.ip
-            choices: List[Tuple[str, str]] = []  # (text, target)
             if not self.program:
                 return
-            i = start
-            while i < len(self.program.ops) and self.program.ops[i].kind == "choice":
-                ch = self.program.ops[i].payload
-                choices.append((ch.get("text", ""), ch.get("target", "")))
-                i += 1
+            # contiguous choice block, precomputed by _prepare_program
+            texts = p.get("_choices_text")
+            if texts is None:
+                self._prepare_program(self.program)
+                texts = p["_choices_text"]
+            targets = p["_choices_target"]
+            i = p["_block_end"]
             # select
             sel_idx = 0
-            if self.interactive and choices:
-                sel_idx = self.renderer.ask_choice(choices)
+            if self.interactive and texts:
+                sel_idx = self.renderer.ask_choice(list(zip(texts, targets)))
                 # record user choice
                 self.choice_trace.append(int(sel_idx))
                 # Emit typed event
                 try:
                     self._event_system.emit(ChoiceSelectEvent(
                         index=int(sel_idx),
-                        text=str(choices[sel_idx][0]),
-                        target=str(choices[sel_idx][1])
+                        text=str(texts[sel_idx]),
+                        target=str(targets[sel_idx])
                     ))
                 except Exception:
                     pass
-            elif self._replay_choices is not None and choices:
+            elif self._replay_choices is not None and texts:
                 # consume recorded choice for deterministic replay
-                if self._replay_choices:
+                ri = self._replay_index
+                if ri < len(self._replay_choices):
+                    self._replay_index = ri + 1
                     try:
-                        sel_idx = int(self._replay_choices.pop(0))
+                        sel_idx = int(self._replay_choices[ri])
                     except Exception:
                         sel_idx = 0
                 else:
                     sel_idx = 0
-            target = choices[sel_idx][1] if choices else None
+            target = targets[sel_idx] if texts else None
             if target and target in self.program.labels:
                 self.ip = self.program.labels[target]
             else:
@@ -408,47 +796,68 @@ class Engine:
                 if self.strict and target:
                     raise ScriptError(f"Unknown target label: {target}", p.get("line"))
                 self.ip = i - 1  # -1 because step() will +1
-        else:
-            self.renderer.command(k, str(p))
-        # SCRIPT op (safe_exec block)
-        if k == "script":
+        elif k == "script":
+            # SCRIPT op (safe_exec block)
             try:
                 code = p.get("code") or ""
+                self._vars_version += 1
                 safe_exec(str(code), self.vars)
             except Exception:
                 if self.strict:
                     raise
-            return
+        else:
+            self.renderer.command(k, str(p))
 
-    def _execute_command(self, name: str, args: str, line: Optional[int]) -> None:
-        parts = args.split()
+    def _interp(self, txt: str | None) -> str:
+        if not isinstance(txt, str):
+            return ""
+        # most lines carry no placeholders; skip the regex pass entirely
+        if "{" not in txt:
+            return txt
+        return _INTERP_RE.sub(self._interp_repl, txt)
+
+    def _interp_repl(self, m: re.Match[str]) -> str:
+        # Replace {var} with value from self.vars; keep unknown placeholders unchanged
+        return str(self.vars.get(m.group(1), m.group(0)))
+
+    def _execute_command(self, name: str, args: str, line: Optional[int], name_up: Optional[str] = None,
+                         op_payload: Optional[Dict[str, Any]] = None) -> None:
+        # op_payload carries the fields precomputed by _prepare_program, when available
+        parts = op_payload.get("_parts") if op_payload is not None else None
+        if parts is None:
+            parts = args.split()
+        up = name_up or name.upper()
+        # (lhs, rhs) for SET/IF/ELSEIF/CASE; None when the separator is missing
+        split = op_payload.get("_split") if op_payload is not None else None
+        if split is None:
+            sep = _SPLIT_SEPS.get(up)
+            if sep is not None and sep in args:
+                lhs, rhs = args.split(sep, 1)
+                split = (lhs.strip(), rhs.strip())
         # Variable system
-        if name.upper() == "SET":
+        if up == "SET":
             # Syntax: SET var = expr
             try:
-                if '=' not in args:
+                if split is None:
                     if self.strict:
                         raise ScriptError("SET missing '='", line)
                     return
-                left, right = args.split('=', 1)
-                var = left.strip()
-                expr = right.strip()
+                var, expr = split
                 val = safe_eval(expr, self.vars)
                 self.vars[var] = val
+                self._vars_version += 1
             except Exception as e:
                 if self.strict:
                     raise ScriptError(f"SET error: {e}", line)
             return
-        if name.upper() == "IF":
+        if up == "IF":
             # Syntax: IF expr -> label
             try:
-                if '->' not in args:
+                if split is None:
                     if self.strict:
                         raise ScriptError("IF missing '->'", line)
                     return
-                cond, target = args.split('->', 1)
-                cond = cond.strip()
-                target = target.strip()
+                cond, target = split
                 ok = bool(safe_eval(cond, self.vars))
                 # begin conditional chain
                 self._cond_chain_active = True
@@ -463,18 +872,16 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"IF error: {e}", line)
             return
-        if name.upper() == "ELSEIF":
+        if up == "ELSEIF":
             # Syntax: ELSEIF expr -> label (valid only after IF)
             try:
                 if not self._cond_chain_active or self._cond_chain_taken:
                     return
-                if '->' not in args:
+                if split is None:
                     if self.strict:
                         raise ScriptError("ELSEIF missing '->'", line)
                     return
-                cond, target = args.split('->', 1)
-                cond = cond.strip()
-                target = target.strip()
+                cond, target = split
                 ok = bool(safe_eval(cond, self.vars))
                 if ok and self.program and target in self.program.labels:
                     self.ip = self.program.labels[target] - 1
@@ -485,7 +892,7 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"ELSEIF error: {e}", line)
             return
-        if name.upper() == "ELSE":
+        if up == "ELSE":
             # Syntax: ELSE -> label (valid only after IF/ELSEIF)
             try:
                 if not self._cond_chain_active or self._cond_chain_taken:
@@ -500,7 +907,7 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"ELSE error: {e}", line)
             return
-        if name.upper() == "SWITCH":
+        if up == "SWITCH":
             # Syntax: SWITCH expr
             try:
                 expr = args.strip()
@@ -511,18 +918,17 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"SWITCH error: {e}", line)
             return
-        if name.upper() == "CASE":
+        if up == "CASE":
             # Syntax: CASE value -> label (valid only after SWITCH)
             try:
                 if not self._switch_active or self._switch_matched:
                     return
-                if '->' not in args:
+                if split is None:
                     if self.strict:
                         raise ScriptError("CASE missing '->'", line)
                     return
-                val_s, target = args.split('->', 1)
-                val = safe_eval(val_s.strip(), self.vars)
-                target = target.strip()
+                val_s, target = split
+                val = safe_eval(val_s, self.vars)
                 if val == self._switch_value:
                     if target and self.program and target in self.program.labels:
                         self.ip = self.program.labels[target] - 1
@@ -533,7 +939,7 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"CASE error: {e}", line)
             return
-        if name.upper() == "DEFAULT":
+        if up == "DEFAULT":
             # Syntax: DEFAULT -> label (valid only after SWITCH)
             try:
                 if not self._switch_active or self._switch_matched:
@@ -548,13 +954,13 @@ class Engine:
                 if self.strict:
                     raise ScriptError(f"DEFAULT error: {e}", line)
             return
-        if name.upper() == "ENDSWITCH":
+        if up == "ENDSWITCH":
             # Syntax: ENDSWITCH
             self._switch_active = False
             self._switch_value = None
             self._switch_matched = False
             return
-        if name.upper() == "GOTO":
+        if up == "GOTO":
             # Syntax: GOTO label
             target = parts[0] if parts else None
             if target and self.program and target in self.program.labels:
@@ -562,16 +968,17 @@ class Engine:
             elif self.strict and target:
                 raise ScriptError(f"Unknown target label: {target}", line)
             return
-        if name.upper() == "SCRIPT":
+        if up == "SCRIPT":
             # Syntax: SCRIPT <inline...> or multiline via parser support
             # Execute a tiny safe subset of Python statements against self.vars
             try:
+                self._vars_version += 1
                 safe_exec(args, self.vars)
             except Exception as e:
                 if self.strict:
                     raise ScriptError(f"SCRIPT error: {e}", line)
             return
-        if name.upper() == "CALL":
+        if up == "CALL":
             # Syntax: CALL label
             target = parts[0] if parts else None
             if target and self.program and target in self.program.labels:
@@ -581,7 +988,7 @@ class Engine:
             elif self.strict and target:
                 raise ScriptError(f"Unknown target label: {target}", line)
             return
-        if name.upper() == "RETURN":
+        if up == "RETURN":
             # Syntax: RETURN
             if not self.call_stack:
                 if self.strict:
@@ -591,7 +998,7 @@ class Engine:
             # step() will +1 after this instruction; set ip to ret to resume next op
             self.ip = ret
             return
-        if name.upper() == "WAIT":
+        if up == "WAIT":
             # Syntax: WAIT <ms>
             try:
                 ms = int(parts[0]) if parts else 0
@@ -602,12 +1009,18 @@ class Engine:
                     if hasattr(self.renderer, "wait_ms") and callable(getattr(self.renderer, "wait_ms")):
                         self.renderer.wait_ms(ms)  # type: ignore[attr-defined]
                     else:
-                        # Fallback: sleep without UI pumping
-                        time.sleep(ms / 1000.0)
+                        # Fallback: sleep in short slices against a monotonic deadline
+                        # so repeated WAITs do not accumulate oversleep drift
+                        deadline = time.monotonic() + ms / 1000.0
+                        while True:
+                            remain = deadline - time.monotonic()
+                            if remain <= 0:
+                                break
+                            time.sleep(min(remain, 0.005))
                 except Exception:
                     pass
             return
-        if name.upper() == "AUTO":
+        if up == "AUTO":
             # Syntax: AUTO on|off|toggle
             mode = (parts[0].lower() if parts else "toggle")
             try:
@@ -630,38 +1043,13 @@ class Engine:
             except Exception:
                 pass
             return
-        if name.upper() == "TITLE":
+        if up == "TITLE":
             # Syntax: TITLE ["标题"] [bg_path]
             # Shows a title menu; returns only when user chooses Start (continue), or quits.
-            raw = args.strip()
-            title = None
-            bgp = None
-            try:
-                if raw.startswith('"') and '"' in raw[1:]:
-                    i = raw.find('"', 1)
-                    j = raw.rfind('"')
-                    if j > 0 and j > i:
-                        title = raw[1:j]
-                        rest = raw[j+1:].strip()
-                    else:
-                        title = raw.strip('"')
-                        rest = ''
-                elif (raw.startswith('“') and '”' in raw) or (raw.startswith('「') and '」' in raw):
-                    if raw.startswith('“'):
-                        close = raw.rfind('”')
-                        title = raw[1:close] if close > 0 else raw.strip('“”')
-                        rest = raw[close+1:].strip() if close > 0 else ''
-                    else:
-                        close = raw.rfind('」')
-                        title = raw[1:close] if close > 0 else raw.strip('「」')
-                        rest = raw[close+1:].strip() if close > 0 else ''
-                else:
-                    rest = raw
-                parts2 = rest.split()
-                if parts2:
-                    bgp = parts2[0]
-            except Exception:
-                pass
+            if op_payload is not None and "_title" in op_payload:
+                title, bgp = op_payload["_title"]
+            else:
+                title, bgp = _parse_title_args(args)
             # Track if we loaded from save successfully
             loaded_from_save = False
             # Emit title menu open event
@@ -723,22 +1111,22 @@ class Engine:
             # Emit title menu close event
             self._event_system.emit(TitleMenuEvent(action="close"))
             return
-        if name.upper() == "BG":
+        if up == "BG":
             path = None if not parts or parts[0] == "None" else parts[0]
             self.renderer.set_background(path)
             return
-        if name.upper() == "BGM":
+        if up == "BGM":
             path = None if not parts or parts[0] == "None" else parts[0]
             vol = float(parts[1]) if len(parts) > 1 else None
             self.renderer.play_bgm(path, vol)
             return
-        if name.upper() == "SE":
+        if up == "SE":
             if not parts:
                 return
             vol = float(parts[1]) if len(parts) > 1 else None
             self.renderer.play_se(parts[0], vol)
             return
-        if name.upper() == "OUTFIT":
+        if up == "OUTFIT":
             # Syntax: OUTFIT <actor> <folder|None>
             if len(parts) >= 1:
                 actor = parts[0]
@@ -749,7 +1137,7 @@ class Engine:
                 except Exception:
                     pass
             return
-        if name.upper() == "ACTION":
+        if up == "ACTION":
             # Syntax: ACTION <actor> <name|None>
             if len(parts) >= 1:
                 actor = parts[0]
@@ -759,7 +1147,7 @@ class Engine:
                 except Exception:
                     pass
             return
-        if name.upper() == "HIDE":
+        if up == "HIDE":
             # Syntax: HIDE <actor>
             if len(parts) >= 1:
                 actor = parts[0]
@@ -768,14 +1156,14 @@ class Engine:
                 except Exception:
                     pass
             return
-        if name.upper() == "CLEAR_STAGE":
+        if up == "CLEAR_STAGE":
             # Syntax: CLEAR_STAGE (remove all characters)
             try:
                 self.renderer.command("CLEAR_STAGE", "")
             except Exception:
                 pass
             return
-        if name.upper() == "VOICE":
+        if up == "VOICE":
             # Syntax: VOICE <path|None> [volume]
             path = None if not parts or parts[0].lower() == "none" else parts[0]
             vol = float(parts[1]) if len(parts) > 1 else None
@@ -792,6 +1180,89 @@ class Engine:
         self.renderer.command(name, args)
 
     # --- quick save/load ---
+    def _script_sha256(self, path: Optional[Path] = None) -> Optional[str]:
+        """Content hash of the script (default: script_path); None if it cannot be read.
+
+        The last digest is kept per (path, mtime, size), so back-to-back saves and loads
+        of an unchanged script hash it only once.
+        """
+        p = path if path is not None else self.script_path
+        if not p:
+            return None
+        try:
+            st = os.stat(p)
+            key = (str(p), st.st_mtime_ns, st.st_size)
+            cached = self._script_hash_cache
+            if cached is not None and cached[0] == key:
+                return cached[1]
+            digest = _file_sha256(Path(p))
+        except Exception:
+            return None
+        self._script_hash_cache = (key, digest)
+        return digest
+
+    def _reload_for_save(self, path: Path, restore_snapshot: bool) -> None:
+        """Make the program for path current with fresh run state before restoring a save.
+
+        When the loaded program already came from this unchanged script and the renderer
+        state will come from a snapshot, only the run state is reset; otherwise the
+        program goes through load() (re-parsed only if its source differs).
+        """
+        if self._program_matches(path):
+            if restore_snapshot:
+                self.script_path = path
+                self._reset_run_state()
+                return
+            prog = self.program
+        else:
+            prog = parse_script(_read_script_source(path))
+        self.script_path = path
+        self.load(prog)
+
+    def _program_matches(self, path: Path) -> bool:
+        """True if the loaded program was parsed from path and the file is unchanged since."""
+        src = self._program_source
+        if self.program is None or src is None or src[1] is None:
+            return False
+        return src[0] == str(path) and self._script_sha256(path) == src[1]
+
+    def _build_save_payload(self, detach: bool = True) -> dict:
+        """Collect the version-2 save payload shared by quicksave and save_to_slot.
+
+        detach=False lets the payload reference live vars; only safe when it is
+        serialized right away on this thread.
+        """
+        # try to infer current label name from last label entered
+        try:
+            cur_label = getattr(self.renderer, "_current_label", None)
+        except Exception:
+            cur_label = None
+        # collect renderer snapshot if available
+        snapshot = None
+        try:
+            if self._r_get_snapshot:
+                snapshot = self._r_get_snapshot()
+        except Exception:
+            snapshot = None
+        return {
+            "script": str(self.script_path) if self.script_path else None,
+            "ip": self.ip,
+            # epoch seconds; readers format it with storage.format_save_ts
+            "ts": int(time.time()),
+            # include choice path for deterministic replay (tolist() is always a copy)
+            "choices": self.choice_trace.tolist(),
+            # include variable store; queued payloads outlive this call, so they get a copy
+            "vars": dict(self.vars) if detach else self.vars,
+            "label": cur_label,
+            # optional snapshot for fast restore
+            "snapshot": snapshot,
+            # textbox view state
+            "textbox": {"view_idx": getattr(self.textbox, "view_idx", -1)},
+            # script content hash for mismatch detection on load
+            "script_hash": self._script_sha256(),
+            "version": 2,
+        }
+
     def quicksave(self, save_path: Path | None = None) -> bool:
         try:
             if not self.program:
@@ -804,50 +1275,15 @@ class Engine:
                 pass
             if save_event.cancelled:
                 return False
-            # try to infer current label name from last label entered
-            try:
-                cur_label = getattr(self.renderer, "_current_label", None)
-            except Exception:
-                cur_label = None
-            # collect renderer snapshot if available
-            snapshot = None
-            try:
-                if hasattr(self.renderer, "get_snapshot") and callable(getattr(self.renderer, "get_snapshot")):
-                    snapshot = self.renderer.get_snapshot()  # type: ignore[attr-defined]
-            except Exception:
-                snapshot = None
-            # compute script content hash for mismatch detection on load
-            try:
-                script_hash = None
-                if self.script_path and Path(self.script_path).exists():
-                    data = Path(self.script_path).read_bytes()
-                    script_hash = hashlib.sha256(data).hexdigest()
-            except Exception:
-                script_hash = None
-            payload = {
-                "script": str(self.script_path) if self.script_path else None,
-                "ip": self.ip,
-                "ts": datetime.now().isoformat(timespec="seconds"),
-                # include choice path for deterministic replay
-                "choices": list(self.choice_trace),
-                # include variable store
-                "vars": self.vars,
-                "label": cur_label,
-                # optional snapshot for fast restore
-                "snapshot": snapshot,
-                # textbox view state
-                "textbox": {"view_idx": getattr(self.textbox, "view_idx", -1)},
-                # script hash for mismatch detection
-                "script_hash": script_hash,
-                "version": 2,
-            }
             # Prefer injected save store; fall back to legacy file path when explicit path provided
-            if self._save_store and save_path is None:
-                return bool(self._save_store.write_quick(payload))
+            background = bool(self._save_store) and save_path is None
+            payload = self._build_save_payload(detach=background)
+            if background:
+                return self._submit_save(None, payload)
             else:
                 sp = save_path or (self.get_save_dir() / "quick.json")
                 sp.parent.mkdir(parents=True, exist_ok=True)
-                sp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+                atomic_write_bytes(sp, encode_payload(payload))
             # Emit save complete event
             try:
                 self._event_system.emit(SaveCompleteEvent(slot=0, success=True))
@@ -873,14 +1309,15 @@ class Engine:
         try:
             # Prefer injected save store; fall back to legacy file
             if self._save_store and save_path is None:
-                data = self._save_store.read_quick()
+                data = self._pending_payload(None) or self._save_store.read_quick()
                 if not data:
                     return False
             else:
                 sp = save_path or (self.get_save_dir() / "quick.json")
-                if not sp.exists():
+                # parsed from the raw bytes; no intermediate str
+                data = read_payload(sp)
+                if not data:
                     return False
-                data = json.loads(sp.read_text(encoding="utf-8"))
             script = data.get("script")
             ip = int(data.get("ip", 0))
             choices = data.get("choices") or []
@@ -888,29 +1325,24 @@ class Engine:
             saved_hash = data.get("script_hash")
             if not script:
                 return False
-            p = Path(script)
-            if not p.exists():
-                # allow relative to current cwd
-                p = Path(str(script))
-            # reload program
-            source = p.read_text(encoding="utf-8")
-            prog = parse_script(source)
-            self.load(prog)
-            self.script_path = p
+            # a relative path resolves against the current cwd; a missing file fails on open
+            p = Path(str(script))
             # Check if script changed; if changed, do not trust snapshot
             changed = False
             try:
-                cur_hash = hashlib.sha256(p.read_bytes()).hexdigest()
+                cur_hash = self._script_sha256(p)
                 changed = bool(saved_hash) and saved_hash != cur_hash
             except Exception:
                 changed = False
+            # reload program (re-parse only if the current one came from other content)
+            self._reload_for_save(p, (not changed) and bool(snapshot) and self._r_apply_snapshot is not None)
             # Apply snapshot if available and script unchanged, else fast-replay deterministically to rebuild state
             try:
-                if (not changed) and snapshot and hasattr(self.renderer, "apply_snapshot") and callable(getattr(self.renderer, "apply_snapshot")):
+                if (not changed) and snapshot and self._r_apply_snapshot is not None:
                     # reset renderer to a clean state first
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
-                    self.renderer.apply_snapshot(snapshot)  # type: ignore[attr-defined]
+                    if self._r_reset_state:
+                        self._r_reset_state()
+                    self._r_apply_snapshot(snapshot)
                     # adopt saved variable store and set ip so the saved line will be executed next
                     try:
                         self.vars = dict(data.get("vars") or {})
@@ -919,11 +1351,11 @@ class Engine:
                     self.ip = max(0, int(ip) - 1)
                 else:
                     # Reset renderer state then fast-replay deterministically
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
-                    self._replay_choices = list(choices)
+                    if self._r_reset_state:
+                        self._r_reset_state()
+                    self._replay_choices, self._replay_index = choices, 0
                     # Rewind target by one so the saved line will be executed next
-                    target = max(0, min(max(0, ip - 1), (len(self.program.ops) - 1) if self.program else 0))
+                    target = self._replay_target(ip)
                     self._fast_replay_to(target)
                 if changed:
                     try:
@@ -933,15 +1365,15 @@ class Engine:
             except Exception:
                 # Snapshot failed -> fall back to fast replay
                 try:
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
+                    if self._r_reset_state:
+                        self._r_reset_state()
                 except Exception:
                     pass
-                self._replay_choices = list(choices)
-                target = max(0, min(max(0, ip - 1), (len(self.program.ops) - 1) if self.program else 0))
+                self._replay_choices, self._replay_index = choices, 0
+                target = self._replay_target(ip)
                 self._fast_replay_to(target)
             # adopt saved trace so future saves continue from here
-            self.choice_trace = list(choices)
+            self.choice_trace = _int_trace(choices)
             # restore textbox view state
             try:
                 tb = data.get("textbox") or {}
@@ -972,41 +1404,14 @@ class Engine:
                 pass
             if save_event.cancelled:
                 return False
-            try:
-                cur_label = getattr(self.renderer, "_current_label", None)
-            except Exception:
-                cur_label = None
-            snapshot = None
-            try:
-                if hasattr(self.renderer, "get_snapshot") and callable(getattr(self.renderer, "get_snapshot")):
-                    snapshot = self.renderer.get_snapshot()  # type: ignore[attr-defined]
-            except Exception:
-                snapshot = None
-            try:
-                script_hash = None
-                if self.script_path and Path(self.script_path).exists():
-                    data = Path(self.script_path).read_bytes()
-                    script_hash = hashlib.sha256(data).hexdigest()
-            except Exception:
-                script_hash = None
-            payload = {
-                "script": str(self.script_path) if self.script_path else None,
-                "ip": self.ip,
-                "ts": datetime.now().isoformat(timespec="seconds"),
-                "choices": list(self.choice_trace),
-                "vars": self.vars,
-                "label": cur_label,
-                "snapshot": snapshot,
-                "textbox": {"view_idx": getattr(self.textbox, "view_idx", -1)},
-                "script_hash": script_hash,
-                "version": 2,
-            }
-            if self._save_store and base is None:
-                return bool(self._save_store.write_slot(int(slot), payload))
+            background = bool(self._save_store) and base is None
+            payload = self._build_save_payload(detach=background)
+            if background:
+                return self._submit_save(int(slot), payload)
             else:
                 sp = self._slot_json_path(int(slot), base)
                 sp.parent.mkdir(parents=True, exist_ok=True)
-                sp.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+                atomic_write_bytes(sp, encode_payload(payload))
             # Emit save complete event
             try:
                 self._event_system.emit(SaveCompleteEvent(slot=int(slot), success=True))
@@ -1031,14 +1436,15 @@ class Engine:
             return False
         try:
             if self._save_store and base is None:
-                data = self._save_store.read_slot(int(slot))
+                data = self._pending_payload(int(slot)) or self._save_store.read_slot(int(slot))
                 if not data:
                     return False
             else:
                 sp = self._slot_json_path(int(slot), base)
-                if not sp.exists():
+                # parsed from the raw bytes; no intermediate str
+                data = read_payload(sp)
+                if not data:
                     return False
-                data = json.loads(sp.read_text(encoding="utf-8"))
             script = data.get("script")
             ip = int(data.get("ip", 0))
             choices = data.get("choices") or []
@@ -1046,35 +1452,31 @@ class Engine:
             saved_hash = data.get("script_hash")
             if not script:
                 return False
-            p = Path(script)
-            if not p.exists():
-                p = Path(str(script))
-            source = p.read_text(encoding="utf-8")
-            prog = parse_script(source)
-            self.load(prog)
-            self.script_path = p
-            # Apply snapshot if available and script unchanged; otherwise fast replay
+            # a relative path resolves against the current cwd; a missing file fails on open
+            p = Path(str(script))
+            changed = False
             try:
+                cur_hash = self._script_sha256(p)
+                changed = bool(saved_hash) and saved_hash != cur_hash
+            except Exception:
                 changed = False
-                try:
-                    cur_hash = hashlib.sha256(p.read_bytes()).hexdigest()
-                    changed = bool(saved_hash) and saved_hash != cur_hash
-                except Exception:
-                    changed = False
-                if (not changed) and snapshot and hasattr(self.renderer, "apply_snapshot") and callable(getattr(self.renderer, "apply_snapshot")):
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
-                    self.renderer.apply_snapshot(snapshot)  # type: ignore[attr-defined]
+            self._reload_for_save(p, (not changed) and bool(snapshot) and self._r_apply_snapshot is not None)
+            # Apply snapshot if available and script unchanged; otherwise fast replay
+            try:
+                if (not changed) and snapshot and self._r_apply_snapshot is not None:
+                    if self._r_reset_state:
+                        self._r_reset_state()
+                    self._r_apply_snapshot(snapshot)
                     try:
                         self.vars = dict(data.get("vars") or {})
                     except Exception:
                         self.vars = {}
                     self.ip = max(0, int(ip) - 1)
                 else:
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
-                    self._replay_choices = list(choices)
-                    target = max(0, min(max(0, ip - 1), (len(self.program.ops) - 1) if self.program else 0))
+                    if self._r_reset_state:
+                        self._r_reset_state()
+                    self._replay_choices, self._replay_index = choices, 0
+                    target = self._replay_target(ip)
                     self._fast_replay_to(target)
                 if changed:
                     try:
@@ -1083,14 +1485,14 @@ class Engine:
                         pass
             except Exception:
                 try:
-                    if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                        self.renderer.reset_state()  # type: ignore[attr-defined]
+                    if self._r_reset_state:
+                        self._r_reset_state()
                 except Exception:
                     pass
-                self._replay_choices = list(choices)
-                target = max(0, min(max(0, ip - 1), (len(self.program.ops) - 1) if self.program else 0))
+                self._replay_choices, self._replay_index = choices, 0
+                target = self._replay_target(ip)
                 self._fast_replay_to(target)
-            self.choice_trace = list(choices)
+            self.choice_trace = _int_trace(choices)
             try:
                 tb = data.get("textbox") or {}
                 vi = int(tb.get("view_idx", -1))
@@ -1104,6 +1506,11 @@ class Engine:
             return False
 
     # --- helpers ---
+    def _replay_target(self, ip: int) -> int:
+        """Op index to fast-replay to so the saved line at ip executes next, clamped to the program."""
+        last = len(self.program.ops) - 1 if self.program else 0
+        return max(0, min(ip - 1, last))
+
     def _fast_replay_to(self, target_ip: int) -> None:
         """Rebuild renderer state up to target_ip without interactive waits.
 
@@ -1115,8 +1522,8 @@ class Engine:
         self.interactive = False
         # hint renderer to speed up (optional)
         try:
-            if hasattr(self.renderer, "begin_fast_replay") and callable(getattr(self.renderer, "begin_fast_replay")):
-                self.renderer.begin_fast_replay()  # type: ignore[attr-defined]
+            if self._r_begin_fast_replay:
+                self._r_begin_fast_replay()
         except Exception:
             pass
         self.ip = 0
@@ -1127,25 +1534,65 @@ class Engine:
             pass
         # reset line trace as we'll rebuild deterministically
         try:
-            self.line_ip_trace = []
+            self.line_ip_trace = array('i')
         except Exception:
             pass
-        while self.ip < target:
+        program = self.program
+        if program:
+            # same as looping step() up to target, with lookups bound once and a single try
+            ops = program.ops
+            end = min(target, len(ops))
+            run_op = self._run_op
             try:
-                if not self.step():
-                    break
+                while self.ip < end:
+                    run_op(ops[self.ip])
             except Exception:
                 # ignore errors during reconstruction
-                break
+                pass
         # end fast replay
         try:
-            if hasattr(self.renderer, "end_fast_replay") and callable(getattr(self.renderer, "end_fast_replay")):
-                self.renderer.end_fast_replay()  # type: ignore[attr-defined]
+            if self._r_end_fast_replay:
+                self._r_end_fast_replay()
         except Exception:
             pass
         self.interactive = was_interactive
 
     # --- back/rewind one visible line ---
+    def _checkpoint_line(self) -> None:
+        try:
+            snapshot = self._r_get_snapshot()
+        except Exception:
+            return
+        self._line_checkpoints.append((
+            self.ip, len(self.line_ip_trace), len(self.choice_trace), dict(self.vars),
+            list(self.call_stack),
+            (self._cond_chain_active, self._cond_chain_taken,
+             self._switch_active, self._switch_value, self._switch_matched),
+            snapshot,
+        ))
+
+    def _restore_line_checkpoint(self, line_idx: int, ip: int) -> bool:
+        """Restore the state from just before visible line #line_idx (at op ip), if recorded."""
+        cps = self._line_checkpoints
+        # later checkpoints describe lines that are about to be undone
+        while cps and cps[-1][1] > line_idx:
+            cps.pop()
+        if not cps or cps[-1][1] != line_idx or cps[-1][0] != ip:
+            return False
+        _, _, n_choices, vars_, call_stack, cond, snapshot = cps.pop()
+        if self._r_reset_state:
+            self._r_reset_state()
+        self._r_apply_snapshot(snapshot)
+        self.vars = dict(vars_)
+        self._vars_version += 1
+        self.call_stack = list(call_stack)
+        (self._cond_chain_active, self._cond_chain_taken,
+         self._switch_active, self._switch_value, self._switch_matched) = cond
+        self.choice_trace = self.choice_trace[:n_choices]
+        self.line_ip_trace = self.line_ip_trace[:line_idx]
+        self.ip = ip
+        return True
+
     def back_one_line(self) -> bool:
         try:
             if not self.program:
@@ -1153,11 +1600,17 @@ class Engine:
             if len(self.line_ip_trace) < 2:
                 return False
             prev_ip = int(self.line_ip_trace[-2])
+            # recent lines restore from a checkpoint; older ones are rebuilt by replay
+            try:
+                if self._restore_line_checkpoint(len(self.line_ip_trace) - 2, prev_ip):
+                    return True
+            except Exception:
+                pass
             # Reset renderer state then fast-replay up to just before prev line,
             # so that prev line will be executed next in interactive flow.
             try:
-                if hasattr(self.renderer, "reset_state") and callable(getattr(self.renderer, "reset_state")):
-                    self.renderer.reset_state()  # type: ignore[attr-defined]
+                if self._r_reset_state:
+                    self._r_reset_state()
             except Exception:
                 pass
             # Reset variables; will be rebuilt during fast replay
@@ -1165,16 +1618,14 @@ class Engine:
                 self.vars = {}
             except Exception:
                 pass
-            # Feed choices taken so far; consume as needed
-            original_choices = list(self.choice_trace)
-            self._replay_choices = list(original_choices)
+            # Feed choices taken so far; replay does not record, so read the trace in place
+            self._replay_choices, self._replay_index = self.choice_trace, 0
             # target to rebuild state so next step executes prev_ip
             target = max(0, prev_ip)
             self._fast_replay_to(target)
             # Trim choice_trace to the number consumed during replay
             try:
-                consumed = max(0, len(original_choices) - len(self._replay_choices or []))
-                self.choice_trace = original_choices[:consumed]
+                self.choice_trace = self.choice_trace[:self._replay_index]
             except Exception:
                 pass
             self._replay_choices = None
@@ -8,7 +8,9 @@ Enhanced Character Layer - 增强角色图层
 """
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple, Callable, List, Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple, Callable, List, Any
 from pathlib import Path
 
 try:
@@ -26,6 +28,22 @@ from higanvn.engine.layered_renderer import LayeredCharacterRenderer, AssetLoade
 
 LOGICAL_SIZE: Tuple[int, int] = (1280, 720)
 
+# set_pose 解析结果: (pose, expression, outfit, effects)
+_ParsedEmotion = Tuple[Optional[str], Optional[str], Optional[str], Tuple[str, ...]]
+
+
+@dataclass
+class ActorInfo:
+    """单个角色的状态记录（服装跨 remove/clear 保留）"""
+    outfit: Optional[str] = None
+    pose_name: Optional[str] = None
+    action: Optional[Surface] = None
+    action_name: Optional[str] = None
+    # None 表示尚未检测是否有差分 manifest
+    layered: Optional[bool] = None
+    # 缩放缓存: (source surface, target height, scaled, dimmed or None)
+    scaled: Optional[Tuple[Surface, int, Surface, Optional[Surface]]] = None
+
 
 class EnhancedCharacterLayer:
     """
@@ -49,18 +67,21 @@ class EnhancedCharacterLayer:
         # 传统模式数据
         self.characters: Dict[str, Tuple[Optional[Surface], Optional[Surface]]] = {}
         self.active_actor: Optional[str] = None
-        self._outfits: Dict[str, Optional[str]] = {}
-        self._actions: Dict[str, Optional[Surface]] = {}
-        self._pose_names: Dict[str, Optional[str]] = {}
-        self._action_names: Dict[str, Optional[str]] = {}
+        # 每个角色一条状态记录
+        self._actors: Dict[str, ActorInfo] = {}
         
         # 差分立绘渲染器
         self._layered_renderer: Optional[LayeredCharacterRenderer] = None
         if characters_dir:
             self._init_layered_renderer()
         
-        # 模式标记（每个角色可能使用不同模式）
-        self._use_layered: Dict[str, bool] = {}
+        # 渲染顺序（按登场先后），只在角色增删时更新
+        self._render_order: Dict[str, None] = {}
+        # ((传统角色数, 差分角色数), active_actor, 活跃角色置后的顺序)
+        self._order_cache: Optional[Tuple[Tuple[int, int], Optional[str], List[str]]] = None
+        
+        # (actor, emotion) -> (解析时的 manifest, (pose, expression, outfit, effects))
+        self._emotion_cache: Dict[Tuple[str, str], Tuple[Any, _ParsedEmotion]] = {}
         
         # 调试信息
         self._last_rects: Dict[str, Any] = {}
@@ -69,6 +90,37 @@ class EnhancedCharacterLayer:
         # 严格模式
         self._strict_mode = False
     
+    @property
+    def _slots(self) -> dict:
+        return self._slots_cfg
+    
+    @_slots.setter
+    def _slots(self, slots: dict) -> None:
+        self._slots_cfg = slots
+        positions = slots.get(
+            "positions",
+            [
+                (LOGICAL_SIZE[0] * 0.2, LOGICAL_SIZE[1] * 0.64),
+                (LOGICAL_SIZE[0] * 0.5, LOGICAL_SIZE[1] * 0.64),
+                (LOGICAL_SIZE[0] * 0.8, LOGICAL_SIZE[1] * 0.64),
+            ],
+        )
+        # 预先取整，render 中与 Animator 的整数偏移直接相加
+        self._slot_positions: Tuple[Tuple[int, int], ...] = tuple((int(x), int(y)) for x, y in positions)
+        self._slot_scale = float(slots.get("scale", 0.9))
+        pos_count = max(1, len(self._slot_positions))
+        # 角色数 -> 槽位下标表；超出 8 人时在 render 中按 i % pos_count 现算
+        maps: Dict[int, List[int]] = {1: [1 if pos_count >= 3 else (pos_count // 2)]}
+        if pos_count >= 3:
+            maps[2] = [0, 2]
+        elif pos_count >= 2:
+            maps[2] = [0, 1]
+        else:
+            maps[2] = [0, 0]
+        for n in range(3, 9):
+            maps[n] = [i % pos_count for i in range(n)]
+        self._slot_maps = maps
+    
     def _init_layered_renderer(self) -> None:
         """初始化差分立绘渲染器"""
         if not self.characters_dir:
@@ -91,22 +143,26 @@ class EnhancedCharacterLayer:
         """设置严格模式"""
         self._strict_mode = bool(strict)
     
+    def _info(self, actor: str) -> ActorInfo:
+        """获取（必要时创建）角色状态记录"""
+        info = self._actors.get(actor)
+        if info is None:
+            info = self._actors[actor] = ActorInfo()
+        return info
+    
     def _is_layered(self, actor: str) -> bool:
         """检查角色是否使用差分立绘模式"""
-        if actor in self._use_layered:
-            return self._use_layered[actor]
-        
-        # 检查是否有 manifest
-        if self._layered_renderer and self._layered_renderer.has_manifest(actor):
-            self._use_layered[actor] = True
-            return True
-        
-        self._use_layered[actor] = False
-        return False
+        info = self._info(actor)
+        if info.layered is None:
+            # 检查是否有 manifest
+            info.layered = bool(self._layered_renderer and self._layered_renderer.has_manifest(actor))
+        return info.layered
     
     def set_outfit(self, actor: str, outfit: Optional[str]) -> None:
         """设置服装"""
-        self._outfits[actor] = outfit if outfit else None
+        info = self._info(actor)
+        info.outfit = outfit if outfit else None
+        info.scaled = None
         
         if self._is_layered(actor) and self._layered_renderer:
             self._layered_renderer.set_state(actor, outfit=outfit or "default")
@@ -115,9 +171,10 @@ class EnhancedCharacterLayer:
             # 传统模式：清除缓存
             if actor in self.characters:
                 self.characters.pop(actor, None)
-            self._actions.pop(actor, None)
-            self._pose_names.pop(actor, None)
-            self._action_names.pop(actor, None)
+            info.action = None
+            info.pose_name = None
+            info.action_name = None
+        self._sync_order()
     
     def ensure_loaded(
         self,
@@ -130,13 +187,14 @@ class EnhancedCharacterLayer:
             # 差分模式：初始化状态
             if self._layered_renderer:
                 self._layered_renderer.set_state(actor)
+                self._sync_order()
             return
         
         # 传统模式
         if actor in self.characters:
             return
         
-        outfit = self._outfits.get(actor)
+        outfit = self._info(actor).outfit
         base: Optional[Surface] = None
         
         if outfit:
@@ -162,6 +220,7 @@ class EnhancedCharacterLayer:
             base = make_placeholder(actor)
         
         self.characters[actor] = (base, None)
+        self._sync_order()
     
     def set_pose(
         self,
@@ -171,42 +230,27 @@ class EnhancedCharacterLayer:
         make_pose_ph: Callable[[str], Surface],
     ) -> None:
         """设置表情/姿势"""
+        info = self._info(actor)
+        info.scaled = None
         if self._is_layered(actor):
             # 差分模式：尝试解析为 pose:expression 格式
             if self._layered_renderer:
-                # 检查是否是复合格式 "pose:expression:outfit"
-                parts = emotion.split(":")
-                pose = parts[0] if len(parts) > 0 else None
-                expression = parts[1] if len(parts) > 1 else parts[0]
-                outfit = parts[2] if len(parts) > 2 else None
-                
-                # 检查 pose 是否有效，否则作为 expression
-                available_poses = self._layered_renderer.get_available_poses(actor)
-                if pose and pose not in available_poses:
-                    # pose 实际上是 expression
-                    expression = pose
-                    pose = None
-                
-                # 检查是否有特效 (用 + 分隔) - 在确定 expression 后再分离
-                effects = []
-                if "+" in (expression or ""):
-                    effect_parts = expression.split("+")
-                    expression = effect_parts[0]
-                    effects = effect_parts[1:]
-                
+                pose, expression, outfit, effects = self._parse_emotion(actor, emotion)
                 self._layered_renderer.set_state(
                     actor,
                     pose=pose,
                     expression=expression,
                     outfit=outfit,
-                    effects=effects if effects else None,
+                    # 状态会持有该列表，每次给一份新的
+                    effects=list(effects) if effects else None,
                 )
-            self._pose_names[actor] = emotion
+                self._sync_order()
+            info.pose_name = emotion
             return
         
         # 传统模式
         base, _ = self.characters.get(actor, (None, None))
-        outfit = self._outfits.get(actor)
+        outfit = info.outfit
         pose = None
         
         if outfit:
@@ -235,7 +279,42 @@ class EnhancedCharacterLayer:
                 pose = None
         
         self.characters[actor] = (base, pose)
-        self._pose_names[actor] = str(emotion)
+        info.pose_name = str(emotion)
+        self._sync_order()
+    
+    def _parse_emotion(self, actor: str, emotion: str) -> _ParsedEmotion:
+        """解析差分模式的 emotion 字符串，结果按 (角色, emotion) 缓存
+        
+        缓存项记录解析时的 manifest，manifest 重新加载后自动失效。
+        """
+        manifest = self._layered_renderer._manifests.get(actor)
+        key = (actor, emotion)
+        cached = self._emotion_cache.get(key)
+        if cached is not None and cached[0] is manifest:
+            return cached[1]
+        
+        # 检查是否是复合格式 "pose:expression:outfit"
+        parts = emotion.split(":")
+        pose = parts[0] if len(parts) > 0 else None
+        expression = parts[1] if len(parts) > 1 else parts[0]
+        outfit = parts[2] if len(parts) > 2 else None
+        
+        # 检查 pose 是否有效，否则作为 expression
+        if pose and (manifest is None or pose not in manifest.poses):
+            # pose 实际上是 expression
+            expression = pose
+            pose = None
+        
+        # 检查是否有特效 (用 + 分隔) - 在确定 expression 后再分离
+        effects: Tuple[str, ...] = ()
+        if "+" in (expression or ""):
+            effect_parts = expression.split("+")
+            expression = effect_parts[0]
+            effects = tuple(effect_parts[1:])
+        
+        parsed = (pose, expression, outfit, effects)
+        self._emotion_cache[key] = (manifest, parsed)
+        return parsed
     
     def set_action(
         self,
@@ -245,13 +324,15 @@ class EnhancedCharacterLayer:
         make_pose_ph: Callable[[str], Surface],
     ) -> None:
         """设置动作"""
+        info = self._info(actor)
+        info.scaled = None
         if not action:
-            self._actions[actor] = None
-            self._action_names.pop(actor, None)
+            info.action = None
+            info.action_name = None
             return
         
         # 差分模式暂不支持 action，使用传统模式处理
-        outfit = self._outfits.get(actor)
+        outfit = info.outfit
         img = None
         
         if outfit:
@@ -279,8 +360,8 @@ class EnhancedCharacterLayer:
             else:
                 img = None
         
-        self._actions[actor] = img
-        self._action_names[actor] = str(action)
+        info.action = img
+        info.action_name = str(action)
     
     def add_effect(self, actor: str, effect: str) -> None:
         """添加特效（仅差分模式）"""
@@ -300,13 +381,13 @@ class EnhancedCharacterLayer:
     def remove(self, actor: str) -> None:
         """移除角色"""
         self.characters.pop(actor, None)
-        self._actions.pop(actor, None)
-        self._pose_names.pop(actor, None)
-        self._action_names.pop(actor, None)
-        self._use_layered.pop(actor, None)
+        info = self._actors.pop(actor, None)
+        if info is not None and info.outfit:
+            self._actors[actor] = ActorInfo(outfit=info.outfit)
         
         if self._layered_renderer:
             self._layered_renderer.remove_character(actor)
+        self._sync_order()
         
         if self.active_actor == actor:
             self.active_actor = None
@@ -314,146 +395,159 @@ class EnhancedCharacterLayer:
     def clear(self) -> None:
         """清除所有角色"""
         self.characters.clear()
-        self._actions.clear()
-        self._pose_names.clear()
-        self._action_names.clear()
-        self._use_layered.clear()
+        self._actors = {a: ActorInfo(outfit=i.outfit) for a, i in self._actors.items() if i.outfit}
         self.active_actor = None
         self._last_rects.clear()
         self._last_centers.clear()
         
         if self._layered_renderer:
             self._layered_renderer.clear()
+        self._render_order.clear()
+        self._order_cache = None
+    
+    def _sync_order(self) -> None:
+        """按当前角色集合更新渲染顺序：保留已有角色的先后，新角色排在最后"""
+        live = dict.fromkeys(self.characters)
+        if self._layered_renderer:
+            live.update(dict.fromkeys(self._layered_renderer.states))
+        order = {a: None for a in self._render_order if a in live}
+        order.update(live)
+        self._render_order = order
+        self._order_cache = None
+    
+    def _ordered_actors(self) -> List[str]:
+        """渲染顺序（活跃角色置后），仅在角色增删或 active_actor 变化时重建"""
+        layered_renderer = self._layered_renderer
+        sizes = (len(self.characters), len(layered_renderer.states) if layered_renderer else 0)
+        cached = self._order_cache
+        if cached is not None and cached[0] == sizes and cached[1] == self.active_actor:
+            return cached[2]
+        if cached is None or cached[0] != sizes:
+            # characters 也可能被直接修改，数量对不上时重新同步
+            self._sync_order()
+        active = self.active_actor
+        order = [a for a in self._render_order if a != active]
+        if active in self._render_order:
+            order.append(active)
+        self._order_cache = (sizes, active, order)
+        return order
     
     def render(self, canvas: Surface, animator: Animator, now_ms: int) -> None:
         """渲染所有角色"""
         if not HAS_PYGAME:
             return
         
-        # 收集所有要渲染的角色
-        actors_to_render = set(self.characters.keys())
-        if self._layered_renderer:
-            for actor in list(self._layered_renderer._states.keys()):
-                actors_to_render.add(actor)
-        
-        if not actors_to_render:
+        # 纯对话场景：没有任何角色时直接返回
+        layered_renderer = self._layered_renderer
+        if not self.characters and not (layered_renderer and layered_renderer.states):
             return
         
-        slot_positions = self._slots.get(
-            "positions",
-            [
-                (int(LOGICAL_SIZE[0] * 0.2), int(LOGICAL_SIZE[1] * 0.64)),
-                (int(LOGICAL_SIZE[0] * 0.5), int(LOGICAL_SIZE[1] * 0.64)),
-                (int(LOGICAL_SIZE[0] * 0.8), int(LOGICAL_SIZE[1] * 0.64)),
-            ],
-        )
-        slot_scale = float(self._slots.get("scale", 0.9))
-        order = list(actors_to_render)
-        eff_scale = slot_scale * (0.86 if len(order) >= 3 else 1.0)
+        # 要渲染的角色（活跃角色放最后，在最前面渲染）
+        order = self._ordered_actors()
+        
+        slot_positions = self._slot_positions
         n = len(order)
+        eff_scale = self._slot_scale * (0.86 if n >= 3 else 1.0)
         pos_count = max(1, len(slot_positions))
-        
-        if n == 1:
-            mid = 1 if pos_count >= 3 else (pos_count // 2)
-            slot_index_map = [mid]
-        elif n == 2:
-            if pos_count >= 3:
-                slot_index_map = [0, 2]
-            elif pos_count >= 2:
-                slot_index_map = [0, 1]
-            else:
-                slot_index_map = [0, 0]
-        else:
-            slot_index_map = [i % pos_count for i in range(n)]
-        
-        # 活跃角色放最后（在最前面渲染）
-        if self.active_actor in order:
-            order = [a for a in order if a != self.active_actor] + [self.active_actor]
+        slot_index_map = self._slot_maps.get(n) or [i % pos_count for i in range(n)]
         
         self._last_rects.clear()
         self._last_centers.clear()
+        dim_others = bool(self.active_actor)
+        # (surface, rect) in draw order, submitted in one batched call below
+        blits: List[Tuple[Surface, Any]] = []
+        actors = self._actors
+        
+        height = int(LOGICAL_SIZE[1] * eff_scale)
         
         for idx, actor in enumerate(order):
             si = slot_index_map[idx] if idx < len(slot_index_map) else (idx % pos_count)
             x, y = slot_positions[si]
             dx, dy = animator.offset(now_ms, actor, LOGICAL_SIZE[0], LOGICAL_SIZE[1])
-            cx, cy = int(x + dx), int(y + dy)
+            cx, cy = x + dx, y + dy
             
             # 检查是否有 action（action 优先）
-            act = self._actions.get(actor)
-            if act is not None:
-                a_s = scale_to_height(act, int(LOGICAL_SIZE[1] * eff_scale))
-                recta = a_s.get_rect(center=(cx, cy))
-                if self.active_actor and actor != self.active_actor:
-                    dim_a = a_s.copy()
-                    dim_a.fill((0, 0, 0, 80), special_flags=pygame.BLEND_RGBA_SUB)
-                    canvas.blit(dim_a, recta)
-                else:
-                    canvas.blit(a_s, recta)
-                self._last_rects[actor] = recta
-                self._last_centers[actor] = (cx, cy)
+            info = actors.get(actor) or self._info(actor)
+            body = info.action
+            if body is None and layered_renderer:
+                layered = info.layered
+                if layered is None:
+                    layered = self._is_layered(actor)
+                if layered:
+                    # 尝试差分模式
+                    body = layered_renderer.compose(actor)
+            if body is None:
+                # 传统模式
+                base, pose = self.characters.get(actor, (None, None))
+                body = pose if pose is not None else base
+            if body is None:
                 continue
-            
-            # 尝试差分模式
-            if self._is_layered(actor) and self._layered_renderer:
-                composed = self._layered_renderer.compose(actor)
-                if composed:
-                    scaled = scale_to_height(composed, int(LOGICAL_SIZE[1] * eff_scale))
-                    rect = scaled.get_rect(center=(cx, cy))
-                    if self.active_actor and actor != self.active_actor:
-                        dim = scaled.copy()
-                        dim.fill((0, 0, 0, 80), special_flags=pygame.BLEND_RGBA_SUB)
-                        canvas.blit(dim, rect)
-                    else:
-                        canvas.blit(scaled, rect)
-                    self._last_rects[actor] = rect
-                    self._last_centers[actor] = (cx, cy)
-                    continue
-            
-            # 传统模式
-            base, pose = self.characters.get(actor, (None, None))
-            body = pose if pose is not None else base
-            if body is not None:
-                b = scale_to_height(body, int(LOGICAL_SIZE[1] * eff_scale))
-                rect = b.get_rect(center=(cx, cy))
-                if self.active_actor and actor != self.active_actor:
-                    dim = b.copy()
-                    dim.fill((0, 0, 0, 80), special_flags=pygame.BLEND_RGBA_SUB)
-                    canvas.blit(dim, rect)
-                else:
-                    canvas.blit(b, rect)
-                self._last_rects[actor] = rect
-                self._last_centers[actor] = (cx, cy)
+            scaled = self._scaled(info, body, height,
+                                  dim_others and actor != self.active_actor)
+            rect = scaled.get_rect(center=(cx, cy))
+            blits.append((scaled, rect))
+            self._last_rects[actor] = rect
+            self._last_centers[actor] = (cx, cy)
+        
+        if blits:
+            # pygame-ce batches via fblits; classic pygame has blits
+            fblits = getattr(canvas, "fblits", None)
+            if fblits is not None:
+                fblits(blits)
+            else:
+                canvas.blits(blits, False)
     
-    def last_rects(self) -> Dict[str, Any]:
-        """获取角色渲染矩形"""
-        return dict(self._last_rects)
+    def _scaled(self, info: ActorInfo, body: Surface, height: int, dim: bool = False) -> Surface:
+        """body scaled to height (dimmed for non-active actors), reused while the source is unchanged.
+
+        The dimmed variant is built once per scaled sprite, on first use, instead of a
+        copy() + fill() every frame.
+        """
+        cached = info.scaled
+        # the cache holds body itself, so the identity check cannot hit a recycled id()
+        if cached is None or cached[0] is not body or cached[1] != height:
+            cached = (body, height, scale_to_height(body, height), None)
+            info.scaled = cached
+        if not dim:
+            return cached[2]
+        dimmed = cached[3]
+        if dimmed is None:
+            dimmed = cached[2].copy()
+            dimmed.fill((0, 0, 0, 80), special_flags=pygame.BLEND_RGBA_SUB)
+            info.scaled = (body, height, cached[2], dimmed)
+        return dimmed
     
-    def last_centers(self) -> Dict[str, Tuple[int, int]]:
-        """获取角色中心位置"""
-        return dict(self._last_centers)
+    def last_rects(self) -> Mapping[str, Any]:
+        """获取角色渲染矩形（只读视图，下一次 render 时更新；需要保留请自行 dict()）"""
+        return MappingProxyType(self._last_rects)
+    
+    def last_centers(self) -> Mapping[str, Tuple[int, int]]:
+        """获取角色中心位置（只读视图，同 last_rects）"""
+        return MappingProxyType(self._last_centers)
     
     def snapshot_characters(self) -> List[dict]:
         """获取角色快照（用于存档）"""
         data: List[dict] = []
-        
-        # 收集所有角色
-        all_actors = set(self.characters.keys())
-        if self._layered_renderer:
-            all_actors.update(self._layered_renderer._states.keys())
-        
-        for actor in all_actors:
+        layered_renderer = self._layered_renderer
+        
+        # 按登场顺序遍历在场角色（_ordered_actors 负责与 characters/差分状态同步）
+        self._ordered_actors()
+        for actor in self._render_order:
+            info = self._info(actor)
+            layered = info.layered
+            if layered is None:
+                layered = self._is_layered(actor)
             entry = {
                 "id": actor,
-                "outfit": self._outfits.get(actor),
-                "pose": self._pose_names.get(actor),
-                "action": self._action_names.get(actor),
-                "layered": self._is_layered(actor),
+                "outfit": info.outfit,
+                "pose": info.pose_name,
+                "action": info.action_name,
+                "layered": layered,
             }
             
             # 差分模式额外数据
-            if self._is_layered(actor) and self._layered_renderer:
-                state = self._layered_renderer.get_state(actor)
+            if layered and layered_renderer:
+                state = layered_renderer.get_state(actor)
                 if state:
                     entry["layered_state"] = {
                         "pose": state.pose,
@@ -525,7 +619,7 @@ class EnhancedCharacterLayer:
         """获取缓存统计"""
         stats = {
             "traditional_characters": len(self.characters),
-            "layered_mode": dict(self._use_layered),
+            "layered_mode": {a: i.layered for a, i in self._actors.items() if i.layered is not None},
         }
         if self._layered_renderer:
             stats["layered_renderer"] = self._layered_renderer.cache_stats()
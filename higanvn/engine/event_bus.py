@@ -8,6 +8,38 @@ from __future__ import annotations
 
 from typing import Any, Callable, DefaultDict, Dict, List
 from collections import defaultdict
+from itertools import islice
+import inspect
+import weakref
+
+
+class _WeakCallback:
+    """Bound-method listener held through a WeakMethod.
+
+    Compares equal to the method it wraps, so subscribe/unsubscribe can keep
+    using the bound method itself as the key.
+    """
+
+    __slots__ = ("_ref",)
+
+    def __init__(self, method: Callable[[Dict[str, Any]], None],
+                 on_dead: Callable[[Any], None]) -> None:
+        self._ref = weakref.WeakMethod(method, on_dead)
+
+    def __call__(self, data: Dict[str, Any]) -> None:
+        method = self._ref()
+        if method is not None:
+            method(data)
+
+    def __eq__(self, other: object) -> bool:
+        if other is self:
+            return True
+        if isinstance(other, _WeakCallback):
+            other = other._ref()
+        target = self._ref()
+        return target is not None and target == other
+
+    __hash__ = None  # type: ignore[assignment]
 
 
 class EventBus:
@@ -16,25 +48,53 @@ class EventBus:
     
     This is the legacy API. For new code, use EventSystem from events.py.
 
-    - subscribe(name, fn): register a callback
+    - subscribe(name, fn, weak=False): register a callback
     - unsubscribe(name, fn): remove callback
     - emit(name, **data): fire event with keyword payload
+
+    All listeners of one emit() receive the same payload dict; treat it as
+    read-only (each emit() call still gets a fresh dict from **data).
     """
 
     def __init__(self) -> None:
         self._subs: DefaultDict[str, List[Callable[[Dict[str, Any]], None]]] = defaultdict(list)
         self._emit_count: Dict[str, int] = defaultdict(int)
+        # event name -> emit() nesting depth while its listeners run
+        self._dispatching: Dict[str, int] = {}
+        # unsubscribes requested mid-dispatch, applied when the outermost emit returns
+        self._pending_removals: DefaultDict[str, List[Callable[[Dict[str, Any]], None]]] = (
+            defaultdict(list)
+        )
+
+    def subscribe(self, name: str, fn: Callable[[Dict[str, Any]], None],
+                  weak: bool = False) -> Callable[[], None]:
+        """Subscribe to event. Returns unsubscribe function.
 
-    def subscribe(self, name: str, fn: Callable[[Dict[str, Any]], None]) -> Callable[[], None]:
-        """Subscribe to event. Returns unsubscribe function."""
+        With weak=True a bound method is held through a weak reference: the
+        listener is dropped when its owner is garbage collected instead of
+        keeping the owner alive. Plain functions are always held strongly.
+        """
+        pending = self._pending_removals.get(name)
+        if pending and fn in pending:
+            # re-subscribed before a deferred unsubscribe was applied
+            pending.remove(fn)
+        entry = fn
         if fn not in self._subs[name]:
-            self._subs[name].append(fn)
+            if weak and inspect.ismethod(fn):
+                entry = _WeakCallback(fn, lambda _ref: self.unsubscribe(name, entry))
+            self._subs[name].append(entry)
         
         def unsubscribe():
-            self.unsubscribe(name, fn)
+            self.unsubscribe(name, entry)
         return unsubscribe
 
     def unsubscribe(self, name: str, fn: Callable[[Dict[str, Any]], None]) -> None:
+        if name in self._dispatching:
+            # emit() is walking this list; remove once it is done
+            subs = self._subs.get(name)
+            if subs and fn in subs:
+                self._pending_removals[name].append(fn)
+            return
         try:
             self._subs[name].remove(fn)
         except ValueError:
@@ -42,12 +102,28 @@ class EventBus:
 
     def emit(self, name: str, /, **data: Any) -> None:
         self._emit_count[name] += 1
-        for fn in list(self._subs.get(name, [])):
-            try:
-                fn(dict(data))
-            except Exception:
-                # Never let listeners crash the app
-                continue
+        subs = self._subs.get(name)
+        if not subs:
+            return
+        dispatching = self._dispatching
+        dispatching[name] = dispatching.get(name, 0) + 1
+        try:
+            # removals are deferred while dispatching, so the live list is walked without
+            # a copy; listeners subscribed meanwhile lie past the slice and wait for the next emit
+            for fn in islice(subs, len(subs)):
+                try:
+                    fn(data)
+                except Exception:
+                    # Never let listeners crash the app
+                    continue
+        finally:
+            depth = dispatching[name] - 1
+            if depth:
+                dispatching[name] = depth
+            else:
+                del dispatching[name]
+                for fn in self._pending_removals.pop(name, ()):
+                    self.unsubscribe(name, fn)
     
     def has_listeners(self, name: str) -> bool:
         """Check if event has any listeners."""
@@ -69,4 +145,5 @@ class EventBus:
         """Clear all subscriptions."""
         self._subs.clear()
         self._emit_count.clear()
+        self._pending_removals.clear()
 
@@ -13,20 +13,48 @@ Features:
 from __future__ import annotations
 
 import logging
+import sys
 import weakref
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import IntEnum, auto
+from types import MethodType
 from typing import (
-    Any, Callable, Dict, Generic, List, Optional, Set, Type, TypeVar, Union
+    Any, Callable, Dict, Generic, List, Optional, Sequence, Set, Type, TypeVar, Union
 )
-from collections import defaultdict
+from collections import defaultdict, deque
 import threading
-from queue import Queue, Empty
 import time
 
 logger = logging.getLogger(__name__)
 
 
+def _slotted_dataclass(cls: type) -> type:
+    """dataclass(slots=True) for interpreters whose dataclass lacks the slots flag.
+
+    Mirrors what the stdlib does on 3.10+: build the dataclass, then recreate the
+    class with __slots__ for its own fields and without the class-level defaults.
+    The generated __init__ assigns every init field; init=False fields need a
+    default_factory (see Event._cancelled).
+    """
+    cls = dataclass(cls)
+    inherited = set()
+    for base in cls.__mro__[1:-1]:
+        inherited.update(getattr(base, "__slots__", ()))
+    names = tuple(f.name for f in fields(cls))
+    ns = dict(cls.__dict__)
+    for name in names:
+        ns.pop(name, None)
+    ns.pop("__dict__", None)
+    ns.pop("__weakref__", None)
+    ns["__slots__"] = tuple(n for n in names if n not in inherited)
+    return type(cls)(cls.__name__, cls.__bases__, ns)
+
+
+# Events are created per input tick, so they are slotted and instances carry no
+# __dict__. Subclasses defined elsewhere with a plain @dataclass still work.
+_event_dataclass = dataclass(slots=True) if sys.version_info >= (3, 10) else _slotted_dataclass
+
+
 # ============================================================================
 # Event Priority
 # ============================================================================
@@ -41,15 +69,25 @@ class Priority(IntEnum):
     MONITOR = 200  # Read-only, cannot cancel events
 
 
+# module-level alias so the emit loop compares against a plain global, not an Enum attribute
+_MONITOR = Priority.MONITOR
+
+
 # ============================================================================
 # Base Event Classes
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class Event:
-    """Base class for all events."""
-    _cancelled: bool = field(default=False, init=False, repr=False)
-    _timestamp: float = field(default_factory=time.time, init=False, repr=False)
+    """Base class for all events.
+
+    timestamp is a time.perf_counter() reading: monotonic and meant for ordering
+    events and measuring intervals between them, not wall-clock time.
+    """
+    # a factory (not default=False) so __init__ always assigns it: with slots the class
+    # attribute is the slot descriptor, which plain-dataclass subclasses cannot fall back on
+    _cancelled: bool = field(default_factory=bool, init=False, repr=False)
+    _timestamp: float = field(default_factory=time.perf_counter, init=False, repr=False)
     
     @property
     def cancelled(self) -> bool:
@@ -64,7 +102,7 @@ class Event:
         return self._timestamp
 
 
-@dataclass
+@_event_dataclass
 class CancellableEvent(Event):
     """Event that can be cancelled to prevent default behavior."""
     pass
@@ -74,13 +112,13 @@ class CancellableEvent(Event):
 # Engine Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class EngineLoadEvent(Event):
     """Fired when a program is loaded into the engine."""
     op_count: int = 0
 
 
-@dataclass
+@_event_dataclass
 class EngineStepEvent(Event):
     """Fired before/after each engine step."""
     ip: int = 0
@@ -88,7 +126,7 @@ class EngineStepEvent(Event):
     phase: str = "before"  # "before" or "after"
 
 
-@dataclass
+@_event_dataclass
 class TextShowEvent(CancellableEvent):
     """Fired when text is about to be displayed."""
     speaker: Optional[str] = None
@@ -96,7 +134,7 @@ class TextShowEvent(CancellableEvent):
     meta: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@_event_dataclass
 class CommandEvent(CancellableEvent):
     """Fired when a command is about to be executed."""
     name: str = ""
@@ -104,19 +142,19 @@ class CommandEvent(CancellableEvent):
     line: Optional[int] = None
 
 
-@dataclass
+@_event_dataclass
 class LabelEnterEvent(Event):
     """Fired when execution enters a label."""
     name: str = ""
 
 
-@dataclass
+@_event_dataclass
 class ChoiceShowEvent(Event):
     """Fired when choices are about to be displayed."""
     choices: List[tuple] = field(default_factory=list)  # [(text, target), ...]
 
 
-@dataclass 
+@_event_dataclass
 class ChoiceSelectEvent(Event):
     """Fired when user selects a choice."""
     index: int = 0
@@ -128,13 +166,13 @@ class ChoiceSelectEvent(Event):
 # Input Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class InputEvent(CancellableEvent):
     """Base class for input events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class KeyDownEvent(InputEvent):
     """Fired when a key is pressed."""
     key: int = 0
@@ -142,14 +180,14 @@ class KeyDownEvent(InputEvent):
     unicode: str = ""
 
 
-@dataclass
+@_event_dataclass
 class KeyUpEvent(InputEvent):
     """Fired when a key is released."""
     key: int = 0
     mods: int = 0
 
 
-@dataclass
+@_event_dataclass
 class MouseClickEvent(InputEvent):
     """Fired on mouse button press."""
     button: int = 1
@@ -157,20 +195,20 @@ class MouseClickEvent(InputEvent):
     canvas_pos: Optional[tuple] = None  # Transformed to canvas coordinates
 
 
-@dataclass
+@_event_dataclass
 class MouseWheelEvent(InputEvent):
     """Fired on mouse wheel scroll."""
     x: int = 0
     y: int = 0  # positive = up, negative = down
 
 
-@dataclass
+@_event_dataclass
 class AdvanceRequestEvent(CancellableEvent):
     """Fired when user requests to advance text."""
     source: str = "unknown"  # "keyboard", "mouse", "wheel", "auto"
 
 
-@dataclass
+@_event_dataclass
 class MouseMoveEvent(InputEvent):
     """Fired when mouse moves."""
     pos: tuple = (0, 0)
@@ -178,14 +216,14 @@ class MouseMoveEvent(InputEvent):
     canvas_pos: Optional[tuple] = None
 
 
-@dataclass
+@_event_dataclass
 class MouseButtonUpEvent(InputEvent):
     """Fired on mouse button release."""
     button: int = 1
     pos: tuple = (0, 0)
 
 
-@dataclass
+@_event_dataclass
 class ControllerButtonEvent(InputEvent):
     """Fired for controller/gamepad button input."""
     button: int = 0
@@ -193,7 +231,7 @@ class ControllerButtonEvent(InputEvent):
     controller_id: int = 0
 
 
-@dataclass
+@_event_dataclass
 class ControllerAxisEvent(InputEvent):
     """Fired for controller/gamepad axis input."""
     axis: int = 0
@@ -201,7 +239,7 @@ class ControllerAxisEvent(InputEvent):
     controller_id: int = 0
 
 
-@dataclass
+@_event_dataclass
 class TouchEvent(InputEvent):
     """Fired for touch screen input."""
     touch_id: int = 0
@@ -213,59 +251,59 @@ class TouchEvent(InputEvent):
 # UI Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class UIEvent(Event):
     """Base class for UI-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class BacklogToggleEvent(UIEvent):
     """Fired when backlog visibility is toggled."""
     visible: bool = False
 
 
-@dataclass
+@_event_dataclass
 class UIHiddenEvent(UIEvent):
     """Fired when UI visibility is toggled."""
     hidden: bool = False
 
 
-@dataclass
+@_event_dataclass
 class BannerShowEvent(UIEvent):
     """Fired when a banner message is displayed."""
     message: str = ""
     color: tuple = (255, 255, 255)
 
 
-@dataclass
+@_event_dataclass
 class MenuOpenEvent(CancellableEvent):
     """Fired when a menu is about to open."""
     menu_type: str = ""  # "save", "load", "settings", "title"
 
 
-@dataclass
+@_event_dataclass
 class MenuCloseEvent(UIEvent):
     """Fired when a menu closes."""
     menu_type: str = ""
     result: Any = None
 
 
-@dataclass
+@_event_dataclass
 class TitleMenuEvent(UIEvent):
     """Fired for title menu interactions."""
     action: str = ""  # "open", "select", "close"
     selection: str = ""  # "start", "load", "settings", "gallery", "quit"
 
 
-@dataclass
+@_event_dataclass
 class GameStartEvent(Event):
     """Fired when game starts (from title menu or load)."""
     from_load: bool = False
     slot: Optional[int] = None
 
 
-@dataclass
+@_event_dataclass
 class GameQuitEvent(CancellableEvent):
     """Fired when user tries to quit the game."""
     from_title: bool = False
@@ -275,28 +313,28 @@ class GameQuitEvent(CancellableEvent):
 # Save/Load Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SaveEvent(CancellableEvent):
     """Fired before saving."""
     slot: int = 0
     is_quicksave: bool = False
 
 
-@dataclass
+@_event_dataclass
 class SaveCompleteEvent(Event):
     """Fired after successful save."""
     slot: int = 0
     success: bool = True
 
 
-@dataclass
+@_event_dataclass
 class LoadEvent(CancellableEvent):
     """Fired before loading."""
     slot: int = 0
     is_quickload: bool = False
 
 
-@dataclass
+@_event_dataclass
 class LoadCompleteEvent(Event):
     """Fired after successful load."""
     slot: int = 0
@@ -307,13 +345,13 @@ class LoadCompleteEvent(Event):
 # Audio Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class AudioEvent(Event):
     """Base class for audio events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class BGMPlayEvent(AudioEvent):
     """Fired when BGM starts playing."""
     path: str = ""
@@ -321,19 +359,19 @@ class BGMPlayEvent(AudioEvent):
     fade_in: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class BGMStopEvent(AudioEvent):
     """Fired when BGM stops."""
     fade_out: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class SEPlayEvent(AudioEvent):
     """Fired when a sound effect plays."""
     path: str = ""
 
 
-@dataclass
+@_event_dataclass
 class VoicePlayEvent(AudioEvent):
     """Fired when voice audio plays."""
     path: str = ""
@@ -344,14 +382,14 @@ class VoicePlayEvent(AudioEvent):
 # Transition Events  
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class TransitionStartEvent(Event):
     """Fired when a visual transition starts."""
     transition_type: str = ""
     duration: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class TransitionEndEvent(Event):
     """Fired when a visual transition completes."""
     transition_type: str = ""
@@ -361,13 +399,13 @@ class TransitionEndEvent(Event):
 # Resource Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class ResourceEvent(Event):
     """Base class for resource events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class ResourceLoadEvent(ResourceEvent):
     """Fired when a resource is loaded."""
     resource_type: str = ""  # "bg", "ch", "cg", "bgm", "se", "voice"
@@ -376,7 +414,7 @@ class ResourceLoadEvent(ResourceEvent):
     load_time_ms: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class ResourcePreloadEvent(ResourceEvent):
     """Fired during preloading."""
     total: int = 0
@@ -384,7 +422,7 @@ class ResourcePreloadEvent(ResourceEvent):
     current_path: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CacheEvictEvent(ResourceEvent):
     """Fired when a resource is evicted from cache."""
     path: str = ""
@@ -395,27 +433,27 @@ class CacheEvictEvent(ResourceEvent):
 # Debug Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class DebugEvent(Event):
     """Base class for debug events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class DebugToggleEvent(DebugEvent):
     """Fired when debug mode is toggled."""
     enabled: bool = False
     debug_type: str = ""  # "hud", "window"
 
 
-@dataclass
+@_event_dataclass
 class ScreenshotEvent(Event):
     """Fired when a screenshot is taken."""
     path: str = ""
     success: bool = True
 
 
-@dataclass
+@_event_dataclass
 class FlowMapEvent(Event):
     """Fired for flow map interactions."""
     action: str = ""  # "open", "close", "select"
@@ -426,13 +464,13 @@ class FlowMapEvent(Event):
 # Mode Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class AutoModeEvent(Event):
     """Fired when auto mode is toggled."""
     enabled: bool = False
 
 
-@dataclass
+@_event_dataclass
 class FastForwardEvent(Event):
     """Fired when fast forward mode changes."""
     enabled: bool = False
@@ -443,13 +481,13 @@ class FastForwardEvent(Event):
 # Scene/Visual Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SceneEvent(Event):
     """Base class for scene-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class BackgroundChangeEvent(SceneEvent):
     """Fired when background changes."""
     path: Optional[str] = None
@@ -457,25 +495,25 @@ class BackgroundChangeEvent(SceneEvent):
     transition: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CGShowEvent(SceneEvent):
     """Fired when CG is shown."""
     path: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CGHideEvent(SceneEvent):
     """Fired when CG is hidden."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class CharacterEvent(Event):
     """Base class for character-related events."""
     actor: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CharacterShowEvent(CharacterEvent):
     """Fired when a character appears on screen."""
     pose: str = "base"
@@ -483,27 +521,27 @@ class CharacterShowEvent(CharacterEvent):
     first_appearance: bool = False
 
 
-@dataclass
+@_event_dataclass
 class CharacterHideEvent(CharacterEvent):
     """Fired when a character is hidden."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class CharacterPoseChangeEvent(CharacterEvent):
     """Fired when character pose/expression changes."""
     old_pose: str = ""
     new_pose: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CharacterOutfitChangeEvent(CharacterEvent):
     """Fired when character outfit changes."""
     old_outfit: Optional[str] = None
     new_outfit: Optional[str] = None
 
 
-@dataclass
+@_event_dataclass
 class CharacterActionEvent(CharacterEvent):
     """Fired when character performs an action animation."""
     action: str = ""
@@ -513,13 +551,13 @@ class CharacterActionEvent(CharacterEvent):
 # Effect Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class EffectEvent(Event):
     """Base class for visual effects."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class ShakeEffectEvent(EffectEvent):
     """Fired when shake effect is triggered."""
     target: str = ""  # actor name or "screen"
@@ -528,7 +566,7 @@ class ShakeEffectEvent(EffectEvent):
     direction: str = "x"  # "x", "y", "both"
 
 
-@dataclass
+@_event_dataclass
 class SlideEffectEvent(EffectEvent):
     """Fired when slide effect is triggered."""
     target: str = ""
@@ -537,7 +575,7 @@ class SlideEffectEvent(EffectEvent):
     distance: int = 120
 
 
-@dataclass
+@_event_dataclass
 class FadeEffectEvent(EffectEvent):
     """Fired for fade effects."""
     fade_type: str = ""  # "in", "out"
@@ -549,13 +587,13 @@ class FadeEffectEvent(EffectEvent):
 # Navigation Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class NavigationEvent(Event):
     """Base class for navigation events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class RewindEvent(NavigationEvent):
     """Fired when player rewinds to previous text."""
     from_ip: int = 0
@@ -563,14 +601,14 @@ class RewindEvent(NavigationEvent):
     success: bool = True
 
 
-@dataclass
+@_event_dataclass
 class HistoryScrollEvent(NavigationEvent):
     """Fired when scrolling through text history."""
     direction: str = ""  # "up", "down"
     lines: int = 1
 
 
-@dataclass
+@_event_dataclass
 class JumpToLabelEvent(CancellableEvent):
     """Fired when jumping to a label."""
     target_label: str = ""
@@ -581,20 +619,20 @@ class JumpToLabelEvent(CancellableEvent):
 # Typewriter Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class TypewriterEvent(Event):
     """Base class for typewriter-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class TypewriterStartEvent(TypewriterEvent):
     """Fired when typewriter animation starts."""
     text: str = ""
     total_chars: int = 0
 
 
-@dataclass
+@_event_dataclass
 class TypewriterProgressEvent(TypewriterEvent):
     """Fired as typewriter progresses."""
     revealed_chars: int = 0
@@ -602,14 +640,14 @@ class TypewriterProgressEvent(TypewriterEvent):
     percent: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class TypewriterCompleteEvent(TypewriterEvent):
     """Fired when typewriter animation completes."""
     text: str = ""
     was_skipped: bool = False
 
 
-@dataclass
+@_event_dataclass
 class TypewriterSkipEvent(TypewriterEvent):
     """Fired when player skips typewriter animation."""
     pass
@@ -619,25 +657,25 @@ class TypewriterSkipEvent(TypewriterEvent):
 # Gallery Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class GalleryEvent(Event):
     """Base class for gallery events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class GalleryOpenEvent(GalleryEvent):
     """Fired when gallery is opened."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class GalleryCloseEvent(GalleryEvent):
     """Fired when gallery is closed."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class GalleryUnlockEvent(GalleryEvent):
     """Fired when a new CG is unlocked."""
     cg_id: str = ""
@@ -648,25 +686,25 @@ class GalleryUnlockEvent(GalleryEvent):
 # Settings Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SettingsEvent(Event):
     """Base class for settings events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SettingsOpenEvent(SettingsEvent):
     """Fired when settings menu opens."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SettingsCloseEvent(SettingsEvent):
     """Fired when settings menu closes."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SettingsChangeEvent(SettingsEvent):
     """Fired when a setting value changes."""
     setting_name: str = ""
@@ -674,7 +712,7 @@ class SettingsChangeEvent(SettingsEvent):
     new_value: Any = None
 
 
-@dataclass
+@_event_dataclass
 class VolumeChangeEvent(SettingsEvent):
     """Fired when volume setting changes."""
     channel: str = ""  # "master", "bgm", "se", "voice"
@@ -682,7 +720,7 @@ class VolumeChangeEvent(SettingsEvent):
     new_value: float = 1.0
 
 
-@dataclass
+@_event_dataclass
 class TypewriterSpeedChangeEvent(SettingsEvent):
     """Fired when typewriter speed changes."""
     old_speed: float = 1.0
@@ -693,26 +731,26 @@ class TypewriterSpeedChangeEvent(SettingsEvent):
 # Window Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class WindowEvent(Event):
     """Base class for window events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class WindowResizeEvent(WindowEvent):
     """Fired when window is resized."""
     old_size: tuple = (0, 0)
     new_size: tuple = (0, 0)
 
 
-@dataclass
+@_event_dataclass
 class WindowFocusEvent(WindowEvent):
     """Fired when window gains or loses focus."""
     focused: bool = True
 
 
-@dataclass
+@_event_dataclass
 class FullscreenToggleEvent(WindowEvent):
     """Fired when fullscreen mode is toggled."""
     fullscreen: bool = False
@@ -722,7 +760,7 @@ class FullscreenToggleEvent(WindowEvent):
 # Error Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class ErrorEvent(Event):
     """Fired when an error occurs."""
     error_type: str = ""
@@ -731,7 +769,7 @@ class ErrorEvent(Event):
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@_event_dataclass
 class WarningEvent(Event):
     """Fired for non-critical warnings."""
     warning_type: str = ""
@@ -742,27 +780,27 @@ class WarningEvent(Event):
 # Script/Flow Control Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class ScriptEvent(Event):
     """Base class for script-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class ScriptLoadEvent(ScriptEvent):
     """Fired when a script file is loaded."""
     path: str = ""
     op_count: int = 0
 
 
-@dataclass
+@_event_dataclass
 class ScriptExecEvent(ScriptEvent):
     """Fired when SCRIPT command executes Python code."""
     code: str = ""
     result: Any = None
 
 
-@dataclass
+@_event_dataclass
 class VariableChangeEvent(ScriptEvent):
     """Fired when a script variable changes."""
     name: str = ""
@@ -771,13 +809,13 @@ class VariableChangeEvent(ScriptEvent):
     source: str = ""  # "SET", "SCRIPT", "CHOICE", etc.
 
 
-@dataclass
+@_event_dataclass
 class WaitEvent(ScriptEvent):
     """Fired when WAIT command pauses execution."""
     duration_ms: int = 0
 
 
-@dataclass
+@_event_dataclass
 class ConditionalEvent(ScriptEvent):
     """Fired for IF/ELSEIF/ELSE/SWITCH conditional execution."""
     condition_type: str = ""  # "IF", "ELSEIF", "ELSE", "SWITCH", "CASE"
@@ -785,7 +823,7 @@ class ConditionalEvent(ScriptEvent):
     result: bool = False
 
 
-@dataclass
+@_event_dataclass
 class GotoEvent(ScriptEvent):
     """Fired when GOTO command jumps to a label."""
     target_label: str = ""
@@ -796,27 +834,27 @@ class GotoEvent(ScriptEvent):
 # Choice System Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class ChoiceEvent(Event):
     """Base class for choice-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class ChoicePresentEvent(ChoiceEvent):
     """Fired before choices are presented to user."""
-    choices: List[str] = field(default_factory=list)
-    targets: List[str] = field(default_factory=list)
+    choices: Sequence[str] = ()
+    targets: Sequence[str] = ()
 
 
-@dataclass
+@_event_dataclass
 class ChoiceHoverEvent(ChoiceEvent):
     """Fired when hovering over a choice option."""
     index: int = 0
     text: str = ""
 
 
-@dataclass
+@_event_dataclass
 class ChoiceTimeoutEvent(CancellableEvent):
     """Fired if choice times out (for timed choices)."""
     default_index: int = 0
@@ -826,13 +864,13 @@ class ChoiceTimeoutEvent(CancellableEvent):
 # Slot/Save UI Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SlotUIEvent(UIEvent):
     """Base class for slot UI events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SlotSelectEvent(SlotUIEvent):
     """Fired when a save slot is selected."""
     slot_id: int = 0
@@ -840,27 +878,27 @@ class SlotSelectEvent(SlotUIEvent):
     has_data: bool = False
 
 
-@dataclass
+@_event_dataclass
 class SlotHoverEvent(SlotUIEvent):
     """Fired when hovering over a save slot."""
     slot_id: int = 0
     has_data: bool = False
 
 
-@dataclass
+@_event_dataclass
 class SlotDeleteEvent(CancellableEvent):
     """Fired when a slot is about to be deleted."""
     slot_id: int = 0
 
 
-@dataclass
+@_event_dataclass
 class SlotDeleteCompleteEvent(Event):
     """Fired after a slot is deleted."""
     slot_id: int = 0
     success: bool = True
 
 
-@dataclass
+@_event_dataclass
 class SlotPageChangeEvent(SlotUIEvent):
     """Fired when changing pages in slot UI."""
     old_page: int = 0
@@ -871,13 +909,13 @@ class SlotPageChangeEvent(SlotUIEvent):
 # Animation Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class AnimationEvent(Event):
     """Base class for animation events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class AnimationStartEvent(AnimationEvent):
     """Fired when an animation starts."""
     target: str = ""
@@ -885,7 +923,7 @@ class AnimationStartEvent(AnimationEvent):
     duration_ms: int = 0
 
 
-@dataclass
+@_event_dataclass
 class AnimationEndEvent(AnimationEvent):
     """Fired when an animation completes."""
     target: str = ""
@@ -893,7 +931,7 @@ class AnimationEndEvent(AnimationEvent):
     completed: bool = True  # False if interrupted
 
 
-@dataclass
+@_event_dataclass
 class AnimationCancelEvent(AnimationEvent):
     """Fired when an animation is cancelled."""
     target: str = ""
@@ -904,13 +942,13 @@ class AnimationCancelEvent(AnimationEvent):
 # Voice/Lip Sync Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class VoiceEvent(AudioEvent):
     """Base class for voice-specific events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class VoiceStartEvent(VoiceEvent):
     """Fired when voice audio starts playing."""
     path: str = ""
@@ -918,14 +956,14 @@ class VoiceStartEvent(VoiceEvent):
     duration_ms: int = 0
 
 
-@dataclass
+@_event_dataclass
 class VoiceEndEvent(VoiceEvent):
     """Fired when voice audio finishes."""
     path: str = ""
     was_stopped: bool = False  # True if manually stopped
 
 
-@dataclass
+@_event_dataclass
 class VoiceVolumeChangeEvent(VoiceEvent):
     """Fired when voice volume changes."""
     old_volume: float = 1.0
@@ -936,31 +974,31 @@ class VoiceVolumeChangeEvent(VoiceEvent):
 # Text Panel Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class TextPanelEvent(UIEvent):
     """Base class for text panel events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class TextPanelShowEvent(TextPanelEvent):
     """Fired when text panel becomes visible."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class TextPanelHideEvent(TextPanelEvent):
     """Fired when text panel is hidden."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class TextClearEvent(TextPanelEvent):
     """Fired when text is cleared."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SpeakerChangeEvent(TextPanelEvent):
     """Fired when the speaking character changes."""
     old_speaker: Optional[str] = None
@@ -971,26 +1009,26 @@ class SpeakerChangeEvent(TextPanelEvent):
 # Quick Save/Load Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class QuickSaveEvent(CancellableEvent):
     """Fired when quick save is triggered."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class QuickSaveCompleteEvent(Event):
     """Fired after quick save completes."""
     success: bool = True
     path: str = ""
 
 
-@dataclass
+@_event_dataclass
 class QuickLoadEvent(CancellableEvent):
     """Fired when quick load is triggered."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class QuickLoadCompleteEvent(Event):
     """Fired after quick load completes."""
     success: bool = True
@@ -1001,19 +1039,19 @@ class QuickLoadCompleteEvent(Event):
 # Skip Mode Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SkipModeEvent(Event):
     """Base class for skip mode events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SkipModeEnterEvent(SkipModeEvent):
     """Fired when skip mode is entered."""
     skip_type: str = ""  # "all", "read", "held"
 
 
-@dataclass
+@_event_dataclass
 class SkipModeExitEvent(SkipModeEvent):
     """Fired when skip mode is exited."""
     reason: str = ""  # "user", "choice", "unread"
@@ -1023,13 +1061,13 @@ class SkipModeExitEvent(SkipModeEvent):
 # Backlog/History Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class BacklogEvent(Event):
     """Base class for backlog events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class BacklogEntryAddEvent(BacklogEvent):
     """Fired when a new entry is added to backlog."""
     speaker: Optional[str] = None
@@ -1037,13 +1075,13 @@ class BacklogEntryAddEvent(BacklogEvent):
     entry_index: int = 0
 
 
-@dataclass
+@_event_dataclass
 class BacklogJumpEvent(CancellableEvent):
     """Fired when user tries to jump from backlog."""
     target_index: int = 0
 
 
-@dataclass
+@_event_dataclass
 class BacklogVoiceReplayEvent(BacklogEvent):
     """Fired when replaying voice from backlog."""
     entry_index: int = 0
@@ -1054,40 +1092,40 @@ class BacklogVoiceReplayEvent(BacklogEvent):
 # System Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class SystemEvent(Event):
     """Base class for system events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class LanguageChangeEvent(SystemEvent):
     """Fired when language setting changes."""
     old_language: str = ""
     new_language: str = ""
 
 
-@dataclass
+@_event_dataclass
 class FontSizeChangeEvent(SystemEvent):
     """Fired when font size changes."""
     old_size: int = 24
     new_size: int = 24
 
 
-@dataclass
+@_event_dataclass
 class DisplayModeChangeEvent(SystemEvent):
     """Fired when display mode changes."""
     old_mode: str = ""  # "windowed", "fullscreen", "borderless"
     new_mode: str = ""
 
 
-@dataclass
+@_event_dataclass
 class VSyncChangeEvent(SystemEvent):
     """Fired when vsync setting changes."""
     enabled: bool = False
 
 
-@dataclass
+@_event_dataclass
 class FrameRateEvent(SystemEvent):
     """Fired for frame rate monitoring."""
     current_fps: float = 0.0
@@ -1098,26 +1136,26 @@ class FrameRateEvent(SystemEvent):
 # Accessibility Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class AccessibilityEvent(Event):
     """Base class for accessibility events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class TextToSpeechEvent(AccessibilityEvent):
     """Fired when text-to-speech reads text."""
     text: str = ""
     speaker: Optional[str] = None
 
 
-@dataclass
+@_event_dataclass
 class HighContrastModeEvent(AccessibilityEvent):
     """Fired when high contrast mode changes."""
     enabled: bool = False
 
 
-@dataclass
+@_event_dataclass
 class LargeTextModeEvent(AccessibilityEvent):
     """Fired when large text mode changes."""
     enabled: bool = False
@@ -1128,25 +1166,25 @@ class LargeTextModeEvent(AccessibilityEvent):
 # Game State Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class GameStateEvent(Event):
     """Base class for game state events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class GamePauseEvent(GameStateEvent):
     """Fired when game is paused."""
     reason: str = ""  # "menu", "focus_lost", "manual"
 
 
-@dataclass
+@_event_dataclass
 class GameResumeEvent(GameStateEvent):
     """Fired when game is resumed from pause."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SceneTransitionEvent(GameStateEvent):
     """Fired when transitioning between scenes/chapters."""
     from_scene: str = ""
@@ -1154,20 +1192,20 @@ class SceneTransitionEvent(GameStateEvent):
     transition_type: str = ""
 
 
-@dataclass
+@_event_dataclass
 class ChapterStartEvent(GameStateEvent):
     """Fired when a new chapter begins."""
     chapter_id: str = ""
     chapter_name: str = ""
 
 
-@dataclass
+@_event_dataclass
 class ChapterEndEvent(GameStateEvent):
     """Fired when a chapter ends."""
     chapter_id: str = ""
 
 
-@dataclass
+@_event_dataclass
 class EndingReachEvent(GameStateEvent):
     """Fired when an ending is reached."""
     ending_id: str = ""
@@ -1175,24 +1213,24 @@ class EndingReachEvent(GameStateEvent):
     ending_type: str = ""  # "good", "bad", "neutral", "true"
 
 
-@dataclass
+@_event_dataclass
 class NewGamePlusEvent(GameStateEvent):
     """Fired when starting new game plus."""
     clear_count: int = 0
-    unlocked_features: List[str] = field(default_factory=list)
+    unlocked_features: Sequence[str] = ()
 
 
 # ============================================================================
 # Plugin/Extension Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class PluginEvent(Event):
     """Base class for plugin-related events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class PluginLoadEvent(PluginEvent):
     """Fired when a plugin is loaded."""
     plugin_id: str = ""
@@ -1200,20 +1238,20 @@ class PluginLoadEvent(PluginEvent):
     version: str = ""
 
 
-@dataclass
+@_event_dataclass
 class PluginUnloadEvent(PluginEvent):
     """Fired when a plugin is unloaded."""
     plugin_id: str = ""
 
 
-@dataclass
+@_event_dataclass
 class PluginErrorEvent(PluginEvent):
     """Fired when a plugin encounters an error."""
     plugin_id: str = ""
     error: str = ""
 
 
-@dataclass
+@_event_dataclass
 class CustomCommandEvent(CancellableEvent):
     """Fired for custom/plugin-defined commands."""
     command_name: str = ""
@@ -1224,26 +1262,26 @@ class CustomCommandEvent(CancellableEvent):
 # Telemetry/Analytics Events (for optional analytics)
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class TelemetryEvent(Event):
     """Base class for telemetry events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class SessionStartEvent(TelemetryEvent):
     """Fired when a game session starts."""
     session_id: str = ""
 
 
-@dataclass
+@_event_dataclass
 class SessionEndEvent(TelemetryEvent):
     """Fired when a game session ends."""
     session_id: str = ""
     play_time_seconds: float = 0.0
 
 
-@dataclass
+@_event_dataclass
 class MilestoneEvent(TelemetryEvent):
     """Fired when player reaches a milestone."""
     milestone_id: str = ""
@@ -1254,20 +1292,20 @@ class MilestoneEvent(TelemetryEvent):
 # Hotkey Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class HotkeyEvent(Event):
     """Base class for hotkey events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class HotkeyTriggerEvent(HotkeyEvent):
     """Fired when a hotkey combination is triggered."""
     action: str = ""  # "quicksave", "quickload", "screenshot", etc.
     key_combination: str = ""  # e.g., "Ctrl+S"
 
 
-@dataclass
+@_event_dataclass
 class HotkeyRegisterEvent(HotkeyEvent):
     """Fired when a new hotkey is registered."""
     action: str = ""
@@ -1278,20 +1316,20 @@ class HotkeyRegisterEvent(HotkeyEvent):
 # Localization Events
 # ============================================================================
 
-@dataclass
+@_event_dataclass
 class LocalizationEvent(Event):
     """Base class for localization events."""
     pass
 
 
-@dataclass
+@_event_dataclass
 class LocaleLoadEvent(LocalizationEvent):
     """Fired when a locale is loaded."""
     locale_id: str = ""
     strings_count: int = 0
 
 
-@dataclass
+@_event_dataclass
 class MissingTranslationEvent(LocalizationEvent):
     """Fired when a translation is missing."""
     key: str = ""
@@ -1311,25 +1349,29 @@ class Listener(Generic[T]):
     priority: Priority = Priority.NORMAL
     once: bool = False
     weak: bool = False
-    _ref: Optional[weakref.ref] = field(default=None, init=False, repr=False)
+    # set only for weak bound-method listeners; None means callback is called directly
+    _ref: Optional[weakref.WeakMethod] = field(default=None, init=False, repr=False)
     
     def __post_init__(self):
-        if self.weak and hasattr(self.callback, '__self__'):
-            # Create weak reference for bound methods
-            obj = self.callback.__self__
-            method_name = self.callback.__name__
-            self._ref = weakref.ref(obj)
-            self._method_name = method_name
+        if self.weak and isinstance(self.callback, MethodType):
+            # Hold bound methods weakly; callback keeps only the plain function so the
+            # listener no longer pins the owning object
+            self._ref = weakref.WeakMethod(self.callback)
+            self.callback = self.callback.__func__
+    
+    def matches(self, callback: Callable[[T], None]) -> bool:
+        """Check whether this listener was registered for callback."""
+        if self._ref is not None:
+            return self._ref() == callback
+        return self.callback == callback
     
     def invoke(self, event: T) -> bool:
         """Invoke the callback. Returns False if listener is dead (weak ref expired)."""
-        if self.weak and self._ref is not None:
-            obj = self._ref()
-            if obj is None:
+        if self._ref is not None:
+            method = self._ref()
+            if method is None:
                 return False
-            method = getattr(obj, self._method_name, None)
-            if method:
-                method(event)
+            method(event)
         else:
             self.callback(event)
         return True
@@ -1370,9 +1412,14 @@ class EventSystem:
     
     def __init__(self, debug: bool = False):
         self._listeners: Dict[Type[Event], List[Listener]] = defaultdict(list)
+        # per-type snapshot handed to emit(), one (callback, is_monitor, is_strong, once,
+        # listener) row per listener so the loop unpacks instead of loading attributes;
+        # dropped whenever that type's listeners change
+        self._resolved: Dict[Type[Event], tuple] = {}
         self._lock = threading.RLock()
         self._debug = debug
-        self._queue: Queue[Event] = Queue()
+        # deque append/popleft are atomic, so producers on other threads need no lock
+        self._queue: deque[Event] = deque()
         self._processing = False
         
         # Statistics
@@ -1409,9 +1456,13 @@ class EventSystem:
         
         with self._lock:
             listeners = self._listeners[event_type]
-            listeners.append(listener)
-            # Sort by priority (highest first)
-            listeners.sort(key=lambda l: l.priority, reverse=True)
+            # Insert in priority order (highest first, ties in subscription order),
+            # so the list never needs re-sorting
+            i = len(listeners)
+            while i and listeners[i - 1].priority < priority:
+                i -= 1
+            listeners.insert(i, listener)
+            self._resolved.pop(event_type, None)
         
         if self._debug:
             logger.debug(f"Subscribed to {event_type.__name__} with priority {priority.name}")
@@ -1426,8 +1477,9 @@ class EventSystem:
         with self._lock:
             listeners = self._listeners.get(event_type, [])
             for i, listener in enumerate(listeners):
-                if listener.callback == callback:
+                if listener.matches(callback):
                     listeners.pop(i)
+                    self._resolved.pop(event_type, None)
                     if self._debug:
                         logger.debug(f"Unsubscribed from {event_type.__name__}")
                     return True
@@ -1467,21 +1519,35 @@ class EventSystem:
         if self._debug:
             logger.debug(f"Emitting {event_type.__name__}: {event}")
         
-        with self._lock:
-            listeners = list(self._listeners.get(event_type, []))
+        rows = self._resolved.get(event_type)
+        if rows is None:
+            with self._lock:
+                rows = tuple(
+                    (l.callback, l.priority == _MONITOR, l._ref is None, l.once, l)
+                    for l in self._listeners.get(event_type, ())
+                )
+                self._resolved[event_type] = rows
+        if not rows:
+            return event
         
-        to_remove: List[Listener] = []
+        # allocated only when a dead/once listener actually needs removing
+        to_remove: Optional[List[Listener]] = None
         
-        for listener in listeners:
-            # Skip if cancelled (unless MONITOR priority)
-            if event.cancelled and listener.priority != Priority.MONITOR:
+        for callback, is_monitor, is_strong, once, listener in rows:
+            # Skip if cancelled (unless MONITOR priority); reads the slot, not the property
+            if event._cancelled and not is_monitor:
                 continue
             
             try:
-                alive = listener.invoke(event)
-                if not alive:
-                    to_remove.append(listener)
-                elif listener.once:
+                if is_strong:
+                    # strong listener: call straight through, skipping invoke()'s frame
+                    callback(event)
+                    alive = True
+                else:
+                    alive = listener.invoke(event)
+                if not alive or once:
+                    if to_remove is None:
+                        to_remove = []
                     to_remove.append(listener)
             except Exception as e:
                 logger.error(f"Error in listener for {event_type.__name__}: {e}", exc_info=True)
@@ -1490,18 +1556,19 @@ class EventSystem:
         
         # Cleanup dead/once listeners
         if to_remove:
+            # one rebuild pass instead of a list.remove() scan per listener
+            dead = {id(l) for l in to_remove}
             with self._lock:
-                for listener in to_remove:
-                    try:
-                        self._listeners[event_type].remove(listener)
-                    except ValueError:
-                        pass
+                listeners = self._listeners.get(event_type)
+                if listeners:
+                    listeners[:] = [l for l in listeners if id(l) not in dead]
+                self._resolved.pop(event_type, None)
         
         return event
     
     def emit_async(self, event: Event) -> None:
         """Queue an event for deferred processing."""
-        self._queue.put(event)
+        self._queue.append(event)
     
     def process_queue(self, max_events: int = 100) -> int:
         """Process queued events. Returns number of events processed."""
@@ -1511,14 +1578,11 @@ class EventSystem:
         self._processing = True
         count = 0
         
+        queue = self._queue
         try:
-            while count < max_events:
-                try:
-                    event = self._queue.get_nowait()
-                    self.emit(event)
-                    count += 1
-                except Empty:
-                    break
+            while count < max_events and queue:
+                self.emit(queue.popleft())
+                count += 1
         finally:
             self._processing = False
         
@@ -1529,8 +1593,14 @@ class EventSystem:
         with self._lock:
             if event_type:
                 self._listeners[event_type].clear()
+                self._resolved.pop(event_type, None)
             else:
                 self._listeners.clear()
+                self._resolved.clear()
+    
+    def has_listeners(self, event_type: Type[Event]) -> bool:
+        """Cheap check used by hot paths to skip building events nobody listens to."""
+        return bool(self._listeners.get(event_type))
     
     def listener_count(self, event_type: Optional[Type[Event]] = None) -> int:
         """Get number of listeners for an event type, or total listeners."""
@@ -1549,7 +1619,7 @@ class EventSystem:
             "listener_counts": {
                 k.__name__: len(v) for k, v in self._listeners.items() if v
             },
-            "queue_size": self._queue.qsize()
+            "queue_size": len(self._queue)
         }
 
 
@@ -1610,8 +1680,8 @@ class LegacyEventBridge:
             if event_type:
                 def wrapper(event):
                     # Convert typed event back to dict for old listeners
-                    data = {k: v for k, v in event.__dict__.items() 
-                            if not k.startswith('_')}
+                    data = {f.name: getattr(event, f.name) for f in fields(event)
+                            if not f.name.startswith('_')}
                     fn(data)
                 self._new.subscribe(event_type, wrapper)
     
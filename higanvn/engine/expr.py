@@ -1,7 +1,18 @@
 from __future__ import annotations
 
 import ast
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+
+# Smart quotes written in scripts are read as plain double quotes
+_QUOTES = str.maketrans({'“': '"', '”': '"', '「': '"', '」': '"'})
+
+
+@lru_cache(maxsize=1024)
+def _parse(expr: str) -> ast.Expression:
+    # Trees are only read by the visitor and the compiler, so one parse can be shared
+    return ast.parse(expr.translate(_QUOTES), mode="eval")
 
 
 class SafeEval(ast.NodeVisitor):
@@ -21,13 +32,7 @@ class SafeEval(ast.NodeVisitor):
         self.vars = vars
 
     def evaluate(self, expr: str) -> Any:
-        # Normalize smart quotes to standard for strings
-        expr = (
-            expr.replace('“', '"').replace('”', '"')
-            .replace('「', '"').replace('」', '"')
-        )
-        tree = ast.parse(expr, mode="eval")
-        return self.visit(tree.body)
+        return self.visit(_parse(expr).body)
 
     def visit_Constant(self, node: ast.Constant) -> Any:  # py>=3.8
         return node.value
@@ -112,5 +117,139 @@ class SafeEval(ast.NodeVisitor):
         raise ValueError(f"Unsupported expression element: {type(node).__name__}")
 
 
+Kernel = Callable[[Dict[str, Any]], Any]
+
+_BIN_SYMBOLS = {
+    ast.Add: "+",
+    ast.Sub: "-",
+    ast.Mult: "*",
+    ast.Div: "/",
+    ast.FloorDiv: "//",
+    ast.Mod: "%",
+}
+
+_CMP_SYMBOLS = {
+    ast.Eq: "==",
+    ast.NotEq: "!=",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+}
+
+_NAME_ALIASES = {'true': True, 'false': False, 'none': None}
+
+
+def _fail(msg: str, *_evaluated: Any) -> Any:
+    # Unsupported elements fail when reached, like the visitor does; operands the
+    # visitor would have evaluated first are passed in so they still run (and raise)
+    raise ValueError(msg)
+
+
+class _Emitter:
+    """Translate an expression tree into Python source with SafeEval semantics.
+
+    Only whitelisted node types produce code: names become ``V.get(key, None)``,
+    literals are read from a constants tuple, and everything else is an operator,
+    so the generated source can never reach attributes, calls or builtins.
+    """
+
+    def __init__(self) -> None:
+        self.consts: list = []
+        self._temps = 0
+
+    def const(self, value: Any) -> str:
+        self.consts.append(value)
+        return f"_c[{len(self.consts) - 1}]"
+
+    def fail(self, msg: str, *operands: str) -> str:
+        return f"_fail({', '.join((self.const(msg),) + operands)})"
+
+    def temp(self) -> str:
+        self._temps += 1
+        return f"_t{self._temps}"
+
+    def emit(self, node: ast.AST) -> str:
+        if isinstance(node, ast.Constant):
+            return self.const(node.value)
+        if isinstance(node, ast.Name):
+            low = node.id.lower()
+            if low in _NAME_ALIASES:
+                return repr(_NAME_ALIASES[low])
+            return f"V.get({node.id!r}, None)"
+        if isinstance(node, ast.UnaryOp):
+            operand = self.emit(node.operand)
+            if isinstance(node.op, ast.UAdd):
+                return f"(+{operand})"
+            if isinstance(node.op, ast.USub):
+                return f"(-{operand})"
+            if isinstance(node.op, ast.Not):
+                return f"(not {operand})"
+            return self.fail("Unsupported unary operator", operand)
+        if isinstance(node, ast.BoolOp):
+            if isinstance(node.op, (ast.And, ast.Or)):
+                joiner = " and " if isinstance(node.op, ast.And) else " or "
+                return "(" + joiner.join(f"_bool({self.emit(n)})" for n in node.values) + ")"
+            return self.fail("Unsupported boolean operator")
+        if isinstance(node, ast.BinOp):
+            left = self.emit(node.left)
+            right = self.emit(node.right)
+            sym = _BIN_SYMBOLS.get(type(node.op))
+            if sym is None:
+                return self.fail("Unsupported binary operator", left, right)
+            return f"({left} {sym} {right})"
+        if isinstance(node, ast.Compare):
+            return self._compare(node)
+        return self.fail(f"Unsupported expression element: {type(node).__name__}")
+
+    def _compare(self, node: ast.Compare) -> str:
+        left = self.emit(node.left)
+        if len(node.ops) == 1:
+            right = self.emit(node.comparators[0])
+            sym = _CMP_SYMBOLS.get(type(node.ops[0]))
+            if sym is None:
+                return self.fail("Unsupported comparison", left, right)
+            return f"({left} {sym} {right})"
+        # SafeEval evaluates every operand and every comparison of a chain before
+        # combining them (no short-circuit), so spell that out with temporaries
+        steps = []
+        oks = []
+        for op, comparator in zip(node.ops, node.comparators):
+            cur = self.temp()
+            ok = self.temp()
+            sym = _CMP_SYMBOLS.get(type(op))
+            if sym is None:
+                right = f"({cur} := {self.emit(comparator)})"
+                steps.append(self.fail("Unsupported comparison", left, right))
+                break
+            steps.append(f"({ok} := ({left} {sym} ({cur} := {self.emit(comparator)})))")
+            oks.append(ok)
+            left = cur
+        else:
+            steps.append("(True and " + " and ".join(oks) + ")")
+        return "(" + ", ".join(steps) + ")[-1]"
+
+
+def _build(node: ast.AST) -> Kernel:
+    """Compile an expression node into one Python function with SafeEval semantics."""
+    emitter = _Emitter()
+    body = emitter.emit(node)
+    src = f"lambda V, _c=_c, _bool=bool, _fail=_fail: {body}"
+    namespace = {"__builtins__": {}, "_c": tuple(emitter.consts), "bool": bool, "_fail": _fail}
+    return eval(compile(src, "<expr>", "eval"), namespace)
+
+
+@lru_cache(maxsize=512)
+def compile_expr(expr: str) -> Kernel:
+    """Parse ``expr`` once and return a cached kernel evaluating it against a vars dict."""
+    body = _parse(expr).body
+    try:
+        return _build(body)
+    except (SyntaxError, RecursionError, MemoryError):
+        # Very deep expressions exceed CPython's compiler nesting limits; the visitor
+        # has no such limit, so evaluate those through it instead
+        return lambda v: SafeEval(v).visit(body)
+
+
 def safe_eval(expr: str, vars: Dict[str, Any]) -> Any:
-    return SafeEval(vars).evaluate(expr)
+    return compile_expr(expr)(vars)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from typing import Dict, List, Tuple, Any
 
 from ..script.model import Program
@@ -18,11 +19,14 @@ def build_flow_graph(program: Program) -> Dict[str, Any]:
     nodes: List[str] = [name for name, _ in order]
     edges: List[Dict[str, Any]] = []
 
-    # Helper: find next label index after given op index
+    # Helper: find next label index after given op index (binary search over the
+    # sorted label positions instead of walking the ops)
+    label_ips: List[int] = sorted(inv_labels)
+
     def next_label_after(ip: int) -> str | None:
-        for i in range(ip + 1, len(program.ops)):
-            if i in inv_labels:
-                return inv_labels[i]
+        k = bisect_right(label_ips, ip)
+        if k < len(label_ips) and label_ips[k] < len(program.ops):
+            return inv_labels[label_ips[k]]
         return None
 
     # Add start edge to the first label if present
@@ -91,7 +91,26 @@ def show_flow_map(
     pos = _layout_nodes(flow)
 
     selected: Optional[str] = None
+    # static layers, baked once per overlay session
+    overlay = pygame.Surface(LOGICAL_SIZE, pygame.SRCALPHA)
+    overlay.fill((0, 0, 0, 170))
+    grid = _grid_surface()
+    # edge curves and arrowheads only depend on the layout
+    edge_shapes = []
+    for e in edges:
+        src = e.get("src")
+        dst = e.get("dst")
+        if not src or not dst or src not in pos or dst not in pos:
+            continue
+        color = (120, 120, 120) if e.get("kind") == "next" else (90, 140, 200)
+        points, head = _curved_arrow_geometry(pos[src], pos[dst])
+        edge_shapes.append((color, points, head))
+    # baked node cards keyed by (name, hovered); selection is drawn on top each frame
+    cards: Dict[Tuple[str, bool], pygame.Surface] = {}
     running = True
+    # the overlay only changes in response to input (mouse, keys, window events), so a
+    # frame is redrawn and rescaled only after some event arrived
+    dirty = True
     # Flush pending events so the key that opened the overlay doesn't close it immediately
     try:
         pygame.event.clear()
@@ -99,6 +118,7 @@ def show_flow_map(
         pass
     while running:
         for event in pygame.event.get():
+            dirty = True
             if event.type == pygame.QUIT:
                 raise SystemExit
             if event.type == pygame.KEYDOWN and event.key in (pygame.K_ESCAPE, pygame.K_TAB, pygame.K_m):
@@ -112,50 +132,33 @@ def show_flow_map(
                         if r.collidepoint((cx, cy)):
                             selected = name
                             break
+        if not running:
+            break
+        if not dirty:
+            clock.tick(60)
+            continue
+        dirty = False
         # draw the overlay frame
         render_base(flip=False, tick=False)
         # draw semi-transparent overlay
-        overlay = pygame.Surface(LOGICAL_SIZE, pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 170))
         canvas.blit(overlay, (0, 0))
-        _draw_grid(canvas)
+        canvas.blit(grid, (0, 0))
 
         # edges with arrowheads (left-to-right)
-        for e in edges:
-            src = e.get("src")
-            dst = e.get("dst")
-            if not src or not dst or src not in pos or dst not in pos:
-                continue
-            sx, sy = pos[src]
-            dx, dy = pos[dst]
-            color = (120, 120, 120) if e.get("kind") == "next" else (90, 140, 200)
-            _draw_curved_arrow(canvas, (sx, sy), (dx, dy), color)
+        for color, points, head in edge_shapes:
+            pygame.draw.aalines(canvas, color, False, points, True)
+            pygame.draw.polygon(canvas, color, head)
 
-        # nodes
+        # nodes; the mouse is mapped to canvas space once per frame, not per node
+        mp = _canvas_mouse(get_last_transform())
         for name, (nx, ny) in pos.items():
-            thumb = slot_thumb_for_label(name) if name in visited_labels else None
             rect = pygame.Rect(nx - 90, ny - 58, 180, 116)
-            hovered = _is_hover(get_last_transform, rect)
-            # shadow
-            _rounded_rect(canvas, rect.move(4, 4), (0, 0, 0, 120), 10)
-            # card background
-            bg_col = (28, 32, 40) if not hovered else (36, 40, 50)
-            _rounded_rect(canvas, rect, bg_col, 10, border=2, border_col=(70, 80, 96))
-            # thumb or placeholder
-            inner = rect.inflate(-10, -28)
-            if thumb is not None:
-                t = pygame.transform.smoothscale(thumb, (inner.width, inner.height))
-                canvas.blit(t, inner)
-            else:
-                ph = font.render("?", True, (230, 230, 230))
-                pr = ph.get_rect(center=inner.center)
-                canvas.blit(ph, pr)
-            # caption strip
-            cap_bar = pygame.Surface((rect.width, 22), pygame.SRCALPHA)
-            cap_bar.fill((0, 0, 0, 110))
-            canvas.blit(cap_bar, (rect.x, rect.bottom - 22))
-            cap = font.render(name, True, (240, 240, 240))
-            canvas.blit(cap, (rect.x + 8, rect.bottom - 20))
+            hovered = bool(mp and rect.collidepoint(mp))
+            card = cards.get((name, hovered))
+            if card is None:
+                thumb = slot_thumb_for_label(name) if name in visited_labels else None
+                card = cards[(name, hovered)] = _render_card(name, rect.size, hovered, thumb, font)
+            canvas.blit(card, rect.topleft)
             # state border
             border_col = (80, 140, 90) if name in visited_labels else (120, 120, 120)
             if selected == name:
@@ -211,7 +214,8 @@ def _draw_arrow(surface: pygame.Surface, start: Tuple[int, int], end: Tuple[int,
     pygame.draw.polygon(surface, color, [(ex, ey), left, right])
 
 
-def _draw_curved_arrow(surface: pygame.Surface, start: Tuple[int, int], end: Tuple[int, int], color):
+def _curved_arrow_geometry(start: Tuple[int, int], end: Tuple[int, int]) -> Tuple[list, list]:
+    """Return the points of a curved edge and the triangle of its arrowhead."""
     sx, sy = start
     ex, ey = end
     # Quadratic Bezier with a horizontal mid control
@@ -226,19 +230,49 @@ def _draw_curved_arrow(surface: pygame.Surface, start: Tuple[int, int], end: Tup
         x = (1 - t) * (1 - t) * sx + 2 * (1 - t) * t * ctrl[0] + t * t * ex
         y = (1 - t) * (1 - t) * sy + 2 * (1 - t) * t * ctrl[1] + t * t * ey
         points.append((int(x), int(y)))
-    # Draw the curve
-    if len(points) >= 2:
-        pygame.draw.aalines(surface, color, False, points, True)
-        # Arrowhead angle from last segment
-        (x1, y1), (x2, y2) = points[-2], points[-1]
-        ang = math.atan2(y2 - y1, x2 - x1)
-        size = 10
-        left = (x2 - size * math.cos(ang) + size * 0.5 * math.sin(ang), y2 - size * math.sin(ang) - size * 0.5 * math.cos(ang))
-        right = (x2 - size * math.cos(ang) - size * 0.5 * math.sin(ang), y2 - size * math.sin(ang) + size * 0.5 * math.cos(ang))
-        pygame.draw.polygon(surface, color, [(x2, y2), left, right])
-
-
-def _draw_grid(surface: pygame.Surface):
+    # Arrowhead angle from last segment
+    (x1, y1), (x2, y2) = points[-2], points[-1]
+    ang = math.atan2(y2 - y1, x2 - x1)
+    size = 10
+    left = (x2 - size * math.cos(ang) + size * 0.5 * math.sin(ang), y2 - size * math.sin(ang) - size * 0.5 * math.cos(ang))
+    right = (x2 - size * math.cos(ang) - size * 0.5 * math.sin(ang), y2 - size * math.sin(ang) + size * 0.5 * math.cos(ang))
+    return points, [(x2, y2), left, right]
+
+
+def _render_card(
+    name: str,
+    size: Tuple[int, int],
+    hovered: bool,
+    thumb: Optional[pygame.Surface],
+    font: pygame.font.Font,
+) -> pygame.Surface:
+    """Bake a node card (shadow, background, thumb, caption) onto its own surface."""
+    card = pygame.Surface((size[0] + 4, size[1] + 4), pygame.SRCALPHA)
+    rect = pygame.Rect((0, 0), size)
+    # shadow
+    _rounded_rect(card, rect.move(4, 4), (0, 0, 0, 120), 10)
+    # card background
+    bg_col = (28, 32, 40) if not hovered else (36, 40, 50)
+    _rounded_rect(card, rect, bg_col, 10, border=2, border_col=(70, 80, 96))
+    # thumb or placeholder
+    inner = rect.inflate(-10, -28)
+    if thumb is not None:
+        t = pygame.transform.smoothscale(thumb, (inner.width, inner.height))
+        card.blit(t, inner)
+    else:
+        ph = font.render("?", True, (230, 230, 230))
+        pr = ph.get_rect(center=inner.center)
+        card.blit(ph, pr)
+    # caption strip
+    cap_bar = pygame.Surface((rect.width, 22), pygame.SRCALPHA)
+    cap_bar.fill((0, 0, 0, 110))
+    card.blit(cap_bar, (rect.x, rect.bottom - 22))
+    cap = font.render(name, True, (240, 240, 240))
+    card.blit(cap, (rect.x + 8, rect.bottom - 20))
+    return card
+
+
+def _grid_surface() -> pygame.Surface:
     grid = pygame.Surface(LOGICAL_SIZE, pygame.SRCALPHA)
     gap = 48
     col = (255, 255, 255, 14)
@@ -246,9 +280,5 @@ def _draw_grid(surface: pygame.Surface):
         pygame.draw.line(grid, col, (x, 0), (x, LOGICAL_SIZE[1]))
     for y in range(0, LOGICAL_SIZE[1], gap):
         pygame.draw.line(grid, col, (0, y), (LOGICAL_SIZE[0], y))
-    surface.blit(grid, (0, 0))
-
+    return grid
 
-def _is_hover(get_last_transform: Callable[[], Optional[tuple[float, int, int, int, int]]], rect: pygame.Rect) -> bool:
-    mp = _canvas_mouse(get_last_transform())
-    return bool(mp and rect.collidepoint(mp))
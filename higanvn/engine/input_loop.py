@@ -276,6 +276,12 @@ def wait_for_advance(renderer) -> None:
                             except Exception:
                                 pass
                             waiting = False
+        # report background saves that finished (a failed write shows its banner now)
+        if renderer._save_status_hook:
+            try:
+                renderer._save_status_hook()
+            except Exception:
+                pass
         renderer._render()
         # auto-advance when fully revealed (skip once if just rewound)
         if (not renderer.show_backlog) and renderer._auto_mode and renderer._typing_enabled and renderer._line_full_ts is not None:
@@ -194,9 +194,10 @@ class LayeredCharacterRenderer:
     
     def _scan_manifests(self) -> None:
         """扫描并加载所有角色 manifest"""
-        if not self.characters_dir or not self.characters_dir.exists():
+        if not self.characters_dir:
             return
         
+        # 目录不存在时返回空字典
         self._manifests = scan_characters_directory(self.characters_dir)
         
         for char_id, manifest in self._manifests.items():
@@ -211,6 +212,11 @@ class LayeredCharacterRenderer:
         """获取角色当前状态"""
         return self._states.get(character_id)
     
+    @property
+    def states(self) -> Dict[str, SpriteState]:
+        """当前在场（已设置状态）的角色，只读使用"""
+        return self._states
+    
     def set_state(
         self,
         character_id: str,
@@ -71,6 +71,12 @@ class IRenderer:
         pass
     def set_delete_slot_hook(self, fn):
         pass
+    def set_save_status_hook(self, fn):
+        """Optional: fn reports background saves that finished; call it regularly while idle."""
+        pass
+    def set_event_system(self, events):
+        """Optional: subscribe to engine events (e.g. SaveCompleteEvent to report failed saves)."""
+        pass
     def set_jump_to_label_hook(self, fn):
         """Optional: allow UI to request jumping to a given label."""
         pass
@@ -83,6 +89,10 @@ class IRenderer:
     def add_debug_provider(self, name: str, fn):
         pass
 
+    # Optional: opt in to per-step engine VM state (_engine_ip, _engine_vars_snapshot, ...)
+    def wants_engine_debug(self) -> bool:
+        return False
+
     def reset_state(self) -> None:
         """Reset transient visual state; may be a no-op for headless implementations."""
         pass
@@ -7,6 +7,7 @@ import pygame
 from pygame import Surface
 
 from higanvn.engine.renderer import IRenderer
+from higanvn.engine.events import SaveCompleteEvent
 from higanvn.engine.animator import Animator
 from higanvn.ui.textwrap import wrap_text_generic
 from higanvn.assets.actors import load_actor_mapping, resolve_actor_folder
@@ -297,6 +298,10 @@ class PygameRenderer(IRenderer):
         self._back_hook = None
         # callback to get save dir from engine (optional)
         self._get_save_dir = None
+        # polled each frame while waiting so background save results are reported promptly
+        self._save_status_hook = None
+        # unsubscribe for the SaveCompleteEvent listener (see set_event_system)
+        self._unsub_save_complete = None
         # keep a copy of last fully rendered canvas for proper thumbnail capture
         self._last_frame = None
         self._frame_time_ms = 0
@@ -913,6 +918,17 @@ class PygameRenderer(IRenderer):
         self._list_slots_hook = fn
     def set_delete_slot_hook(self, fn: Callable[[int], bool]) -> None:
         self._delete_slot_hook = fn
+    def set_save_status_hook(self, fn: Callable[[], None]) -> None:
+        self._save_status_hook = fn
+    def set_event_system(self, events) -> None:
+        if self._unsub_save_complete:
+            self._unsub_save_complete()
+        self._unsub_save_complete = events.subscribe(SaveCompleteEvent, self._on_save_complete, weak=True)
+
+    def _on_save_complete(self, event: SaveCompleteEvent) -> None:
+        # background writes finish after the "saved" banner; a failure must still reach the player
+        if not event.success:
+            self.show_banner("保存失败", color=(200, 140, 40))
 
     # --- load/rollback helpers ---
     def begin_fast_replay(self) -> None:
@@ -1098,6 +1114,10 @@ class PygameRenderer(IRenderer):
         except Exception:
             pass
 
+    def wants_engine_debug(self) -> bool:  # type: ignore[override]
+        # debug HUD 'engine' provider reads the _engine_* attributes
+        return True
+
     def set_jump_to_label_hook(self, fn) -> None:  # type: ignore[override]
         self._jump_to_label_hook = fn
 
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import ast
+from functools import lru_cache
+from types import CodeType
 from typing import Any, Dict, Set
 
 
@@ -75,10 +77,15 @@ def safe_exec(code: str, vars: Dict[str, Any]) -> None:
 
     Side effects are limited to updating the provided vars dict.
     """
+    # Exec with limited builtins and the vars mapping as locals
+    exec(_compile_safe(str(code or "")), {"__builtins__": _ALLOWED_BUILTINS}, vars)
+
+
+@lru_cache(maxsize=256)
+def _compile_safe(code: str) -> CodeType:
     # Normalize line endings and strip BOM if any
-    code_str = str(code or "").replace("\r\n", "\n").replace("\r", "\n")
-    # Parse and validate AST
+    code_str = code.replace("\r\n", "\n").replace("\r", "\n")
+    # Parse and validate AST once per distinct block
     tree = ast.parse(code_str, mode="exec")
     _validate_node(tree)
-    # Exec with limited builtins and the vars mapping as locals
-    exec(compile(tree, filename="<script>", mode="exec"), {"__builtins__": _ALLOWED_BUILTINS}, vars)
+    return compile(tree, filename="<script>", mode="exec")
@@ -4,6 +4,8 @@ from pathlib import Path
 from typing import Optional, Dict, Tuple
 
 import pygame
+
+from .adapters.storage import decode_payload, format_save_ts
 _META_CACHE: Dict[Path, Dict[int, Tuple[float, Optional[dict]]]] = {}
 
 
@@ -35,7 +37,7 @@ def read_slot_meta(slot: int, *, get_save_dir) -> Optional[dict]:
     base = base_obj if isinstance(base_obj, Path) else Path(str(base_obj))
     p = slot_meta_path(slot, get_save_dir=lambda: base)
     try:
-        import json, os
+        import os
         # init cache bucket
         bucket = _META_CACHE.setdefault(base, {})
         # handle delete case: file missing -> drop cache and return None
@@ -52,8 +54,8 @@ def read_slot_meta(slot: int, *, get_save_dir) -> Optional[dict]:
         if cached and abs(cached[0] - mtime) < 1e-6:
             return cached[1]
         # read fresh
-        data = json.loads(p.read_text(encoding="utf-8"))
-        meta = {"ts": data.get("ts"), "label": data.get("label")}
+        data = decode_payload(p.read_bytes())
+        meta = {"ts": format_save_ts(data.get("ts")), "label": data.get("label")}
         # store to cache
         bucket[slot] = (mtime, meta)
         return meta
@@ -80,7 +82,6 @@ def list_slot_metas(*, get_save_dir) -> dict[int, dict]:
     """
     result: dict[int, dict] = {}
     try:
-        import json
         base_obj = get_save_dir() if callable(get_save_dir) else Path("save")
         base = base_obj if isinstance(base_obj, Path) else Path(str(base_obj))
         bucket = _META_CACHE.setdefault(base, {})
@@ -98,8 +99,8 @@ def list_slot_metas(*, get_save_dir) -> dict[int, dict]:
             cached = bucket.get(n)
             if not cached or abs(cached[0] - mt) >= 1e-6:
                 try:
-                    data = json.loads(p.read_text(encoding="utf-8"))
-                    meta = {"ts": data.get("ts"), "label": data.get("label")}
+                    data = decode_payload(p.read_bytes())
+                    meta = {"ts": format_save_ts(data.get("ts")), "label": data.get("label")}
                 except Exception:
                     meta = None
                 bucket[n] = (mt, meta)
@@ -22,6 +22,7 @@ import hashlib
 if TYPE_CHECKING:
     import pygame
 
+from .adapters.storage import decode_payload, format_save_ts
 from .events import (
     EventSystem, Event, CancellableEvent, Priority,
     SaveEvent, SaveCompleteEvent, LoadEvent, LoadCompleteEvent
@@ -75,7 +76,7 @@ class SlotDataChangedEvent(Event):
 class SlotMeta:
     """存档槽位元数据"""
     slot_id: int
-    timestamp: Optional[str] = None
+    timestamp: Optional[str | int] = None  # ISO string (older saves) or epoch seconds
     label: Optional[str] = None
     play_time: Optional[int] = None  # seconds
     chapter: Optional[str] = None
@@ -91,7 +92,7 @@ class SlotMeta:
         if not self.timestamp:
             return ""
         try:
-            dt = datetime.fromisoformat(self.timestamp)
+            dt = datetime.fromisoformat(format_save_ts(self.timestamp))
             return dt.strftime("%Y-%m-%d %H:%M")
         except Exception:
             return str(self.timestamp)[:16]
@@ -99,7 +100,8 @@ class SlotMeta:
     def to_dict(self) -> dict:
         return {
             "slot": self.slot_id,
-            "ts": self.timestamp,
+            # display form (ISO text), as save_io slot meta reports it for the slot UIs
+            "ts": format_save_ts(self.timestamp),
             "label": self.label,
             "play_time": self.play_time,
             "chapter": self.chapter,
@@ -385,7 +387,7 @@ class SaveManager:
             if not meta_path.exists():
                 return SlotMeta(slot_id=slot)
             
-            data = json.loads(meta_path.read_text(encoding="utf-8"))
+            data = decode_payload(meta_path.read_bytes())
             return SlotMeta.from_dict(data, slot)
         except Exception as e:
             logger.warning(f"Failed to read meta for slot {slot}: {e}")
@@ -36,6 +36,7 @@ Layered Sprite System - 差分立绘合成系统
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any, Union
@@ -579,19 +580,22 @@ def scan_characters_directory(characters_dir: Path) -> Dict[str, CharacterSprite
     """
     manifests = {}
     
-    if not characters_dir.exists():
+    try:
+        with os.scandir(characters_dir) as it:
+            entries = [e for e in it if e.is_dir()]
+    except OSError:
         return manifests
     
-    for char_dir in characters_dir.iterdir():
-        if not char_dir.is_dir():
+    # DirEntry.is_dir 一般不需要额外 stat；manifest 直接打开，不存在即跳过
+    for entry in entries:
+        manifest_path = Path(entry.path) / 'manifest.json'
+        try:
+            manifest = CharacterSpriteManifest.load(manifest_path)
+        except FileNotFoundError:
             continue
-        
-        manifest_path = char_dir / 'manifest.json'
-        if manifest_path.exists():
-            try:
-                manifest = CharacterSpriteManifest.load(manifest_path)
-                manifests[manifest.id] = manifest
-            except Exception as e:
-                print(f"Warning: Failed to load manifest for {char_dir.name}: {e}")
+        except Exception as e:
+            print(f"Warning: Failed to load manifest for {entry.name}: {e}")
+            continue
+        manifests[manifest.id] = manifest
     
     return manifests
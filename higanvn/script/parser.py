@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Tuple
 import textwrap
 
@@ -155,8 +156,11 @@ def parse_script(source: str) -> Program:
     return Program(ops, labels)
 
 
+@lru_cache(maxsize=1024)
 def _parse_actor_left(s: str) -> Tuple[str, str | None, str | None, str | None]:
     # "张鹏|学长(happy)[gray]" -> actor, alias, emotion, effect
+    # cached: speaker prefixes repeat throughout a script, so repeated lines skip the
+    # regex work and share one actor/alias/emotion string object per distinct prefix
     alias = None
     emotion = None
     effect = None
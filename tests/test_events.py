@@ -102,6 +102,18 @@ class TestEventSystem:
         assert order == ["canceller"]
         assert event.cancelled
     
+    def test_equal_priority_keeps_subscription_order(self):
+        """Test listeners with the same priority run in the order they subscribed."""
+        events = EventSystem()
+        order = []
+        events.subscribe(TextShowEvent, lambda e: order.append("n1"))
+        events.subscribe(TextShowEvent, lambda e: order.append("h1"), priority=Priority.HIGH)
+        events.subscribe(TextShowEvent, lambda e: order.append("n2"))
+        events.subscribe(TextShowEvent, lambda e: order.append("l1"), priority=Priority.LOW)
+        events.subscribe(TextShowEvent, lambda e: order.append("h2"), priority=Priority.HIGH)
+        events.emit(TextShowEvent())
+        assert order == ["h1", "h2", "n1", "n2", "l1"]
+    
     def test_monitor_priority_sees_cancelled(self):
         """Test that MONITOR priority still runs even after cancellation."""
         events = EventSystem()
@@ -146,6 +158,35 @@ class TestEventSystem:
         
         assert received == ["1"]
     
+    def test_once_listeners_pruned_together(self):
+        """Test several once listeners are dropped after one emit, others kept."""
+        events = EventSystem()
+        received = []
+        events.subscribe(TextShowEvent, lambda e: received.append("keep"))
+        for i in range(3):
+            events.once(TextShowEvent, lambda e, i=i: received.append(i))
+        
+        events.emit(TextShowEvent())
+        events.emit(TextShowEvent())
+        
+        assert received == ["keep", 0, 1, 2, "keep"]
+        assert events.listener_count(TextShowEvent) == 1
+    
+    def test_process_queue_respects_budget(self):
+        """Test queued events are emitted in order, at most max_events per call."""
+        events = EventSystem()
+        received = []
+        events.subscribe(TextShowEvent, lambda e: received.append(e.text))
+        for t in "abc":
+            events.emit_async(TextShowEvent(text=t))
+        
+        assert events.process_queue(max_events=2) == 2
+        assert received == ["a", "b"]
+        assert events.get_stats()["queue_size"] == 1
+        assert events.process_queue() == 1
+        assert events.process_queue() == 0
+        assert received == ["a", "b", "c"]
+    
     def test_decorator_syntax(self):
         """Test the @events.on decorator."""
         events = EventSystem()
@@ -183,8 +224,13 @@ class TestEventSystem:
     
     def test_event_timestamp(self):
         """Test that events have timestamps."""
+        import time
+        
         event = TextShowEvent(speaker="A", text="B")
         assert event.timestamp > 0
+        # monotonic clock: later events never get an earlier stamp
+        later = TextShowEvent(speaker="A", text="C")
+        assert event.timestamp <= later.timestamp <= time.perf_counter()
     
     def test_statistics(self):
         """Test event statistics tracking."""
@@ -218,6 +264,68 @@ class TestEventSystem:
         assert events.listener_count(CommandEvent) == 1
         assert events.listener_count() == 3
     
+    def test_listener_snapshot_reused_until_listeners_change(self):
+        """Test emit reuses one listener snapshot per type until it is invalidated."""
+        events = EventSystem()
+        seen = []
+        events.subscribe(TextShowEvent, lambda e: seen.append("a"))
+        events.emit(TextShowEvent())
+        snapshot = events._resolved[TextShowEvent]
+        events.emit(TextShowEvent())
+        assert events._resolved[TextShowEvent] is snapshot
+        
+        events.subscribe(TextShowEvent, lambda e: seen.append("b"), priority=Priority.HIGH)
+        events.once(TextShowEvent, lambda e: seen.append("once"))
+        events.emit(TextShowEvent())
+        events.emit(TextShowEvent())
+        assert seen == ["a", "a", "b", "a", "once", "b", "a"]
+    
+    def test_weak_listener_dropped_after_owner_collected(self):
+        """Test weak bound-method listeners do not keep their owner alive."""
+        import gc
+        events = EventSystem()
+        seen = []
+        
+        class Owner:
+            def handle(self, e):
+                seen.append("weak")
+        
+        owner = Owner()
+        events.subscribe(TextShowEvent, owner.handle, weak=True)
+        events.subscribe(TextShowEvent, lambda e: seen.append("strong"))
+        events.emit(TextShowEvent())
+        del owner
+        gc.collect()
+        events.emit(TextShowEvent())
+        assert seen == ["weak", "strong", "strong"]
+        assert events.listener_count(TextShowEvent) == 1
+    
+    def test_unsubscribe_weak_listener(self):
+        """Test a weak listener can be removed with the bound method it was given."""
+        events = EventSystem()
+        
+        class Owner:
+            def handle(self, e):
+                pass
+        
+        owner = Owner()
+        events.subscribe(TextShowEvent, owner.handle, weak=True)
+        assert events.unsubscribe(TextShowEvent, owner.handle)
+        assert not events.has_listeners(TextShowEvent)
+    
+    def test_has_listeners(self):
+        """Test cheap listener presence check."""
+        events = EventSystem()
+        
+        def h1(e): pass
+        
+        assert not events.has_listeners(TextShowEvent)
+        unsub = events.subscribe(TextShowEvent, h1)
+        assert events.has_listeners(TextShowEvent)
+        assert not events.has_listeners(CommandEvent)
+        unsub()
+        assert not events.has_listeners(TextShowEvent)
+    
     def test_clear_specific_type(self):
         """Test clearing listeners for a specific event type."""
         events = EventSystem()
@@ -350,6 +458,44 @@ class TestSpecificEvents:
         event.cancel()
         assert event.cancelled
     
+    def test_events_are_slotted_and_plain_subclasses_still_work(self):
+        """Test built-in events carry no __dict__ while plain dataclass subclasses still cancel."""
+        import sys
+        from dataclasses import dataclass
+        
+        if sys.version_info >= (3, 10):
+            assert not hasattr(KeyDownEvent(key=1), "__dict__")
+        
+        @dataclass
+        class PluginEvent(CancellableEvent):
+            name: str = ""
+        
+        event = PluginEvent(name="x")
+        assert not event.cancelled
+        event.cancel()
+        assert event.cancelled
+    
+    def test_slotted_dataclass_fallback(self):
+        """Test the pre-3.10 slots fallback builds equivalent slotted dataclasses."""
+        from dataclasses import field
+        from higanvn.engine.events import _slotted_dataclass
+        
+        @_slotted_dataclass
+        class Base:
+            _flag: bool = field(default_factory=bool, init=False, repr=False)
+            x: int = 0
+        
+        @_slotted_dataclass
+        class Child(Base):
+            tags: list = field(default_factory=list)
+        
+        child = Child(x=2)
+        assert not hasattr(child, "__dict__")
+        assert Child.__slots__ == ("tags",)
+        assert (child._flag, child.x, child.tags) == (False, 2, [])
+        assert child == Child(x=2)
+        assert repr(child) == "Child(x=2, tags=[])"
+    
     def test_command_event_with_line(self):
         """Test CommandEvent with line number."""
         event = CommandEvent(name="BGM", args="music.mp3", line=42)
@@ -711,6 +857,18 @@ class TestErrorEvents:
         assert event.error_type == "script_error"
         assert event.recoverable
         assert event.details["label"] == "missing_label"
+
+    def test_default_payloads(self):
+        """Mapping payloads default to fresh dicts; sequence payloads to ()."""
+        import copy
+        from higanvn.engine.events import ChoicePresentEvent, ErrorEvent
+
+        a, b = ErrorEvent(), ErrorEvent()
+        assert a.details is not b.details
+        a.details["k"] = 1
+        assert b.details == {}
+        assert copy.deepcopy(ErrorEvent(error_type="x", message="m")).details == {}
+        assert ChoicePresentEvent().choices == ()
     
     def test_warning_event(self):
         """Test WarningEvent."""
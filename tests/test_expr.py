@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import pytest
+
+from higanvn.engine.expr import SafeEval, compile_expr, safe_eval
+
+
+CASES = [
+    "1 + 2 * 3",
+    "a // 2 + a % 3",
+    "-a + +b",
+    "not flag",
+    "a > 1 and b < 5",
+    "a > 10 or b == 4",
+    "0 < a <= 3 < b",
+    "name == “张鹏”",
+    "missing == None",
+    "True and false",
+    "(a + b) / 2",
+    "a < b == (1 < a < 5)",
+    "not (a > 1 or b > 1) and -a",
+    "name + “!”",
+]
+
+
+@pytest.mark.parametrize("expr", CASES)
+def test_compiled_matches_visitor(expr):
+    env = {"a": 3, "b": 4, "flag": False, "name": "张鹏"}
+    assert safe_eval(expr, env) == SafeEval(env).evaluate(expr)
+
+
+def test_compile_expr_is_cached():
+    assert compile_expr("x + 1") is compile_expr("x + 1")
+    assert compile_expr("x + 1")({"x": 41}) == 42
+
+
+def test_unsupported_elements_raise_only_when_reached():
+    assert safe_eval("False and f(1)", {}) is False
+    with pytest.raises(ValueError):
+        safe_eval("x.attr", {"x": 1})
+    with pytest.raises(ValueError):
+        safe_eval("2 ** 3", {})
+
+
+def test_chained_compare_evaluates_every_step_like_visitor():
+    # SafeEval keeps comparing after a False link, so type errors still surface
+    with pytest.raises(TypeError):
+        SafeEval({}).evaluate('1 > 2 < "s"')
+    with pytest.raises(TypeError):
+        safe_eval('1 > 2 < "s"', {})
+    with pytest.raises(ValueError):
+        safe_eval("1 < 2 in x", {"x": [2]})
+
+
+def test_compiled_kernel_has_no_builtins():
+    with pytest.raises(ValueError):
+        safe_eval("__import__('os')", {})
+    assert safe_eval("open", {}) is None
+
+
+def test_visitor_reuses_parsed_tree():
+    from higanvn.engine.expr import _parse
+    assert _parse("a + 1") is _parse("a + 1")
+    assert SafeEval({"s": "x"}).evaluate("s == 「x」") is True
+
+
+def test_deep_expression_falls_back_to_visitor():
+    expr = "+".join(["1"] * 201)
+    assert safe_eval(expr, {}) == 201
+    assert safe_eval(" and ".join(["a < b"] * 250), {"a": 1, "b": 2}) is True
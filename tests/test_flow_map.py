@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from higanvn.engine.flow_map import build_flow_graph
+from higanvn.script.parser import parse_script
+
+
+def test_build_flow_graph_edges():
+    src = """*a
+张鹏: 你好
+*b
+? 去天台 -> d
+? 留下 -> c
+*c
+黄昏的风吹过
+*d
+结束
+"""
+    graph = build_flow_graph(parse_script(src))
+    assert graph["order"] == ["a", "b", "c", "d"]
+    edges = [(e["src"], e["dst"], e["kind"]) for e in graph["edges"]]
+    assert edges == [
+        ("__start__", "a", "start"),
+        ("a", "b", "next"),
+        ("b", "d", "choice"),
+        ("b", "c", "choice"),
+        ("c", "d", "next"),
+    ]
+
+
+def test_curved_arrow_geometry_ends_at_target():
+    from higanvn.engine.flow_map_ui import _curved_arrow_geometry
+
+    points, head = _curved_arrow_geometry((100, 100), (400, 300))
+    assert points[0] == (100, 100) and points[-1] == (400, 300)
+    assert len(points) == 19
+    assert head[0] == (400, 300) and len(head) == 3
@@ -267,6 +267,22 @@ class TestLayeredSpriteSystem:
             assert len(manifest.poses) == 2
             assert len(manifest.expressions) == 3
             assert len(manifest.outfits) == 2
+    
+    def test_scan_characters_directory(self):
+        """测试扫描角色目录"""
+        from higanvn.packaging.layered_sprite import (
+            CharacterSpriteManifest,
+            scan_characters_directory,
+        )
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            chars_dir = Path(tmpdir)
+            CharacterSpriteManifest(id="alice", name="Alice").save(chars_dir / "alice" / "manifest.json")
+            (chars_dir / "bob").mkdir()
+            (chars_dir / "notes.txt").write_text("x")
+            
+            assert list(scan_characters_directory(chars_dir)) == ["alice"]
+            assert scan_characters_directory(chars_dir / "missing") == {}
 
 
 class TestPatchArchiveSystem:
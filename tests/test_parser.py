@@ -16,3 +16,11 @@ def test_parse_basic_dialogue_and_narration():
     assert kinds[:3] == ["command", "dialogue", "narration"]
     assert any(op.kind == "choice" for op in program.ops)
     assert "go" in program.labels
+
+
+def test_repeated_speaker_shares_actor_string():
+    src = "张鹏(happy): 你好\n张鹏(happy): 再见\n"
+    prog = parse_script(src)
+    a, b = (op.payload for op in prog.ops if op.kind == "dialogue")
+    assert a["actor"] == "张鹏" and a["emotion"] == "happy"
+    assert a["actor"] is b["actor"]
@@ -284,6 +284,94 @@ class TestEnhancedCharacterLayer:
             # bob 没有 manifest
             assert not layer._is_layered("bob")
     
+    def test_layered_set_pose_parses_emotion_once(self):
+        """测试差分模式 emotion 解析缓存"""
+        from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
+        from higanvn.packaging.layered_sprite import CharacterSpriteManifest, PoseDefinition
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            chars_dir = Path(tmpdir)
+            manifest = CharacterSpriteManifest(id="alice", name="Alice")
+            manifest.poses["sit"] = PoseDefinition(id="sit", base_layer="base_sit")
+            manifest.save(chars_dir / "alice" / "manifest.json")
+            layer = EnhancedCharacterLayer(slots={}, characters_dir=chars_dir)
+            
+            layer.set_pose("alice", "sit:happy+blush", str, Mock())
+            state = layer._layered_renderer.get_state("alice")
+            assert (state.pose, state.expression, state.active_effects) == ("sit", "happy", ["blush"])
+            parsed = layer._emotion_cache[("alice", "sit:happy+blush")][1]
+            # 不是已知姿势的前缀按表情处理
+            layer.set_pose("alice", "sad", str, Mock())
+            assert state.expression == "sad"
+            layer.set_pose("alice", "sit:happy+blush", str, Mock())
+            assert layer._emotion_cache[("alice", "sit:happy+blush")][1] is parsed
+            # 特效列表不与缓存共享
+            layer.add_effect("alice", "sweat")
+            assert parsed[3] == ("blush",)
+            # manifest 重新加载后重新解析
+            layer._layered_renderer.reload_manifest("alice")
+            layer.set_pose("alice", "sit:happy+blush", str, Mock())
+            assert layer._emotion_cache[("alice", "sit:happy+blush")][1] is not parsed
+    
+    def test_render_batches_and_reuses_dimmed_sprites(self):
+        """测试渲染批量提交并复用变暗立绘"""
+        pygame = pytest.importorskip("pygame")
+        from higanvn.engine.animator import Animator
+        from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
+        
+        layer = EnhancedCharacterLayer(slots={})
+        for actor in ("alice", "bob"):
+            layer.characters[actor] = (pygame.Surface((50, 100), pygame.SRCALPHA), None)
+        layer.active_actor = "alice"
+        canvas = pygame.Surface((1280, 720), pygame.SRCALPHA)
+        layer.render(canvas, Animator(), 0)
+        rects = layer.last_rects()
+        assert set(rects) == {"alice", "bob"}
+        # 只读视图，不复制
+        with pytest.raises(TypeError):
+            rects["carol"] = None
+        dim = layer._actors["bob"].scaled[3]
+        layer.render(canvas, Animator(), 16)
+        assert layer._actors["bob"].scaled[3] is dim is not None
+        # the active actor never needs a dimmed variant
+        assert layer._actors["alice"].scaled[3] is None
+        scaled = layer._actors["alice"].scaled[2]
+        layer.render(canvas, Animator(), 32)
+        assert layer._actors["alice"].scaled[2] is scaled
+        layer.remove("alice")
+        assert "alice" not in layer._actors
+
+    def test_render_order_cached_until_actors_change(self):
+        """测试渲染顺序缓存"""
+        from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
+
+        layer = EnhancedCharacterLayer(slots={})
+        for actor in ("alice", "bob", "carol"):
+            layer.ensure_loaded(actor, lambda p: p, lambda a: Mock())
+        order = layer._ordered_actors()
+        assert order == ["alice", "bob", "carol"]
+        assert layer._ordered_actors() is order
+        layer.active_actor = "alice"
+        assert layer._ordered_actors() == ["bob", "carol", "alice"]
+        layer.remove("bob")
+        assert layer._ordered_actors() == ["carol", "alice"]
+        # 直接写入 characters 也会被察觉
+        layer.characters["dave"] = (Mock(), None)
+        assert layer._ordered_actors() == ["carol", "dave", "alice"]
+
+    def test_slot_maps_follow_slots_config(self):
+        """测试槽位下标表随配置重算"""
+        from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
+
+        layer = EnhancedCharacterLayer(slots={})
+        assert layer._slot_maps[1] == [1]
+        assert layer._slot_maps[2] == [0, 2]
+        assert layer._slot_maps[4] == [0, 1, 2, 0]
+        layer._slots = {"positions": [(100, 400), (900, 400)]}
+        assert layer._slot_maps[1] == [1]
+        assert layer._slot_maps[2] == [0, 1]
+        assert layer._slot_positions == ((100, 400), (900, 400))
+
     def test_set_outfit(self):
         """测试设置服装"""
         from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
@@ -291,10 +379,10 @@ class TestEnhancedCharacterLayer:
         layer = EnhancedCharacterLayer(slots={})
         
         layer.set_outfit("alice", "school")
-        assert layer._outfits["alice"] == "school"
+        assert layer._actors["alice"].outfit == "school"
         
         layer.set_outfit("alice", None)
-        assert layer._outfits["alice"] is None
+        assert layer._actors["alice"].outfit is None
     
     def test_remove_clear(self):
         """测试移除和清除"""
@@ -321,8 +409,8 @@ class TestEnhancedCharacterLayer:
         layer = EnhancedCharacterLayer(slots={})
         
         layer.characters["alice"] = (Mock(), Mock())
-        layer._outfits["alice"] = "school"
-        layer._pose_names["alice"] = "happy"
+        layer._info("alice").outfit = "school"
+        layer._info("alice").pose_name = "happy"
         
         snapshot = layer.snapshot_characters()
         
@@ -330,6 +418,18 @@ class TestEnhancedCharacterLayer:
         assert snapshot[0]["id"] == "alice"
         assert snapshot[0]["outfit"] == "school"
         assert snapshot[0]["pose"] == "happy"
+
+    def test_snapshot_keeps_entry_order(self):
+        """测试快照保持登场顺序"""
+        from higanvn.engine.enhanced_characters import EnhancedCharacterLayer
+
+        layer = EnhancedCharacterLayer(slots={})
+        for actor in ("carol", "alice", "bob"):
+            layer.ensure_loaded(actor, lambda p: p, lambda a: Mock())
+        layer.active_actor = "carol"
+        # 仅设置过服装、未登场的角色不进入快照
+        layer.set_outfit("dave", "school")
+        assert [e["id"] for e in layer.snapshot_characters()] == ["carol", "alice", "bob"]
     
     def test_cache_stats(self):
         """测试缓存统计"""
@@ -15,4 +15,224 @@ def test_engine_runs_headless_and_jumps_label():
     e = Engine()
     e.load(program)
     # Should not raise
-    e.run_headless()
\ No newline at end of file
+    e.run_headless()
+
+class _TextRecorder:
+    def __init__(self):
+        self.lines = []
+
+    def show_text(self, name, text, meta=None):
+        self.lines.append((name, text))
+
+    def command(self, name, args):
+        pass
+
+
+def test_engine_interpolates_vars_in_text():
+    src = """
+> SET n = 3
+还剩{n}次，{missing}不变
+张鹏: 没有占位符
+"""
+    r = _TextRecorder()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert r.lines == [(None, "还剩3次，{missing}不变"), ("张鹏", "没有占位符")]
+
+
+class _DebugRecorder(_TextRecorder):
+    def wants_engine_debug(self):
+        return True
+
+
+def test_engine_publishes_debug_state_only_when_requested():
+    src = """
+> SET a = 1
+一
+> SET a = a + 1
+二
+"""
+    plain = _TextRecorder()
+    e = Engine(renderer=plain)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert not hasattr(plain, "_engine_vars_snapshot")
+
+    dbg = _DebugRecorder()
+    e = Engine(renderer=dbg)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert dbg._engine_ip == 3
+    assert dbg._engine_vars_snapshot == {"a": 2}
+
+
+def test_save_dir_resolved_once_per_script(tmp_path, monkeypatch):
+    monkeypatch.setattr("pathlib.Path.home", lambda: tmp_path)
+    script = tmp_path / "story.vns"
+    script.write_text("黄昏\n", encoding="utf-8")
+    (tmp_path / "story.meta.json").write_text('{"saveId": "MyGame"}', encoding="utf-8")
+    e = Engine(renderer=_TextRecorder())  # type: ignore[arg-type]
+    e.set_script_path(script)
+    first = e.get_save_dir()
+    assert first.name == "MyGame" and first.is_dir()
+    # metadata edits are not re-read until the script path changes
+    (tmp_path / "story.meta.json").write_text('{"saveId": "Other"}', encoding="utf-8")
+    assert e.get_save_dir() is first
+    e.set_script_path(script)
+    assert e.get_save_dir().name == "Other"
+
+
+class _ChoiceRecorder(_TextRecorder):
+    def __init__(self, pick):
+        super().__init__()
+        self.pick = pick
+        self.offered = []
+
+    def wait_for_advance(self):
+        pass
+
+    def ask_choice(self, choices):
+        self.offered.append(choices)
+        return self.pick
+
+
+def test_choice_block_selects_target():
+    src = """
+? 左 -> left
+? 右 -> right
+*left
+向左
+*right
+向右
+"""
+    r = _ChoiceRecorder(pick=1)
+    e = Engine(renderer=r, interactive=True)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert r.offered == [[("左", "left"), ("右", "right")]]
+    assert list(e.choice_trace) == [1]
+    assert r.lines == [(None, "向右")]
+
+
+class _CommandRecorder(_TextRecorder):
+    def __init__(self):
+        super().__init__()
+        self.commands = []
+
+    def command(self, name, args):
+        self.commands.append(name)
+
+
+def test_script_block_runs_without_renderer_passthrough():
+    src = """
+> SCRIPT
+    total = 0
+    for i in range(4):
+        total += i
+合计{total}
+"""
+    r = _CommandRecorder()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert e.vars["total"] == 6
+    assert r.lines == [(None, "合计6")]
+    assert r.commands == []
+
+
+def test_back_one_line_replays_recorded_choices():
+    src = """
+开场
+? 左 -> left
+? 右 -> right
+*left
+向左
+*right
+向右
+再见
+"""
+    r = _ChoiceRecorder(pick=1)
+    e = Engine(renderer=r, interactive=True)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert list(e.line_ip_trace) == [0, 6, 7]
+    assert e.back_one_line()
+    # state rebuilt so that the previous visible line executes next
+    assert e.ip == 6
+    assert list(e.choice_trace) == [1]
+
+
+def test_conditionals_and_switch_branch():
+    src = """
+> SET score = 7
+> IF score > 8 -> high
+> ELSEIF score > 5 -> mid
+> ELSE -> low
+*high
+高
+> GOTO done
+*mid
+中
+> SWITCH score % 2
+> CASE 0 -> even
+> CASE 1 -> odd
+*even
+偶
+> GOTO done
+*odd
+奇
+*low
+低
+*done
+"""
+    r = _TextRecorder()
+    e = Engine(renderer=r, strict=True)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert [t for _, t in r.lines] == ["中", "奇", "低"]
+
+
+def test_interpolation_template_follows_var_changes_on_revisit():
+    src = """
+> SET i = 0
+*loop
+第{i}轮/{i}
+> SET i = i + 1
+> IF i < 3 -> loop
+"""
+    r = _TextRecorder()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert [t for _, t in r.lines] == ["第0轮/0", "第1轮/1", "第2轮/2"]
+
+
+def test_listener_errors_do_not_abort_script_in_debug_mode():
+    from higanvn.engine.events import EngineStepEvent, TextShowEvent
+
+    def boom(event):
+        raise RuntimeError("listener failed")
+
+    r = _TextRecorder()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    # debug mode re-raises listener errors out of emit()
+    e.event_system._debug = True
+    e.event_system.subscribe(EngineStepEvent, boom)
+    e.event_system.subscribe(TextShowEvent, boom)
+    e.load(parse_script("黄昏\n张鹏: 到了\n"))
+    e.run_headless()
+    assert [t for _, t in r.lines] == ["黄昏", "到了"]
+
+
+def test_debug_vars_snapshot_refreshes_after_mark_vars_changed():
+    dbg = _DebugRecorder()
+    e = Engine(renderer=dbg)  # type: ignore[arg-type]
+    e.load(parse_script("> SET a = 1\n一\n二\n"))
+    e.step()
+    e.step()
+    assert dbg._engine_vars_snapshot == {"a": 1}
+    e.vars["a"] = 5
+    e.mark_vars_changed()
+    e.step()
+    assert dbg._engine_vars_snapshot == {"a": 5}
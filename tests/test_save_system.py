@@ -40,6 +40,17 @@ class TestSaveManager:
         assert meta.is_empty == False
         assert "2025-01-15" in meta.display_time
     
+    def test_slot_meta_epoch_timestamp(self):
+        """测试整数时间戳（新存档格式）"""
+        from datetime import datetime
+        from higanvn.engine.save_manager import SlotMeta
+        
+        ts = int(datetime(2025, 1, 15, 10, 30).timestamp())
+        meta = SlotMeta(slot_id=1, timestamp=ts)
+        assert meta.display_time == "2025-01-15 10:30"
+        # the slot cards render to_dict()["ts"] as text
+        assert SlotMeta.from_dict({"ts": ts}, 1).to_dict()["ts"] == "2025-01-15T10:30:00"
+    
     def test_slot_meta_to_dict(self):
         """测试元数据转字典"""
         from higanvn.engine.save_manager import SlotMeta
@@ -395,3 +406,95 @@ class TestSaveLoadIntegration:
             assert 3 in saved_slots
             assert len(complete_events) == 1
             assert complete_events[0].success == True
+
+
+class TestFileSaveStore:
+    """测试FileSaveStore压缩存储"""
+    
+    def test_compressed_roundtrip_and_legacy_read(self, tmp_path):
+        from higanvn.engine.adapters.storage import FileSaveStore, read_payload
+        
+        store = FileSaveStore(lambda: tmp_path, compress=True)
+        payload = {"script": "demo.vns", "ip": 3, "label": "第一章", "ts": "2025-01-15"}
+        assert store.write_slot(1, payload)
+        raw = (tmp_path / "slot_01.json").read_bytes()
+        assert raw[:2] == b"\x1f\x8b"
+        assert store.read_slot(1) == payload
+        
+        # legacy plain JSON saves remain readable
+        (tmp_path / "slot_02.json").write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+        assert store.read_slot(2) == payload
+        assert read_payload(tmp_path / "slot_01.json") == payload
+        assert store.read_slot(3) is None
+        assert read_payload(tmp_path / "slot_03.json") is None
+    
+    def test_payload_codec_matches_stdlib_json(self):
+        from higanvn.engine.adapters.storage import encode_payload, decode_payload
+        
+        payload = {"vars": {"n": 2 ** 70, "name": "张鹏"}, "choices": [0, 1], "map": {1: "a"}}
+        data = encode_payload(payload)
+        # still plain, human-readable JSON
+        assert json.loads(data.decode("utf-8")) == {"vars": {"n": 2 ** 70, "name": "张鹏"}, "choices": [0, 1], "map": {"1": "a"}}
+        assert decode_payload(data)["map"] == {"1": "a"}
+        # NaN written by stdlib json is still readable
+        x = decode_payload(json.dumps({"x": float("nan")}).encode("utf-8"))["x"]
+        assert x != x
+    
+    def test_script_hash_cached_until_file_changes(self, tmp_path):
+        import hashlib
+        import os
+        from higanvn.engine.engine import Engine
+        
+        script = tmp_path / "game.vns"
+        script.write_text("黄昏\n", encoding="utf-8")
+        e = Engine()
+        e.set_script_path(script)
+        # primed when the script path is set
+        digest = e._script_hash_cache[1]
+        assert digest == hashlib.sha256(script.read_bytes()).hexdigest()
+        assert e._script_sha256() == digest
+        script.write_text("黄昏\n到了\n", encoding="utf-8")
+        st = os.stat(script)
+        os.utime(script, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert e._script_sha256() == hashlib.sha256(script.read_bytes()).hexdigest() != digest
+        e.close()
+    
+    def test_atomic_write_leaves_no_temp_file(self, tmp_path):
+        from higanvn.engine.adapters.storage import atomic_write_bytes
+        
+        target = tmp_path / "quick.json"
+        target.write_bytes(b"old")
+        atomic_write_bytes(target, b"new")
+        assert target.read_bytes() == b"new"
+        assert [p.name for p in tmp_path.iterdir()] == ["quick.json"]
+    
+    def test_atomic_write_flushes_data_before_rename(self, tmp_path, monkeypatch):
+        from higanvn.engine.adapters import storage
+        
+        events = []
+        real_fsync, real_replace = storage.os.fsync, storage.os.replace
+        monkeypatch.setattr(storage.os, "fsync", lambda fd: (events.append("fsync"), real_fsync(fd))[1])
+        monkeypatch.setattr(storage.os, "replace", lambda a, b: (events.append("replace"), real_replace(a, b))[1])
+        # even a lazily-synced write flushes the temp file before replacing the old save
+        storage.atomic_write_bytes(tmp_path / "quick.json", b"new", sync=False)
+        assert events == ["fsync", "replace"]
+        assert (tmp_path / "quick.json").read_bytes() == b"new"
+    
+    def test_payload_compact_by_default(self):
+        from higanvn.engine.adapters.storage import encode_payload
+        
+        payload = {"ip": 3, "choices": [0, 1]}
+        assert encode_payload(payload, pretty=False) == b'{"ip":3,"choices":[0,1]}'
+        assert b"\n  " in encode_payload(payload, pretty=True)
+    
+    def test_lazy_quick_sync_defers_until_sync(self, tmp_path):
+        from higanvn.engine.adapters.storage import FileSaveStore
+        
+        store = FileSaveStore(lambda: tmp_path, lazy_quick_sync=True)
+        assert store.write_quick({"ip": 1})
+        assert store.write_slot(1, {"ip": 2})
+        # only the quick save waits for the group sync
+        assert store._dirty == {tmp_path / "quick.json"}
+        store.sync()
+        assert store._dirty == set()
+        assert store.read_quick() == {"ip": 1}
@@ -80,3 +80,173 @@ def test_snapshot_roundtrip_quick(tmp_path: Path):
     assert e.quickload(sp)
     assert r._bg_path == "bg/title.jpg"
     assert r._cg_path == "cg/scene01.jpg"
+
+
+def test_store_saves_are_written_in_background(tmp_path: Path):
+    from higanvn.engine.adapters.storage import FileSaveStore
+    from higanvn.engine.events import SaveCompleteEvent
+
+    src = "> BG bg/title.jpg\n黄昏\n> SET n = 2\n> CG cg/scene01.jpg\n"
+    r = FakeRenderer()
+    e = Engine(renderer=r, save_store=FileSaveStore(lambda: tmp_path))  # type: ignore[arg-type]
+    script_path = tmp_path / "demo.vns"
+    script_path.write_text(src, encoding="utf-8")
+    e.set_script_path(script_path)
+    e.load(parse_script(src))
+    e.run_headless()
+    assert e.quicksave()
+    assert e.save_to_slot(3)
+    # readable right away, whether or not the writer has finished
+    r.reset_state()
+    assert e.quickload()
+    assert r._cg_path == "cg/scene01.jpg"
+    assert e.vars == {"n": 2}
+    done = []
+    e.event_system.subscribe(SaveCompleteEvent, lambda ev: done.append((ev.slot, ev.success)))
+    e.close()
+    # completions are reported on the engine thread
+    assert sorted(done) == [(0, True), (3, True)]
+    assert json.loads((tmp_path / "slot_03.json").read_text(encoding="utf-8"))["vars"] == {"n": 2}
+    assert (tmp_path / "quick.json").exists()
+
+
+class FailingStore:
+    """Save store whose writes fail like a full or read-only disk."""
+
+    def write_quick(self, payload: dict) -> bool:
+        raise OSError("disk full")
+
+    def read_quick(self):
+        return None
+
+    def write_slot(self, slot: int, payload: dict) -> bool:
+        raise OSError("disk full")
+
+    def read_slot(self, slot: int):
+        return None
+
+
+def test_failed_background_write_is_reported_through_status_hook(tmp_path: Path):
+    from higanvn.engine.events import SaveCompleteEvent
+
+    class HookRenderer(FakeRenderer):
+        save_status_hook = None
+
+        def set_save_status_hook(self, fn):
+            self.save_status_hook = fn
+
+    src = "黄昏\n"
+    r = HookRenderer()
+    e = Engine(renderer=r, save_store=FailingStore())  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    done = []
+    e.event_system.subscribe(SaveCompleteEvent, lambda ev: done.append((ev.slot, ev.success)))
+    # queued, so the call itself cannot know the outcome yet
+    assert e.save_to_slot(3)
+    # the single writer runs a write's done-callback before its next task
+    e._save_executor.submit(lambda: None).result()
+    assert done == []
+    # the renderer's idle loop drains the result without the script advancing
+    assert r.save_status_hook is not None
+    r.save_status_hook()
+    assert done == [(3, False)]
+    e.close()
+
+
+def test_failed_background_write_shows_failure_banner(tmp_path: Path):
+    from higanvn.engine.renderer_pygame import PygameRenderer
+
+    class BannerRenderer(FakeRenderer):
+        # the pygame renderer's subscription, without opening a window
+        _unsub_save_complete = None
+        set_event_system = PygameRenderer.set_event_system
+        _on_save_complete = PygameRenderer._on_save_complete
+
+        def __init__(self):
+            super().__init__()
+            self.banners = []
+
+        def show_banner(self, message, color=None):
+            self.banners.append(message)
+
+    r = BannerRenderer()
+    e = Engine(renderer=r, save_store=FailingStore())  # type: ignore[arg-type]
+    e.load(parse_script("黄昏\n"))
+    e.run_headless()
+    assert e.quicksave()
+    assert e.save_to_slot(2)
+    e.close()
+    assert r.banners == ["保存失败", "保存失败"]
+
+
+def test_quickload_reuses_program_until_script_changes(tmp_path: Path):
+    import os
+
+    src = "> BG bg/title.jpg\n黄昏\n"
+    r = FakeRenderer()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    script_path = tmp_path / "demo.vns"
+    script_path.write_text(src, encoding="utf-8")
+    e.set_script_path(script_path)
+    program = parse_script(src)
+    e.load(program)
+    e.run_headless()
+    sp = tmp_path / "quick.json"
+    assert e.quicksave(sp)
+    assert e.quickload(sp)
+    assert e.program is program
+    # edited script -> parsed again
+    script_path.write_text(src + "到了\n", encoding="utf-8")
+    st = os.stat(script_path)
+    os.utime(script_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert e.quickload(sp)
+    assert e.program is not program
+    assert len(e.program.ops) == 3
+
+
+def test_snapshot_quickload_skips_program_reload(tmp_path: Path):
+    from higanvn.engine.events import EngineLoadEvent
+
+    src = "> BG bg/title.jpg\n黄昏\n> CG cg/scene01.jpg\n"
+    r = FakeRenderer()
+    e = Engine(renderer=r)  # type: ignore[arg-type]
+    script_path = tmp_path / "demo.vns"
+    script_path.write_text(src, encoding="utf-8")
+    e.set_script_path(script_path)
+    e.load(parse_script(src))
+    e.run_headless()
+    sp = tmp_path / "quick.json"
+    assert e.quicksave(sp)
+    loads = []
+    e.event_system.subscribe(EngineLoadEvent, lambda ev: loads.append(ev))
+    r.reset_state()
+    assert e.quickload(sp)
+    assert loads == []
+    assert r._cg_path == "cg/scene01.jpg"
+    assert e.ip == 2
+
+
+def test_back_one_line_restores_recent_line_from_checkpoint():
+    class CountingRenderer(FakeRenderer):
+        applied = 0
+
+        def apply_snapshot(self, snap: dict) -> None:
+            self.applied += 1
+            super().apply_snapshot(snap)
+
+    src = "> BG a.jpg\n一\n> SET n = 1\n> BG b.jpg\n二\n> SET n = 2\n三\n"
+    r = CountingRenderer()
+    e = Engine(renderer=r, interactive=True)  # type: ignore[arg-type]
+    e.load(parse_script(src))
+    e.run_headless()
+    assert list(e.line_ip_trace) == [1, 4, 6]
+    assert e.back_one_line()
+    # restored from the snapshot taken before line "二", not replayed from the start
+    assert r.applied == 1
+    assert (e.ip, e.vars, r._bg_path) == (4, {"n": 1}, "b.jpg")
+    assert list(e.line_ip_trace) == [1]
+    # running on re-shows "二" and continues normally
+    e.run_headless()
+    assert list(e.line_ip_trace) == [1, 4, 6]
+    assert e.vars == {"n": 2}
@@ -104,6 +104,75 @@ class TestEventBus:
         assert len(received) == 1
         assert received[0]["value"] == 42
     
+    def test_listeners_share_one_payload_per_emit(self):
+        """Test every listener of an emit gets the same payload dict."""
+        from higanvn.engine.event_bus import EventBus
+        
+        bus = EventBus()
+        received = []
+        bus.subscribe("test", received.append)
+        bus.subscribe("test", lambda d: received.append(d))
+        bus.emit("test", value=1)
+        bus.emit("test", value=2)
+        
+        assert received[0] is received[1]
+        assert received[2] is not received[0]
+        assert received[2] == {"value": 2}
+    
+    def test_unsubscribe_during_emit(self):
+        """Test listeners removed or added mid-emit take effect on the next emit."""
+        from higanvn.engine.event_bus import EventBus
+        
+        bus = EventBus()
+        calls = []
+        
+        def first(data):
+            calls.append("first")
+            unsub_first()
+            bus.unsubscribe("test", second)
+            bus.subscribe("test", third)
+        
+        def second(data):
+            calls.append("second")
+        
+        def third(data):
+            calls.append("third")
+        
+        unsub_first = bus.subscribe("test", first)
+        bus.subscribe("test", second)
+        bus.emit("test")
+        assert calls == ["first", "second"]
+        assert bus.listener_count("test") == 1
+        bus.emit("test")
+        assert calls == ["first", "second", "third"]
+    
+    def test_weak_method_listener(self):
+        """Test weak bound-method listeners go away with their owner."""
+        import gc
+        from higanvn.engine.event_bus import EventBus
+        
+        class Widget:
+            def __init__(self):
+                self.seen = []
+            
+            def on_test(self, data):
+                self.seen.append(data["v"])
+        
+        bus = EventBus()
+        widget = Widget()
+        bus.subscribe("test", widget.on_test, weak=True)
+        bus.emit("test", v=1)
+        assert widget.seen == [1]
+        # the bound method is still the unsubscribe key
+        bus.unsubscribe("test", widget.on_test)
+        assert bus.listener_count("test") == 0
+        
+        bus.subscribe("test", widget.on_test, weak=True)
+        del widget
+        gc.collect()
+        assert bus.listener_count("test") == 0
+        bus.emit("test", v=2)
+    
     def test_unsubscribe_via_return(self):
         """Test unsubscribe via returned function."""
         from higanvn.engine.event_bus import EventBus